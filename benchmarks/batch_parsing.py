@@ -0,0 +1,48 @@
+"""
+Benchmarks parsing many generated documents one at a time
+against parsing them in parallel with a process pool.
+Usage::
+
+    python benchmarks/batch_parsing.py [-d DOCUMENTS] [-s SECTIONS] [-w WORKERS]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from parsing import generate_document
+
+from paxter.syntax import ParsingTask, parse_many, warm_up
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-d', '--documents', type=int, default=400)
+    parser.add_argument('-s', '--sections', type=int, default=50)
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    warm_up()
+    src_texts = [
+        generate_document(args.sections) + f'@doc{{{index}}}'
+        for index in range(args.documents)
+    ]
+    print(f"{args.documents} documents of {len(src_texts[0])} chars each")
+
+    start = time.perf_counter()
+    for src_text in src_texts:
+        ParsingTask(src_text).parse()
+    sequential = time.perf_counter() - start
+    print(f"{'sequential':>16}: {sequential * 1000:8.1f} ms")
+
+    for label, flat in [('', False), (', flat', True)]:
+        start = time.perf_counter()
+        parse_many(src_texts, workers=args.workers, flat=flat)
+        parallel = time.perf_counter() - start
+        print(f"{f'{args.workers} workers{label}':>16}: {parallel * 1000:8.1f} ms "
+              f"({sequential / parallel:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmarks rendering the same parsed document many times
+with the generic renderer against rendering its compiled tree.
+Usage::
+
+    python benchmarks/compiled_interp.py [-n REPEAT] [-s SECTIONS]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from parsing import generate_document
+
+from paxter.interp import CompiledTree, InterpretingTask
+from paxter.quickauthor import create_document_env
+from paxter.syntax import ParsingTask
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=50)
+    parser.add_argument('-s', '--sections', type=int, default=200)
+    args = parser.parse_args()
+
+    src_text = generate_document(args.sections)
+    parsed_tree = ParsingTask(src_text).parse()
+    print(f"{len(src_text)} characters, rendered {args.repeat} times")
+
+    def interp_generic():
+        return InterpretingTask(src_text, create_document_env(), parsed_tree).interp()
+
+    compile_time = timeit.timeit(lambda: CompiledTree(src_text, parsed_tree), number=1)
+    compiled_tree = CompiledTree(src_text, parsed_tree)
+
+    def interp_compiled():
+        return compiled_tree.interp(create_document_env())
+
+    assert interp_generic() == interp_compiled()
+    for label, func in [('InterpretingTask', interp_generic), ('CompiledTree', interp_compiled)]:
+        elapsed = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+        print(f"{label:>16}: {elapsed * 1000:8.2f} ms per render")
+    print(f"{'compilation':>16}: {compile_time * 1000:8.2f} ms once")
+
+
+if __name__ == '__main__':
+    main()
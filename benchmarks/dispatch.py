@@ -0,0 +1,69 @@
+"""
+Benchmarks node dispatch of the renderer on a node-heavy document
+against the former chain of isinstance checks.
+Usage::
+
+    python benchmarks/dispatch.py [-n REPEAT] [-c COMMANDS]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from paxter.interp import InterpretingTask
+from paxter.quickauthor import create_simple_env
+from paxter.syntax import (
+    Command, Fragment, FragmentSeq, Identifier, Number, Operator, ParsingTask, Text, TokenSeq,
+)
+
+COMMAND_TEMPLATE = '@f[{index}, 2.5, {{a @g b}}, "x"]{{c @g{{d}} e}} '
+
+
+class LadderInterpretingTask(InterpretingTask):
+    """
+    Renderer dispatching nodes through isinstance checks
+    just like before the introduction of the dispatch registry.
+    """
+
+    def transform_token(self, token):
+        if isinstance(token, Fragment):
+            return self.transform_fragment(token)
+        if isinstance(token, TokenSeq):
+            return self.transform_token_list(token)
+        if isinstance(token, Identifier):
+            return self.transform_identifier(token)
+        if isinstance(token, Operator):
+            return self.transform_operator(token)
+        if isinstance(token, Number):
+            return self.transform_number(token)
+        if isinstance(token, FragmentSeq):
+            return self.transform_fragment_list(token)
+        return self.transform_unrecognized_token(token)
+
+    def transform_fragment(self, fragment):
+        if isinstance(fragment, Text):
+            return self.transform_text(fragment)
+        if isinstance(fragment, Command):
+            return self.transform_command(fragment)
+        return self.transform_unrecognized_fragment(fragment)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=20)
+    parser.add_argument('-c', '--commands', type=int, default=5000)
+    args = parser.parse_args()
+
+    src_text = ''.join(COMMAND_TEMPLATE.format(index=i) for i in range(args.commands))
+    parsed_tree = ParsingTask(src_text).parse()
+    env = create_simple_env({'f': lambda *args: None, 'g': lambda *args: None})
+    print(f"{args.commands} commands, rendered {args.repeat} times")
+
+    for task_cls in [LadderInterpretingTask, InterpretingTask]:
+        task = task_cls(src_text, env, parsed_tree)
+        elapsed = min(timeit.repeat(task.interp, number=args.repeat, repeat=3)) / args.repeat
+        print(f"{task_cls.__name__:>22}: {elapsed * 1000:8.2f} ms per render")
+
+
+if __name__ == '__main__':
+    main()
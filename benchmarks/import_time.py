@@ -0,0 +1,58 @@
+"""
+Benchmarks cold-import time of Paxter modules.
+
+Each measurement spawns a fresh Python interpreter
+so that nothing is shared between runs except for the bytecode cache.
+Usage::
+
+    python benchmarks/import_time.py [-n REPEAT] [MODULE ...]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = ['paxter.syntax.charset', 'paxter.syntax', 'paxter.quickauthor']
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+MEASURE_SNIPPET = """\
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import(module: str) -> float:
+    """
+    Measures the import time (in seconds) of the given module
+    inside a brand new interpreter process.
+    """
+    env = {**os.environ, 'PYTHONPATH': SRC_DIR}
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE_SNIPPET.format(module=module)],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        measure_import(module)  # warm up bytecode cache
+        timings = [measure_import(module) for _ in range(args.repeat)]
+        print(f"{module:<30} "
+              f"min {min(timings) * 1000:8.1f} ms  "
+              f"median {statistics.median(timings) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmarks construction and matching performance of the lexer patterns
+built from per-code-point character classes (the former approach)
+against those built from range-compressed character classes.
+Usage::
+
+    python benchmarks/lexer_patterns.py [-n REPEAT]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+from functools import partial
+
+from paxter.syntax.charset import (
+    ID_CONT_RANGES, ID_START_RANGES, OP_RANGES, SYMBOL_RANGES, char_class, chars_from_ranges,
+)
+
+SAMPLE_TEXT = ' '.join([
+    'hello_world', 'Ünïcödé', 'ตัวแปร', '変数名', 'x1', '+=', '<=>', '→', '¬', '...',
+] * 1000)
+
+
+def per_code_point_class(ranges) -> str:
+    return f'[{re.escape(chars_from_ranges(ranges))}]'
+
+
+def build_patterns(to_class) -> dict[str, str]:
+    return {
+        'id_re': rf'(?P<id>{to_class(ID_START_RANGES)}{to_class(ID_CONT_RANGES)}*)',
+        'symbol_re': rf'(?P<symbol>{to_class(SYMBOL_RANGES)})',
+        'op_re': rf'(?P<op>[,;]|{to_class(OP_RANGES)}+)',
+    }
+
+
+def compile_all(patterns: dict[str, str]) -> dict[str, re.Pattern]:
+    re.purge()
+    return {name: re.compile(pattern) for name, pattern in patterns.items()}
+
+
+def scan(compiled: re.Pattern, text: str) -> int:
+    count = 0
+    pos = 0
+    end = len(text)
+    while pos < end:
+        matchobj = compiled.match(text, pos)
+        if matchobj and matchobj.end() > pos:
+            count += 1
+            pos = matchobj.end()
+        else:
+            pos += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    variants = {
+        'per code point': build_patterns(per_code_point_class),
+        'ranges': build_patterns(char_class),
+    }
+    for label, patterns in variants.items():
+        source_size = sum(len(pattern) for pattern in patterns.values())
+        compile_time = min(timeit.repeat(
+            partial(compile_all, patterns), number=1, repeat=args.repeat,
+        ))
+        compiled = compile_all(patterns)
+        print(f"[{label}] source {source_size} chars, compile {compile_time * 1000:.1f} ms")
+        for name in ['id_re', 'op_re']:
+            match_time = min(timeit.repeat(
+                partial(scan, compiled[name], SAMPLE_TEXT), number=1, repeat=args.repeat,
+            ))
+            print(f"    {name} scan of {len(SAMPLE_TEXT)} chars: {match_time * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmarks loading many pre-parsed documents from binary tree files
+either fully into node objects or as memory-mapped lazy views.
+Usage::
+
+    python benchmarks/mapped_trees.py [-d DOCUMENTS] [-s SECTIONS]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from functools import partial
+
+from parsing import generate_document
+from tree_memory import measure_retained
+
+from paxter.syntax import MappedTree, ParsingTask, binary
+
+
+def load_all(paths: list[str]) -> list:
+    """
+    Fully loads all parsed trees into node objects.
+    """
+    trees = []
+    for path in paths:
+        with open(path, 'rb') as fobj:
+            trees.append(binary.load(fobj))
+    return trees
+
+
+def open_all(paths: list[str]) -> list[MappedTree]:
+    """
+    Memory-maps all parsed trees.
+    """
+    return [MappedTree.open(path) for path in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-d', '--documents', type=int, default=2000)
+    parser.add_argument('-s', '--sections', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for doc_index in range(args.documents):
+            path = os.path.join(temp_dir, f'{doc_index}.pxtree')
+            src_text = generate_document(args.sections) + f'@doc{{{doc_index}}}'
+            with open(path, 'wb') as fobj:
+                binary.dump(ParsingTask(src_text).parse(), fobj)
+            paths.append(path)
+        total_size = sum(os.path.getsize(path) for path in paths)
+        print(f"{args.documents} documents, {total_size / 2 ** 20:.1f} MiB of tree files")
+
+        for label, func in [('binary.load', load_all), ('MappedTree.open', open_all)]:
+            start = time.perf_counter()
+            result = func(paths)
+            elapsed = time.perf_counter() - start
+            del result
+            result, retained = measure_retained(partial(func, paths))
+            print(f"{label:>16}: {elapsed * 1000:8.1f} ms, "
+                  f"retained {retained / 2 ** 20:6.1f} MiB")
+            if label == 'MappedTree.open':
+                for mapped_tree in result:
+                    mapped_tree.close()
+            del result
+
+
+if __name__ == '__main__':
+    main()
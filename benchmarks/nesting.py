@@ -0,0 +1,55 @@
+"""
+Stress-benchmarks the recursive parser against the iterative parser
+on deeply nested documents.
+Usage::
+
+    python benchmarks/nesting.py [-n REPEAT] [DEPTH ...]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from functools import partial
+
+from paxter.syntax import IterativeParsingTask, ParsingTask, warm_up
+
+DEFAULT_DEPTHS = [10, 100, 1000, 10000, 100000]
+
+
+def generate_nested_document(depth: int) -> str:
+    """
+    Generates a document nesting the main argument and the options sections
+    of commands alternately up to the given depth.
+    """
+    opening = ''.join('@a{' if i % 2 == 0 else '@b[x, ' for i in range(depth))
+    closing = ''.join('}' if i % 2 == 0 else ']' for i in reversed(range(depth)))
+    return opening + 'text' + closing
+
+
+def measure(task_cls: type[ParsingTask], src_text: str, repeat: int) -> str:
+    try:
+        elapsed = min(timeit.repeat(
+            partial(task_cls(src_text).parse), number=1, repeat=repeat,
+        ))
+    except RecursionError:
+        return 'RecursionError'
+    return f'{elapsed * 1000:.2f} ms'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=3)
+    parser.add_argument('depths', type=int, nargs='*', default=DEFAULT_DEPTHS)
+    args = parser.parse_args()
+
+    warm_up()
+    print(f"{'depth':>8} {'recursive':>16} {'iterative':>16}")
+    for depth in args.depths:
+        src_text = generate_nested_document(depth)
+        recursive = measure(ParsingTask, src_text, args.repeat)
+        iterative = measure(IterativeParsingTask, src_text, args.repeat)
+        print(f"{depth:>8} {recursive:>16} {iterative:>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmarks parsing performance of Paxter source text
+on a large generated document.
+Usage::
+
+    python benchmarks/parsing.py [-n REPEAT] [-s SECTIONS]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections import deque
+from functools import partial
+
+from paxter.syntax import EnclosingPattern, EventParsingTask, ParsingTask, binary, warm_up
+
+SECTION_TEMPLATE = """\
+@h2{{Section {index}}}
+
+Lorem ipsum dolor sit amet, @bold{{consectetur}} adipiscing elit,
+sed do eiusmod tempor @italic{{incididunt ut labore}} et dolore magna aliqua.
+Ut enim ad minim veniam, quis nostrud @link["https://example.com/{index}"]{{exercitation}}
+ullamco laboris nisi ut aliquip ex ea commodo consequat.
+
+@numbered_list[
+    {{First item with @code{{inline code}}}},
+    {{Second item with @italic{{nested @bold{{emphasis}}}}}},
+    {{Third item}},
+]
+
+@blockquote##{{Duis aute irure dolor in }} reprehenderit in voluptate}}##
+
+@python##"
+    total_{index} = sum(range({index}))
+"##
+"""
+
+
+def generate_document(sections: int) -> str:
+    """
+    Generates a synthetic document of the given number of sections.
+    """
+    return '\n'.join(SECTION_TEMPLATE.format(index=i) for i in range(sections))
+
+
+def scan_with_regex(src_text: str, enclosing: EnclosingPattern) -> int:
+    """
+    Scans through the text from break to break using the per-enclosing regex.
+    """
+    count = 0
+    pos = 0
+    while matchobj := enclosing.rec_break_re.match(src_text, pos):
+        count += 1
+        pos = matchobj.end()
+    return count
+
+
+def scan_with_find(src_text: str, enclosing: EnclosingPattern) -> int:
+    """
+    Scans through the text from break to break using the shared scanning engine.
+    """
+    count = 0
+    pos = 0
+    while found := enclosing.find_rec_break(src_text, pos):
+        count += 1
+        pos = found[0] + len(found[1])
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    parser.add_argument('-s', '--sections', type=int, default=2000)
+    args = parser.parse_args()
+
+    warm_up()
+    src_text = generate_document(args.sections)
+    print(f"document of {len(src_text)} chars")
+
+    parse_time = min(timeit.repeat(
+        partial(ParsingTask(src_text).parse), number=1, repeat=args.repeat,
+    ))
+    print(f"ParsingTask.parse: {parse_time * 1000:.1f} ms")
+
+    events_time = min(timeit.repeat(
+        lambda: deque(EventParsingTask(src_text).iter_events(), maxlen=0),
+        number=1, repeat=args.repeat,
+    ))
+    print(f"EventParsingTask.iter_events: {events_time * 1000:.1f} ms")
+
+    data = binary.dumps(ParsingTask(src_text).parse())
+    load_time = min(timeit.repeat(
+        partial(binary.loads, data), number=1, repeat=args.repeat,
+    ))
+    print(f"binary.loads ({len(data)} bytes): {load_time * 1000:.1f} ms")
+
+    decode_time = min(timeit.repeat(
+        partial(binary.decode, data), number=1, repeat=args.repeat,
+    ))
+    print(f"binary.decode: {decode_time * 1000:.2f} ms")
+
+    enclosing = EnclosingPattern(left='##{')
+    scan_text = src_text + '}##'
+    for label, scan in [('regex', scan_with_regex), ('find', scan_with_find)]:
+        scan_time = min(timeit.repeat(
+            partial(scan, scan_text, enclosing), number=1, repeat=args.repeat,
+        ))
+        print(f"break scanning ({label}): {scan_time * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
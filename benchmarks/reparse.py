@@ -0,0 +1,62 @@
+"""
+Benchmarks incremental re-parsing against parsing from scratch
+for a single-character edit at different places of generated documents
+of increasing sizes.
+Usage::
+
+    python benchmarks/reparse.py [-n REPEAT] [SECTIONS ...]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from functools import partial
+
+from parsing import generate_document
+
+from paxter.syntax import ParsingTask, TextEdit, warm_up
+
+DEFAULT_SECTIONS = [10, 100, 1000, 10000]
+
+#: Relative positions within the document of the edits
+EDIT_PLACES = {'start': 0.0, 'middle': 0.5, 'end': 1.0}
+
+
+def make_edit(src_text: str, place: float) -> TextEdit:
+    """
+    Creates the edit inserting a character into the plain text
+    of the section nearest to the given relative position.
+    """
+    offset = src_text.find('Lorem', int(place * len(src_text)))
+    if offset < 0:
+        offset = src_text.rfind('Lorem')
+    return TextEdit(offset, 0, 'x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    parser.add_argument('sections', type=int, nargs='*', default=DEFAULT_SECTIONS)
+    args = parser.parse_args()
+
+    warm_up()
+    for sections in args.sections:
+        src_text = generate_document(sections)
+        prev_tree = ParsingTask(src_text).parse()
+        results = []
+        for label, place in EDIT_PLACES.items():
+            edit = make_edit(src_text, place)
+            task = ParsingTask(edit.apply(src_text))
+            elapsed = min(timeit.repeat(
+                partial(task.reparse, prev_tree, edit), number=1, repeat=args.repeat,
+            ))
+            results.append(f"{label} {elapsed * 1000:.3f} ms")
+        parse_time = min(timeit.repeat(
+            partial(ParsingTask(src_text).parse), number=1, repeat=args.repeat,
+        ))
+        results.append(f"full parse {parse_time * 1000:.1f} ms")
+        print(f"{len(src_text):>9} chars: " + ', '.join(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmarks time and peak memory of parsing a large generated document
+as a whole versus from a text stream in chunks.
+Usage::
+
+    python benchmarks/streaming.py [-s SECTIONS] [-c CHUNK_SIZE]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import tracemalloc
+from functools import partial
+
+from parsing import SECTION_TEMPLATE
+
+from paxter.syntax import ParsingTask, StreamingParsingTask, warm_up
+
+
+class GeneratedStream(io.TextIOBase):
+    """
+    Text stream which generates the document section by section
+    so that the entire source text is never held in memory.
+    """
+
+    def __init__(self, sections: int):
+        self.sections = iter(range(sections))
+        self.pending = ''
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        if size < 0:
+            data = self.pending + ''.join(map(self.generate_section, self.sections))
+            self.pending = ''
+            return data
+        while len(self.pending) < size:
+            index = next(self.sections, None)
+            if index is None:
+                break
+            self.pending += self.generate_section(index)
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    @staticmethod
+    def generate_section(index: int) -> str:
+        return SECTION_TEMPLATE.format(index=index) + '\n'
+
+
+def measure(func) -> tuple[float, int]:
+    """
+    Returns the elapsed time and the peak traced memory of the function call
+    (measured in separate runs since tracing slows down the execution).
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def parse_whole(sections: int):
+    ParsingTask(GeneratedStream(sections).read()).parse()
+
+
+def parse_streaming(sections: int, chunk_size: int):
+    for _ in StreamingParsingTask(GeneratedStream(sections), chunk_size).iter_fragments():
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-s', '--sections', type=int, default=2000)
+    parser.add_argument('-c', '--chunk-size', type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    warm_up()
+    elapsed, peak = measure(partial(parse_whole, args.sections))
+    print(f"ParsingTask.parse: {elapsed * 1000:.1f} ms, peak {peak / 2 ** 20:.1f} MiB")
+    elapsed, peak = measure(partial(parse_streaming, args.sections, args.chunk_size))
+    print(f"StreamingParsingTask.iter_fragments: {elapsed * 1000:.1f} ms, "
+          f"peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmarks memory retained by the parsed tree of a large generated document
+in the node object (with or without lazy texts) and the columnar representations.
+Usage::
+
+    python benchmarks/tree_memory.py [-s SECTIONS]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from parsing import generate_document
+
+from paxter.syntax import Command, FragmentSeq, ParsingTask, TokenSeq, warm_up
+
+
+def count_nodes(tree: FragmentSeq) -> int:
+    """
+    Counts all nodes within the parsed tree.
+    """
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if isinstance(node, (FragmentSeq, TokenSeq)):
+            stack.extend(node.children)
+        elif isinstance(node, Command):
+            stack.extend(child for child in (node.options, node.main_arg) if child is not None)
+    return count
+
+
+def measure_retained(func):
+    """
+    Returns the result of the function call
+    and the memory size retained by the result.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-s', '--sections', type=int, default=2000)
+    args = parser.parse_args()
+
+    warm_up()
+    src_text = generate_document(args.sections)
+    ParsingTask(src_text).parse()  # populates lexer caches
+
+    tree, retained = measure_retained(ParsingTask(src_text).parse)
+    node_count = count_nodes(tree)
+    print(f"document of {len(src_text)} chars, {node_count} nodes")
+    print(f"retained by parsed tree: {retained / 2 ** 20:.1f} MiB "
+          f"({retained / node_count:.0f} bytes per node)")
+
+    del tree
+    _, retained = measure_retained(ParsingTask(src_text, lazy_texts=True).parse)
+    print(f"retained by parsed tree with lazy texts: {retained / 2 ** 20:.1f} MiB "
+          f"({retained / node_count:.0f} bytes per node)")
+
+    _, retained = measure_retained(ParsingTask(src_text).parse_flat)
+    print(f"retained by flat tree: {retained / 2 ** 20:.1f} MiB "
+          f"({retained / node_count:.0f} bytes per node)")
+
+
+if __name__ == '__main__':
+    main()
@@ -27,32 +27,72 @@ def input_output_options(func):
     return func
 
 
+def cache_dir_option(func):
+    return click.option(
+        '-c', '--cache-dir',
+        type=click.Path(file_okay=False),
+        help="Path to directory caching parsed trees of input texts.",
+    )(func)
+
+
 @program.command(name='syntax')
 @input_output_options
-def run_parse(input_file, output_file):
+@click.option('--stream', is_flag=True,
+              help="Writes each global-level fragment as soon as it is parsed.")
+def run_parse(input_file, output_file, stream):
     """
     Parses the input text into Paxter parsed tree.
 
     It reads input text from INPUT_FILE
     and writes the parsed tree to OUTPUT_FILE.
+    With --stream, the input is read in chunks
+    and each global-level fragment is written on its own line instead.
 
     Transform: input text -> parsed tree
     """
-    from paxter.syntax import parse
+    from paxter.syntax import ParsingTask, StreamingParsingTask
+
+    if stream:
+        for fragment in StreamingParsingTask(input_file).iter_fragments():
+            output_file.write(repr(fragment))
+            output_file.write("\n")
+        return
 
     src_text = input_file.read()
-    parsed_tree = parse(src_text)
+    parsed_tree = ParsingTask(src_text).parse()
 
     output_file.write(repr(parsed_tree))
     output_file.write("\n")
 
 
+@program.command(name='check')
+@input_output_options
+def run_check(input_file, output_file):
+    """
+    Reports all syntax errors within the input text.
+
+    It reads input text from INPUT_FILE
+    and writes each syntax error on its own line to OUTPUT_FILE.
+    The exit status is non-zero if any syntax error is found.
+    """
+    from paxter.syntax import RecoveringParsingTask
+
+    task = RecoveringParsingTask(input_file.read())
+    task.parse()
+    for error in task.diagnostics:
+        output_file.write(error.message)
+        output_file.write("\n")
+    if task.diagnostics:
+        raise SystemExit(1)
+
+
 @program.command(name='document')
 @input_output_options
 @click.option('-e', '--env-file',
               type=click.Path(exists=True, dir_okay=False, readable=True),
               help="Path to python file to extract the environment.")
-def run_document(input_file, output_file, env_file):
+@cache_dir_option
+def run_document(input_file, output_file, env_file, cache_dir):
     """
     Evaluates the input text into the document object.
 
@@ -66,10 +106,12 @@ def run_document(input_file, output_file, env_file):
     """
     import runpy
     from paxter.quickauthor import run_document_paxter, create_document_env
+    from paxter.syntax import ParseCache
 
     src_text = input_file.read()
     env = create_document_env(runpy.run_path(env_file) if env_file else {})
-    document = run_document_paxter(src_text, env)
+    parse_cache = ParseCache(cache_dir) if cache_dir else None
+    document = run_document_paxter(src_text, env, parse_cache)
 
     output_file.write(repr(document))
     output_file.write("\n")
@@ -80,7 +122,8 @@ def run_document(input_file, output_file, env_file):
 @click.option('-e', '--env-file',
               type=click.Path(exists=True, dir_okay=False, readable=True),
               help="Path to python file to extract the environment.")
-def run_html(input_file, output_file, env_file):
+@cache_dir_option
+def run_html(input_file, output_file, env_file, cache_dir):
     """
     Parses, evaluates, and renders the final HTML output.
 
@@ -95,14 +138,133 @@ def run_html(input_file, output_file, env_file):
     """
     import runpy
     from paxter.quickauthor import run_document_paxter, create_document_env
+    from paxter.syntax import ParseCache
 
     src_text = input_file.read()
     env = create_document_env(runpy.run_path(env_file) if env_file else {})
-    document = run_document_paxter(src_text, env)
+    parse_cache = ParseCache(cache_dir) if cache_dir else None
+    document = run_document_paxter(src_text, env, parse_cache)
 
     output_file.write(document.html())
     output_file.write("\n")
 
 
+@program.command(name='build')
+@click.argument('src_dir', type=click.Path(exists=True, file_okay=False))
+@click.argument('out_dir', type=click.Path(file_okay=False))
+@click.option('-e', '--env-file',
+              type=click.Path(exists=True, dir_okay=False, readable=True),
+              help="Path to python file to extract the environment.")
+@cache_dir_option
+@click.option('-j', '--workers', type=int,
+              help="Number of worker processes (defaults to the number of CPUs).")
+@click.option('-f', '--force', is_flag=True,
+              help="Rebuilds all files even if their outputs are up-to-date.")
+@click.option('-w', '--watch', is_flag=True,
+              help="Keeps running and rebuilds files as soon as they are modified.")
+@click.option('--interval', type=float, default=0.5, show_default=True,
+              help="Number of seconds between polls for modified files in watch mode.")
+def run_build(src_dir, out_dir, env_file, cache_dir, workers, force, watch, interval):
+    """
+    Renders all Paxter files under a directory into HTML files.
+
+    It discovers every .paxter file under SRC_DIR
+    and renders each of them (just like the html command)
+    into the .html file at the same relative path under OUT_DIR,
+    using a pool of worker processes.
+    Files whose outputs are newer than the sources
+    and the environment file are skipped.
+    With --watch, the command keeps running (until interrupted)
+    and renders again every source file which is modified afterwards.
+    """
+    import time
+    from paxter.quickauthor import build_site, watch_site
+
+    if watch:
+        rounds = watch_site(src_dir, out_dir, env_file, cache_dir, workers, force, interval)
+        try:
+            start = time.perf_counter()
+            _echo_build_results(next(rounds), time.perf_counter() - start)
+            for results in rounds:
+                # Files are rebuilt one after another within this process
+                _echo_build_results(results, sum(result.elapsed for result in results))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    start = time.perf_counter()
+    results = build_site(src_dir, out_dir, env_file, cache_dir, workers, force)
+    if _echo_build_results(results, time.perf_counter() - start):
+        raise SystemExit(1)
+
+
+@program.command(name='serve')
+@click.option('-H', '--host', default='127.0.0.1', show_default=True,
+              help="Host address to listen on.")
+@click.option('-p', '--port', type=int, default=8000, show_default=True,
+              help="Port number to listen on.")
+@click.option('-s', '--socket', 'socket_path', type=click.Path(dir_okay=False),
+              help="Path to Unix domain socket to listen on instead of host and port.")
+@click.option('-e', '--env-file',
+              type=click.Path(exists=True, dir_okay=False, readable=True),
+              help="Path to python file to extract the default environment.")
+@click.option('--env', 'named_env_files', multiple=True, metavar='NAME=PATH',
+              help="Named environment extracted from python file (can be repeated).")
+@cache_dir_option
+def run_serve(host, port, socket_path, env_file, named_env_files, cache_dir):
+    """
+    Runs the local HTTP server rendering HTML.
+
+    Each request sends the input text as the body of POST /render?env=NAME
+    (with the application/x-paxter content type)
+    and receives the rendered HTML output (just like the html command).
+    All environments are loaded once at startup and kept resident.
+    Requests from web browsers are rejected, but any local user may connect
+    to the TCP port, so prefer a Unix domain socket (--socket) where available.
+    """
+    from paxter.quickauthor.server import DEFAULT_ENV_NAME, RenderServer, UnixRenderServer
+    from paxter.syntax import ParseCache
+
+    env_files = {DEFAULT_ENV_NAME: env_file}
+    for named_env_file in named_env_files:
+        name, sep, path = named_env_file.partition('=')
+        if not sep:
+            raise click.BadParameter(f"expected NAME=PATH: {named_env_file}", param_hint='--env')
+        env_files[name] = path
+    parse_cache = ParseCache(cache_dir) if cache_dir else None
+
+    if socket_path is not None:
+        server = UnixRenderServer(socket_path, env_files, parse_cache)
+        click.echo(f"serving on unix socket {socket_path} at /render")
+    else:
+        server = RenderServer((host, port), env_files, parse_cache)
+        click.echo(f"serving on http://{host}:{server.server_address[1]}/render")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _echo_build_results(results, elapsed: float) -> int:
+    """
+    Reports the results of building files and returns the number of failures.
+    """
+    failed = 0
+    for result in results:
+        if result.skipped:
+            click.echo(f"{'skipped':>10}  {result.src_path}")
+        elif result.error is not None:
+            failed += 1
+            click.echo(f"{'failed':>10}  {result.src_path}: {result.error}", err=True)
+        else:
+            click.echo(f"{result.elapsed * 1000:7.1f} ms  {result.src_path}")
+    built = sum(1 for result in results if not result.skipped) - failed
+    click.echo(f"built {built}, skipped {len(results) - built - failed}, "
+               f"failed {failed} in {elapsed * 1000:.1f} ms")
+    return failed
+
+
 if __name__ == '__main__':
     program()
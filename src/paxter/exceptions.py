@@ -30,6 +30,11 @@ class PaxterBaseException(Exception):
         self.message = self.render(message, self.positions)
         self.args = (self.message,)  # this will make error stack more readable
 
+    def __reduce__(self):
+        # Pickles the rendered message (which may no longer be a valid template)
+        # so that errors can be sent across processes
+        return _restore_exception, (type(self), self.message, self.positions)
+
     @staticmethod
     def render(message: str, positions: dict[str, CharLoc]) -> str:
         """
@@ -42,6 +47,16 @@ class PaxterBaseException(Exception):
         }
 
 
+def _restore_exception(
+        cls: type[PaxterBaseException], message: str, positions: dict[str, CharLoc],
+) -> PaxterBaseException:
+    exc = cls.__new__(cls)
+    exc.positions = positions
+    exc.message = message
+    exc.args = (message,)
+    return exc
+
+
 class PaxterConfigError(PaxterBaseException):
     """
     Exception for configuration error.
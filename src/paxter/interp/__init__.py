@@ -4,13 +4,16 @@ parsed tree evaluation for Paxter language.
 """
 from __future__ import annotations
 
+from paxter.interp.compiled import CompiledInterpretingTask, CompiledTree
 from paxter.interp.data import FragmentList
+from paxter.interp.scope import BindingScope, Scope
 from paxter.interp.task import InterpretingTask
 from paxter.interp.wrappers import (
     BaseApply, DirectApply, NormalApply, NormalApplyWithEnv,
 )
 
 __all__ = [
-    'InterpretingTask', 'FragmentList',
+    'InterpretingTask', 'FragmentList', 'CompiledTree', 'CompiledInterpretingTask',
+    'Scope', 'BindingScope',
     'BaseApply', 'DirectApply', 'NormalApply', 'NormalApplyWithEnv',
 ]
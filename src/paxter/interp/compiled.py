@@ -0,0 +1,254 @@
+"""
+Compiled variant of the renderer which lowers a parsed document tree
+into a tree of Python closures once and then renders it repeatedly.
+"""
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from paxter.exceptions import PaxterRenderError
+from paxter.interp.data import FragmentList
+from paxter.interp.task import InterpretingTask
+from paxter.interp.wrappers import BaseApply, NormalApply, NormalApplyWithEnv
+from paxter.syntax import (
+    CharLoc, Command, Fragment, FragmentSeq, LineIndex, Number, Text, Token, TokenSeq,
+)
+
+__all__ = ['CompiledTree', 'CompiledInterpretingTask']
+
+#: Compiled operation which transforms a single node given the rendering task
+Op = Callable[['CompiledInterpretingTask'], Any]
+
+
+@dataclass
+class CompiledTree:
+    """
+    Parsed document tree lowered into reusable closures (one per node)
+    so that the same document can be rendered many times
+    with different environment dictionaries::
+
+        compiled_tree = CompiledTree(src_text, parsed_tree)
+        for env in envs:
+            rendered_output = compiled_tree.interp(env)
+
+    Node type dispatch, text processing, and the arrangement of
+    positional and keyword arguments of commands (see :class:`NormalApply`)
+    are performed once upon compilation instead of once per rendering.
+    The rendered output is identical to that of :class:`InterpretingTask`.
+
+    Nodes are recognized by their identity, so the parsed tree should consist
+    of materialized nodes; lazy views such as those of
+    :class:`MappedTree <paxter.syntax.MappedTree>` still render correctly
+    but nodes handed out again by views are transformed without compilation.
+    """
+    #: Document source text
+    src_text: str
+
+    #: Parsed document tree
+    tree: FragmentSeq
+
+    #: Pair of node and its compiled operation keyed by the node identity
+    ops: dict[int, tuple[Token, Op]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.ops = {}
+        self._compile(self.tree)
+
+    @functools.cached_property
+    def line_index(self) -> LineIndex:
+        """
+        Line index of the source text for error reporting,
+        which is built upon first use and shared by all renderings.
+        """
+        return LineIndex(self.src_text)
+
+    def _charloc(self, pos: int) -> CharLoc:
+        """
+        Converts the index of a position within the source text
+        into the line and column values for error reporting
+        (such as those raised by :meth:`NormalApply.arrange_args` upon compilation).
+        """
+        return CharLoc(self.src_text, pos, self.line_index)
+
+    def interp(self, env: dict) -> FragmentList:
+        """
+        Renders the compiled tree into the final output (which is a fragment list)
+        using the given interp environment dictionary.
+        """
+        return CompiledInterpretingTask(self.src_text, env, self.tree, self).interp()
+
+    def _compile(self, token: Token) -> Op:
+        """
+        Compiles the given node (and its descendants) into an operation.
+        Nodes which always fail to render (such as identifiers)
+        are left to the generic renderer and are not recorded in :attr:`ops`.
+        """
+        if isinstance(token, Text):
+            op = self._compile_text(token)
+        elif isinstance(token, Command):
+            op = self._compile_command(token)
+        elif isinstance(token, Number):
+            value = token.value
+            op = lambda task: value  # noqa: E731
+        elif isinstance(token, FragmentSeq):
+            op = self._compile_fragment_seq(token)
+        else:
+            if isinstance(token, TokenSeq):
+                for child in token.children:
+                    self._compile(child)
+            return lambda task: task.transform_token(token)
+        self.ops[id(token)] = (token, op)
+        return op
+
+    def lookup(self, token: Token) -> Optional[Op]:
+        """
+        Returns the compiled operation of the given node
+        or :const:`None` if the node is not part of the compiled tree.
+        """
+        entry = self.ops.get(id(token))
+        if entry is None or entry[0] is not token:
+            return None
+        return entry[1]
+
+    def _op_of(self, token: Token) -> Op:
+        """
+        Returns the operation of an already compiled node.
+        """
+        return self.lookup(token) or (lambda task: task.transform_token(token))
+
+    def _compile_text(self, token: Text) -> Op:
+        text = token.inner
+        if not token.enclosing.left:
+            text = InterpretingTask.BACKSLASH_NEWLINE_RE.sub('', text)
+        return lambda task: text
+
+    def _compile_fragment_seq(self, seq: FragmentSeq) -> Op:
+        child_ops = [self._compile(fragment) for fragment in seq.children]
+
+        def op(task):
+            result = []
+            for child_op in child_ops:
+                fragment = child_op(task)
+                if fragment is not None:
+                    result.append(fragment)
+            return FragmentList(result)
+
+        return op
+
+    def _compile_command(self, token: Command) -> Op:  # noqa: C901
+        phrase = token.phrase
+        start_pos = token.start_pos
+        main_op = self._compile(token.main_arg) if token.main_arg is not None else None
+        if token.options is not None:
+            self._compile(token.options)
+
+        # Precomputes the argument layout for normal function calls;
+        # ill-formed options sections are left to NormalApply to report
+        arg_ops: Optional[list[Op]] = []
+        kwarg_ops: dict[str, Op] = {}
+        if token.options:
+            try:
+                arg_tokens, kwarg_tokens = NormalApply.arrange_args(self, token.options)
+            except PaxterRenderError:
+                arg_ops = None
+            else:
+                arg_ops = [self._op_of(value_token) for value_token in arg_tokens]
+                kwarg_ops = {
+                    keyword_name: self._op_of(value_token)
+                    for keyword_name, value_token in kwarg_tokens.items()
+                }
+        is_bare = token.options is None and token.main_arg is None
+
+        def apply(task: CompiledInterpretingTask, func: Callable, with_env: bool) -> Any:
+            args = [arg_op(task) for arg_op in arg_ops]
+            kwargs = {keyword_name: kwarg_op(task) for keyword_name, kwarg_op in kwarg_ops.items()}
+            if token.main_arg:
+                args.insert(0, main_op(task))
+            if with_env:
+                return func(task.env, *args, **kwargs)
+            return func(*args, **kwargs)
+
+        def op(task: CompiledInterpretingTask) -> Any:
+            env = task.env
+            try:
+                phrase_eval = env['_phrase_eval_']
+            except KeyError as exc:
+                raise PaxterRenderError(
+                    "expected '_phrase_eval_' to be defined at %(pos)s",
+                    pos=task._charloc(start_pos),
+                ) from exc
+            try:
+                phrase_value = phrase_eval(phrase, env)
+            except PaxterRenderError:
+                raise
+            except Exception as exc:
+                raise PaxterRenderError(
+                    "paxter command phrase evaluation error at %(pos)s: "
+                    f"{phrase!r}",
+                    pos=task._charloc(start_pos),
+                ) from exc
+
+            if is_bare:
+                return phrase_value
+
+            try:
+                if arg_ops is None:
+                    if not isinstance(phrase_value, BaseApply):
+                        phrase_value = NormalApply(phrase_value)
+                    return phrase_value.call(task, token)
+                if not isinstance(phrase_value, BaseApply):
+                    return apply(task, phrase_value, False)
+                apply_type = type(phrase_value)
+                if apply_type is NormalApply:
+                    return apply(task, phrase_value.wrapped, False)
+                if apply_type is NormalApplyWithEnv:
+                    return apply(task, phrase_value.wrapped, True)
+                return phrase_value.call(task, token)
+            except PaxterRenderError:
+                raise
+            except Exception as exc:
+                raise PaxterRenderError(
+                    "paxter apply evaluation error at %(pos)s",
+                    pos=task._charloc(start_pos),
+                ) from exc
+
+        return op
+
+
+@dataclass
+class CompiledInterpretingTask(InterpretingTask):
+    """
+    Rendering task of a :class:`CompiledTree` for a single environment dictionary.
+    Nodes of the compiled tree (including those transformed by
+    function wrappers such as :class:`DirectApply`) are transformed by their
+    compiled operations, and any other node is transformed as usual.
+    """
+    #: Compiled operations of the parsed tree
+    compiled: CompiledTree
+
+    @property
+    def line_index(self) -> LineIndex:
+        return self.compiled.line_index
+
+    def interp(self):
+        return self.transform_token(self.tree)
+
+    def transform_token(self, token: Token) -> Any:
+        op = self.compiled.lookup(token)
+        if op is None:
+            return super().transform_token(token)
+        return op(self)
+
+    def transform_fragment(self, fragment: Fragment) -> Any:
+        op = self.compiled.lookup(fragment)
+        if op is None:
+            return super().transform_fragment(fragment)
+        return op(self)
+
+    def transform_fragment_list(self, seq: FragmentSeq) -> FragmentList:
+        op = self.compiled.lookup(seq)
+        if op is None:
+            return super().transform_fragment_list(seq)
+        return op(self)
@@ -0,0 +1,82 @@
+"""
+Layered environment dictionary for nested scopes of evaluation.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ['Scope', 'BindingScope']
+
+
+class Scope(dict):
+    """
+    Environment dictionary layered on top of a parent environment::
+
+        base_env = create_document_env()
+        env = Scope(base_env)
+        env['x'] = 1  # binds x within the scope without modifying base_env
+
+    Bindings are stored in the scope itself (which is a real :class:`dict`
+    so that it can be used as globals of :func:`eval` and :func:`exec`),
+    and missing keys are looked up from the parent without copying it.
+    Hence a single base environment may be shared by concurrent renderings
+    each with a scope of its own.
+
+    Only local bindings are enumerated by methods such as
+    :meth:`keys` and :meth:`items`, and :func:`len` counts only them;
+    however, a scope is truthy whenever it or its parent has any binding.
+    """
+    __slots__ = ('parent',)
+
+    #: Environment in which missing keys are looked up
+    parent: dict
+
+    def __init__(self, parent: dict, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parent = parent
+
+    def __missing__(self, key: Any) -> Any:
+        return self.parent[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or key in self.parent
+
+    def __bool__(self) -> bool:
+        return dict.__len__(self) > 0 or bool(self.parent)
+
+    def __repr__(self) -> str:
+        return f"Scope({dict.__repr__(self)}, parent={type(self.parent).__name__})"
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class BindingScope(Scope):
+    """
+    Scope which holds only the bindings given upon its creation
+    (such as the loop variable of ``@for``)::
+
+        scope = BindingScope(env, item=None)
+        scope['item'] = 1  # rebinds item within the scope
+        scope['total'] = 2  # assigns total in env
+
+    Assignments to (and deletions of) any other name are made in the parent
+    environment instead, which also applies to assignments by :func:`exec`
+    (e.g. ``@python"total += item"``) using the scope as its namespace.
+    """
+    __slots__ = ()
+
+    def __setitem__(self, key: Any, value: Any):
+        if dict.__contains__(self, key):
+            dict.__setitem__(self, key, value)
+        else:
+            self.parent[key] = value
+
+    def __delitem__(self, key: Any):
+        if dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+        else:
+            del self.parent[key]
@@ -3,17 +3,24 @@ Implementation of the renderer.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
 import re
 from dataclasses import dataclass
-from typing import Any, Union
+from typing import Any, Callable, ClassVar, Iterator, Union
 
 from paxter.exceptions import PaxterRenderError
 from paxter.interp.data import FragmentList
+from paxter.interp.scope import BindingScope
 from paxter.interp.wrappers import BaseApply, NormalApply
 from paxter.syntax import (
-    CharLoc, Command, Fragment, FragmentSeq, Identifier, Number, Operator, Text, Token, TokenSeq,
+    CharLoc, Command, Fragment, FragmentSeq, Identifier, LineIndex, Number, Operator, Text, Token,
+    TokenSeq,
 )
 
+#: Function which transforms a node given the task and the node itself
+Transformer = Callable[['InterpretingTask', Any], Any]
+
 
 @dataclass
 class InterpretingTask:
@@ -45,6 +52,60 @@ class InterpretingTask:
 
     BACKSLASH_NEWLINE_RE = re.compile(r'\\[ \t\r\f\v]*\n[ \t\r\f\v]*')
 
+    #: Transformer of each node type registered to this class,
+    #: either the name of a method or a function (see :meth:`register_transformer`)
+    transformers: ClassVar[dict[type, Union[str, Transformer]]] = {
+        Text: 'transform_text',
+        Command: 'transform_command',
+        Fragment: 'transform_unrecognized_fragment',
+        TokenSeq: 'transform_token_list',
+        Identifier: 'transform_identifier',
+        Operator: 'transform_operator',
+        Number: 'transform_number',
+        FragmentSeq: 'transform_fragment_list',
+        object: 'transform_unrecognized_token',
+    }
+
+    #: Transformer of each node type (resolved through the class hierarchy)
+    _dispatch_table: ClassVar[dict[type, Transformer]] = {}
+
+    @functools.cached_property
+    def line_index(self) -> LineIndex:
+        """
+        Line index of the source text for error reporting,
+        which is built upon first use and kept by the task.
+        """
+        return LineIndex(self.src_text)
+
+    def _charloc(self, pos: int) -> CharLoc:
+        """
+        Converts the index of a position within the source text
+        into the line and column values for error reporting.
+        """
+        return CharLoc(self.src_text, pos, self.line_index)
+
+    @contextlib.contextmanager
+    def scoped(self, bindings: dict) -> Iterator[BindingScope]:
+        """
+        Replaces the environment with a new :class:`BindingScope`
+        holding the given bindings on top of it until the end of the ``with`` block::
+
+            with context.scoped({'item': None}) as scope:
+                for value in values:
+                    scope['item'] = value
+                    rendered = context.transform_token(node.main_arg)
+
+        so that these bindings neither modify nor outlive the enclosing environment,
+        whereas assignments of other names within the block
+        (including those by ``@python``) are still made in the enclosing environment.
+        """
+        parent = self.env
+        self.env = BindingScope(parent, bindings)
+        try:
+            yield self.env
+        finally:
+            self.env = parent
+
     def interp(self):
         """
         Interprets the given parsed tree into the final output (which is a fragment list)
@@ -57,36 +118,89 @@ class InterpretingTask:
 
     def transform_token(self, token: Token) -> Any:
         """
-        Transforms a given parsed token.
-        """
-        if isinstance(token, Fragment):
-            return self.transform_fragment(token)
-        if isinstance(token, TokenSeq):
-            return self.transform_token_list(token)
-        if isinstance(token, Identifier):
-            return self.transform_identifier(token)
-        if isinstance(token, Operator):
-            return self.transform_operator(token)
-        if isinstance(token, Number):
-            return self.transform_number(token)
-        if isinstance(token, FragmentSeq):
-            return self.transform_fragment_list(token)
+        Transforms a given parsed token
+        using the transformer registered for its node type.
+        """
+        try:
+            transformer = self._dispatch_table[type(token)]
+        except KeyError:
+            transformer = self._resolve_transformer(type(token))
+        return transformer(self, token)
+
+    def transform_fragment(self, fragment: Fragment) -> Any:
+        """
+        Transforms a given parsed fragment.
+        """
+        try:
+            transformer = self._dispatch_table[type(fragment)]
+        except KeyError:
+            transformer = self._resolve_transformer(type(fragment))
+        return transformer(self, fragment)
+
+    @classmethod
+    def register_transformer(cls, node_type: type) -> Callable[[Transformer], Transformer]:
+        """
+        Registers the decorated function as the transformer of the given node type
+        (and its subclasses unless registered separately) for this class
+        and its subclasses::
+
+            @InterpretingTask.register_transformer(ErrorFragment)
+            def transform_error_fragment(task, fragment):
+                return None
+
+        The transformer receives the task and the node to be transformed.
+        The transformer of the most specific node type is used,
+        and among those, the one registered to the most specific task class.
+        """
+
+        def decorator(func: Transformer) -> Transformer:
+            cls.transformers[node_type] = func
+            cls._clear_dispatch_tables()
+            return func
+
+        return decorator
+
+    @classmethod
+    def _resolve_transformer(cls, node_type: type) -> Transformer:
+        for base_type in node_type.__mro__:
+            for task_cls in cls.__mro__:
+                transformer = vars(task_cls).get('transformers', {}).get(base_type)
+                if transformer is None:
+                    continue
+                if isinstance(transformer, str):
+                    transformer = getattr(cls, transformer)
+                cls._dispatch_table[node_type] = transformer
+                return transformer
+        raise TypeError(f"no transformer for {node_type.__name__!r}")
+
+    @classmethod
+    def _clear_dispatch_tables(cls):
+        cls._dispatch_table.clear()
+        for subclass in cls.__subclasses__():
+            subclass._clear_dispatch_tables()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'transformers' not in vars(cls):
+            cls.transformers = {}
+        cls._dispatch_table = {}
+
+    def transform_unrecognized_token(self, token: Token):
+        """
+        Transforms a given parsed token of unrecognized type.
+        """
         raise PaxterRenderError(
             "unrecognized token at %(pos)s",
-            pos=CharLoc(self.src_text, token.start_pos),
+            pos=self._charloc(token.start_pos),
         )
 
-    def transform_fragment(self, fragment: Fragment) -> Any:
+    def transform_unrecognized_fragment(self, fragment: Fragment):
         """
-        Transforms a given parsed fragment.
+        Transforms a given parsed fragment of unrecognized type.
         """
-        if isinstance(fragment, Text):
-            return self.transform_text(fragment)
-        if isinstance(fragment, Command):
-            return self.transform_command(fragment)
         raise PaxterRenderError(
             "unrecognized fragment at %(pos)s",
-            pos=CharLoc(self.src_text, fragment.start_pos),
+            pos=self._charloc(fragment.start_pos),
         )
 
     def transform_token_list(self, seq: TokenSeq):
@@ -95,7 +209,7 @@ class InterpretingTask:
         """
         raise PaxterRenderError(
             "token list not expected at %(pos)s",
-            pos=CharLoc(self.src_text, seq.start_pos),
+            pos=self._charloc(seq.start_pos),
         )
 
     def transform_identifier(self, token: Identifier):
@@ -104,7 +218,7 @@ class InterpretingTask:
         """
         raise PaxterRenderError(
             "identifier not expected at %(pos)",
-            pos=CharLoc(self.src_text, token.start_pos),
+            pos=self._charloc(token.start_pos),
         )
 
     def transform_operator(self, token: Operator):
@@ -113,7 +227,7 @@ class InterpretingTask:
         """
         raise PaxterRenderError(
             "operator not expected at %(pos)",
-            pos=CharLoc(self.src_text, token.start_pos),
+            pos=self._charloc(token.start_pos),
         )
 
     def transform_number(self, token: Number) -> Union[int, float]:
@@ -156,7 +270,7 @@ class InterpretingTask:
         except KeyError as exc:
             raise PaxterRenderError(
                 "expected '_phrase_eval_' to be defined at %(pos)s",
-                pos=CharLoc(self.src_text, token.start_pos),
+                pos=self._charloc(token.start_pos),
             ) from exc
         try:
             phrase_value = phrase_eval(token.phrase, self.env)
@@ -166,7 +280,7 @@ class InterpretingTask:
             raise PaxterRenderError(
                 "paxter command phrase evaluation error at %(pos)s: "
                 f"{token.phrase!r}",
-                pos=CharLoc(self.src_text, token.start_pos),
+                pos=self._charloc(token.start_pos),
             ) from exc
 
         # Bail out if options section and main arg section are empty
@@ -185,5 +299,5 @@ class InterpretingTask:
         except Exception as exc:
             raise PaxterRenderError(
                 "paxter apply evaluation error at %(pos)s",
-                pos=CharLoc(self.src_text, token.start_pos),
+                pos=self._charloc(token.start_pos),
             ) from exc
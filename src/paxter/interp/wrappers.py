@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Any, Optional, TYPE_CHECKING
 
 from paxter.exceptions import PaxterRenderError
-from paxter.syntax import CharLoc, Command, Identifier, Operator, Token, TokenSeq
+from paxter.syntax import Command, Identifier, Operator, Token, TokenSeq
 
 if TYPE_CHECKING:
     from paxter.interp.task import InterpretingTask
@@ -90,28 +90,46 @@ class NormalApply(BaseApply):
         """
         Returns a pair of positional argument list and keyword argument dict.
         """
+        arg_tokens, kwarg_tokens = self.arrange_args(context, options)
+        args = [context.transform_token(value_token) for value_token in arg_tokens]
+        kwargs = {
+            keyword_name: context.transform_token(value_token)
+            for keyword_name, value_token in kwarg_tokens.items()
+        }
+        return args, kwargs
+
+    @classmethod
+    def arrange_args(
+            cls, context: InterpretingTask,
+            options: TokenSeq,
+    ) -> tuple[list[Token], dict[str, Token]]:
+        """
+        Returns a pair of positional argument token list
+        and keyword argument token dict (in the order of appearance)
+        without transforming any of the tokens.
+        """
         section_flipped = False  # kwargs found
-        args = []
-        kwargs = {}
+        arg_tokens = []
+        kwarg_tokens = {}
 
-        for keyword_name, value_token in self.tokenize_args(context, options):
+        for keyword_name, value_token in cls.tokenize_args(context, options):
             if keyword_name is not None:
                 section_flipped = True
-                if keyword_name in kwargs:
+                if keyword_name in kwarg_tokens:
                     raise PaxterRenderError(
                         f"duplicated keyword {keyword_name} at %(pos)s",
-                        pos=CharLoc(context.src_text, options.start_pos),
+                        pos=context._charloc(options.start_pos),
                     )
-                kwargs[keyword_name] = context.transform_token(value_token)
+                kwarg_tokens[keyword_name] = value_token
             elif section_flipped:
                 raise PaxterRenderError(
                     "found positional argument after keyword argument at %(pos)s",
-                    pos=CharLoc(context.src_text, options.start_pos),
+                    pos=context._charloc(options.start_pos),
                 )
             else:
-                args.append(context.transform_token(value_token))
+                arg_tokens.append(value_token)
 
-        return args, kwargs
+        return arg_tokens, kwarg_tokens
 
     @staticmethod
     def tokenize_args(
@@ -136,7 +154,7 @@ class NormalApply(BaseApply):
                     if not isinstance(first_token, Identifier):
                         raise PaxterRenderError(
                             "expected an identifier before the '=' sign at %(pos)s",
-                            pos=CharLoc(context.src_text, first_token.start_pos),
+                            pos=context._charloc(first_token.start_pos),
                         )
                     keyword_name = first_token.name
                     remains = remains[2:]
@@ -145,7 +163,7 @@ class NormalApply(BaseApply):
             if not remains:
                 raise PaxterRenderError(
                     "expected a value after the '=' sign at %(pos)s",
-                    pos=CharLoc(context.src_text, options.end_pos),
+                    pos=context._charloc(options.end_pos),
                 )
             value_token = remains[0]
             remains = remains[1:]
@@ -159,7 +177,7 @@ class NormalApply(BaseApply):
                 if end_token != Operator.without_pos(symbols=','):
                     raise PaxterRenderError(
                         "expected a comma token after the value token at %(pos)s",
-                        pos=CharLoc(context.src_text, end_token.start_pos),
+                        pos=context._charloc(end_token.start_pos),
                     )
                 remains = remains[1:]
 
@@ -6,8 +6,10 @@ from __future__ import annotations
 
 from paxter.quickauthor.environ import create_document_env, create_simple_env
 from paxter.quickauthor.preset import run_document_paxter, run_simple_paxter
+from paxter.quickauthor.sitebuild import build_site, watch_site
 
 __all__ = [
     'create_document_env', 'create_simple_env',
     'run_document_paxter', 'run_simple_paxter',
+    'build_site', 'watch_site',
 ]
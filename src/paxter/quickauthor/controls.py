@@ -18,12 +18,17 @@ def for_statement(context: InterpretingTask, node: Command):
     """
     Simulates a simple for loop.
     Its command has the form of ``@for[ITEM in SEQUENCE]{...}``.
+    The main argument body is rendered once per item within a new scope
+    (see :meth:`InterpretingTask.scoped`) binding ``ITEM``,
+    so the loop variable neither modifies nor outlives the enclosing environment.
+    Any other assignment within the body (such as ``@python"total += i"``)
+    updates the enclosing environment as usual.
     """
 
     def raise_error(message):
         raise PaxterRenderError(
             f"{message} in for statement at %(pos)s",
-            pos=CharLoc(context.src_text, node.options.start_pos),
+            pos=CharLoc(context.src_text, node.options.start_pos, context.line_index),
         )
 
     if not (node.options
@@ -45,10 +50,11 @@ def for_statement(context: InterpretingTask, node: Command):
     seq = context.transform_token(node.options.children[2])
 
     fragments = []
-    for value in seq:
-        context.env[id_name] = value
-        rendered = context.transform_token(node.main_arg)
-        fragments.append(rendered)
+    with context.scoped({id_name: None}) as scope:
+        for value in seq:
+            scope[id_name] = value
+            rendered = context.transform_token(node.main_arg)
+            fragments.append(rendered)
 
     return FragmentList(fragments)
 
@@ -67,7 +73,7 @@ def if_statement(context: InterpretingTask, node: Command):  # noqa: C901
     def raise_error(message):
         raise PaxterRenderError(
             f"{message} in if statement at %(pos)s",
-            pos=CharLoc(context.src_text, node.options.start_pos),
+            pos=CharLoc(context.src_text, node.options.start_pos, context.line_index),
         )
 
     target_bool = True
@@ -3,35 +3,54 @@ A collection of Paxter common functions.
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from paxter.interp import FragmentList
 from paxter.interp.task import InterpretingTask
 from paxter.quickauthor.elements import Document
 from paxter.quickauthor.environ import create_document_env, create_simple_env
-from paxter.syntax import ParsingTask
+from paxter.syntax import FragmentSeq, ParsingTask
 
+if TYPE_CHECKING:
+    from paxter.syntax.cache import ParseCache
 
-def run_simple_paxter(src_text: str, env: Optional[dict] = None) -> FragmentList:
+
+def run_simple_paxter(
+        src_text: str,
+        env: Optional[dict] = None,
+        parse_cache: Optional[ParseCache] = None,
+) -> FragmentList:
     """
     Parses the input source text written in Paxter language
     and evaluates it using standard python environment.
     This function returns the result of evaluation
     and may modify the given environment in-place as well.
+    If ``parse_cache`` is provided, the parsed tree is looked up from
+    (or stored into) the cache instead of always parsing the source text.
     """
-    parsed_tree = ParsingTask(src_text).parse()
+    parsed_tree = _parse(src_text, parse_cache)
     env = env or create_simple_env()
     rendered = InterpretingTask(src_text, env, parsed_tree).interp()
     return rendered
 
 
-def run_document_paxter(src_text: str, env: Optional[dict] = None) -> Document:
+def run_document_paxter(
+        src_text: str,
+        env: Optional[dict] = None,
+        parse_cache: Optional[ParseCache] = None,
+) -> Document:
     """
     Similar to run_simple_paxter,
     but uses specialized environment suitable for writing documents.
     The result is wrapped under Document data class.
     """
-    parsed_tree = ParsingTask(src_text).parse()
+    parsed_tree = _parse(src_text, parse_cache)
     env = env or create_document_env()
     rendered = InterpretingTask(src_text, env, parsed_tree).interp()
     return Document.from_fragments(rendered)
+
+
+def _parse(src_text: str, parse_cache: Optional[ParseCache]) -> FragmentSeq:
+    if parse_cache is None:
+        return ParsingTask(src_text).parse()
+    return parse_cache.parse(src_text)
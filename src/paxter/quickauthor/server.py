@@ -0,0 +1,183 @@
+"""
+Long-running local HTTP server rendering Paxter source texts into HTML,
+which avoids paying the process startup cost for every document.
+"""
+from __future__ import annotations
+
+import os
+import runpy
+import socket
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+from paxter.exceptions import PaxterBaseException
+from paxter.interp import Scope
+from paxter.quickauthor.environ import create_document_env
+from paxter.quickauthor.preset import run_document_paxter
+from paxter.syntax import warm_up
+
+if TYPE_CHECKING:
+    from paxter.syntax.cache import ParseCache
+
+__all__ = ['RenderServer', 'UnixRenderServer', 'RenderRequestHandler']
+
+#: Name of the environment used when the request does not specify one
+DEFAULT_ENV_NAME = 'default'
+
+RENDER_PATH = '/render'
+
+#: Media type which the request body must declare in its Content-Type header
+SOURCE_CONTENT_TYPE = 'application/x-paxter'
+
+
+class RenderServer(ThreadingHTTPServer):
+    """
+    HTTP server which renders Paxter source texts into HTML
+    using environments loaded once at startup::
+
+        server = RenderServer(('127.0.0.1', 8000), {'default': None, 'blog': 'blog_env.py'})
+        server.serve_forever()
+
+    Each environment is named and created from an optional python file
+    (just like the ``--env-file`` option of the ``html`` command),
+    which is executed only once and then kept resident.
+    Every rendering works within its own :class:`Scope <paxter.interp.Scope>`
+    on top of the shared environment, which is never modified.
+    Clients send the source text as the body of ``POST /render?env=NAME``
+    and receive the rendered HTML (see :class:`RenderRequestHandler`).
+
+    Since rendering runs arbitrary python code from the source text
+    (such as ``@python`` blocks), requests from web browsers are rejected,
+    but any local process able to connect may still render documents.
+    Prefer :class:`UnixRenderServer` whose socket file is protected
+    by file system permissions.
+    """
+    daemon_threads = True
+
+    def __init__(
+            self,
+            server_address: tuple[str, int],
+            env_files: dict[str, Optional[str]],
+            parse_cache: Optional[ParseCache] = None,
+    ):
+        #: Environment created from the environment file of each environment name
+        self.envs = {
+            name: create_document_env(runpy.run_path(env_file) if env_file else {})
+            for name, env_file in env_files.items()
+        }
+        self.parse_cache = parse_cache
+        warm_up()
+        super().__init__(server_address, RenderRequestHandler)
+
+    def render(self, src_text: str, env_name: str) -> str:
+        """
+        Renders the source text into HTML using the environment of the given name.
+        """
+        env = Scope(self.envs[env_name])
+        return run_document_paxter(src_text, env, self.parse_cache).html()
+
+
+class UnixRenderServer(RenderServer):
+    """
+    Variant of :class:`RenderServer` listening on a Unix domain socket
+    at the given path instead of a TCP port::
+
+        server = UnixRenderServer('/tmp/paxter.sock', {'default': None})
+        server.serve_forever()
+
+    The socket file is removed when the server is closed.
+    """
+    # Unix domain sockets are not available on every platform
+    address_family = getattr(socket, 'AF_UNIX', None)
+
+    def server_bind(self):
+        # Skips HTTPServer.server_bind() which expects a host and port
+        socketserver.TCPServer.server_bind(self)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except FileNotFoundError:
+            pass
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles rendering requests of :class:`RenderServer`.
+    The request body must be the source text declared
+    with the ``application/x-paxter`` content type.
+    Responses are HTML with status 200 upon success, or plain text error messages
+    with status 400 (for invalid Content-Length headers or non-UTF-8 bodies),
+    403 (for requests with an Origin header, i.e. those sent by web browsers),
+    404 (for unknown paths or environment names),
+    415 (for other content types),
+    422 (for Paxter syntax or rendering errors),
+    or 500 (for any other error raised while rendering).
+
+    Browsers attach the Origin header to every cross-origin request
+    (as well as to pages rebinding their domain names to the local address),
+    and cannot send a body of this content type without a preflight request
+    (which is not supported here), so web pages cannot render documents.
+    """
+    server: RenderServer
+
+    def address_string(self) -> str:
+        # Clients connected through Unix domain sockets have no addresses
+        if not isinstance(self.client_address, tuple):
+            return str(self.server.server_address)
+        return super().address_string()
+
+    def do_POST(self):
+        if 'Origin' in self.headers:
+            self._respond(HTTPStatus.FORBIDDEN, "requests from web browsers are not allowed")
+            return
+        if self.headers.get_content_type() != SOURCE_CONTENT_TYPE:
+            self._respond(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                f"expected {SOURCE_CONTENT_TYPE} content type",
+            )
+            return
+
+        url = urlsplit(self.path)
+        if url.path != RENDER_PATH:
+            self._respond(HTTPStatus.NOT_FOUND, f"unknown path: {url.path}")
+            return
+        env_name = parse_qs(url.query).get('env', [DEFAULT_ENV_NAME])[0]
+        if env_name not in self.server.envs:
+            self._respond(HTTPStatus.NOT_FOUND, f"unknown environment: {env_name}")
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._respond(HTTPStatus.BAD_REQUEST, "invalid Content-Length header")
+            return
+        try:
+            src_text = self.rfile.read(length).decode('utf-8')
+        except UnicodeDecodeError as exc:
+            self._respond(HTTPStatus.BAD_REQUEST, f"request body is not valid UTF-8: {exc}")
+            return
+
+        try:
+            html = self.server.render(src_text, env_name)
+        except PaxterBaseException as exc:
+            self._respond(HTTPStatus.UNPROCESSABLE_ENTITY, exc.message)
+            return
+        except Exception as exc:
+            self._respond(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+            return
+        self._respond(HTTPStatus.OK, html, 'text/html')
+
+    def _respond(self, status: HTTPStatus, text: str, content_type: str = 'text/plain'):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,262 @@
+"""
+Building a directory of Paxter documents into HTML files
+in parallel across a process pool.
+"""
+from __future__ import annotations
+
+import os
+import runpy
+import time
+from typing import Iterator, NamedTuple, Optional, TYPE_CHECKING
+
+from paxter.exceptions import PaxterBaseException
+from paxter.interp import Scope
+from paxter.quickauthor.environ import create_document_env
+from paxter.quickauthor.preset import run_document_paxter
+from paxter.syntax import warm_up
+
+if TYPE_CHECKING:
+    from paxter.syntax.cache import ParseCache
+
+__all__ = ['BuildResult', 'build_site', 'discover_sources', 'watch_site']
+
+SOURCE_SUFFIX = '.paxter'
+OUTPUT_SUFFIX = '.html'
+
+#: Default number of seconds between polls of source files in watch mode
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+class BuildResult(NamedTuple):
+    """
+    Outcome of building a single source file.
+    """
+    #: Path to the source file
+    src_path: str
+
+    #: Path to the output HTML file
+    out_path: str
+
+    #: Wall-clock time spent on building (in seconds)
+    elapsed: float = 0.0
+
+    #: Whether the build was skipped because the output was up-to-date
+    skipped: bool = False
+
+    #: Error message if the build failed, or :const:`None` otherwise
+    error: Optional[str] = None
+
+
+def discover_sources(src_dir: str, out_dir: str) -> list[tuple[str, str]]:
+    """
+    Finds all Paxter source files under the source directory (recursively)
+    and pairs each of them with the path of its output HTML file
+    at the same relative location under the output directory.
+    """
+    pairs = []
+    for dir_path, dir_names, file_names in os.walk(src_dir):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if not file_name.endswith(SOURCE_SUFFIX):
+                continue
+            src_path = os.path.join(dir_path, file_name)
+            rel_path = os.path.relpath(src_path, src_dir)
+            out_path = os.path.join(out_dir, rel_path[:-len(SOURCE_SUFFIX)] + OUTPUT_SUFFIX)
+            pairs.append((src_path, out_path))
+    return pairs
+
+
+def build_site(
+        src_dir: str,
+        out_dir: str,
+        env_file: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        workers: Optional[int] = None,
+        force: bool = False,
+) -> list[BuildResult]:
+    """
+    Renders every Paxter source file under the source directory
+    into an HTML file under the output directory
+    using :func:`run_document_paxter` and :meth:`Document.html()`,
+    spreading files across a pool of (at most ``workers``) processes.
+
+    The environment file (if given) is executed once per worker process.
+    Files whose output is newer than both the source file
+    and the environment file are skipped unless ``force`` is set.
+    Results are returned in the order of discovery.
+    """
+    pairs = discover_sources(src_dir, out_dir)
+    results: dict[int, BuildResult] = {}
+    pending = []
+    for index, (src_path, out_path) in enumerate(pairs):
+        if not force and _is_up_to_date(src_path, out_path, env_file):
+            results[index] = BuildResult(src_path, out_path, skipped=True)
+        else:
+            pending.append(index)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(pending))
+    jobs = [pairs[index] for index in pending]
+
+    if workers <= 1:
+        _init_worker(env_file, cache_dir)
+        built = list(map(_build_file, jobs))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Lexer patterns compiled here are inherited by forked workers,
+        # whereas workers started by spawn or forkserver compile them in _init_worker()
+        warm_up()
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(env_file, cache_dir),
+        ) as executor:
+            built = list(executor.map(_build_file, jobs))
+
+    results.update(zip(pending, built))
+    return [results[index] for index in range(len(pairs))]
+
+
+def watch_site(
+        src_dir: str,
+        out_dir: str,
+        env_file: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        workers: Optional[int] = None,
+        force: bool = False,
+        interval: float = DEFAULT_POLL_INTERVAL,
+) -> Iterator[list[BuildResult]]:
+    """
+    Builds the directory just like :func:`build_site`
+    and then keeps polling source files (with :func:`os.stat`)
+    for changes every ``interval`` seconds, indefinitely.
+    It yields the results of the initial build
+    followed by the results of each round of rebuilding::
+
+        for results in watch_site(src_dir, out_dir):
+            ...
+
+    Rebuilding happens within the current process
+    which keeps lexer patterns, the environment file, and the parse cache loaded,
+    and only new or modified source files are rendered again
+    (or all of them if the environment file is modified).
+    If the modified environment file fails to load,
+    the error is reported as the result of the environment file itself
+    (with an empty output path) and the previous environment is kept.
+    """
+    global _worker_env
+
+    # Modification times are taken before building
+    # so that files modified during the initial build are not missed
+    mtimes = _stat_sources(src_dir, out_dir, env_file)
+    yield build_site(src_dir, out_dir, env_file, cache_dir, workers, force)
+    _init_worker(env_file, cache_dir)
+
+    while True:
+        time.sleep(interval)
+        new_mtimes = _stat_sources(src_dir, out_dir, env_file)
+        if new_mtimes == mtimes:
+            continue
+        prev_mtimes, mtimes = mtimes, new_mtimes
+        results = []
+        changed = [
+            pair for pair in discover_sources(src_dir, out_dir)
+            if new_mtimes.get(pair[0]) != prev_mtimes.get(pair[0])
+        ]
+        if env_file is not None and new_mtimes.get(env_file) != prev_mtimes.get(env_file):
+            try:
+                _worker_env = _load_env(env_file)
+            except Exception as exc:
+                results.append(BuildResult(env_file, '', error=_error_message(exc)))
+            else:
+                changed = discover_sources(src_dir, out_dir)
+        results.extend(_build_file(pair) for pair in changed)
+        if results:
+            yield results
+
+
+def _stat_sources(src_dir: str, out_dir: str, env_file: Optional[str]) -> dict[str, int]:
+    """
+    Collects modification times of all source files and of the environment file.
+    Files which disappear in the meantime are left out.
+    """
+    paths = [src_path for src_path, _ in discover_sources(src_dir, out_dir)]
+    if env_file is not None:
+        paths.append(env_file)
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return mtimes
+
+
+def _is_up_to_date(src_path: str, out_path: str, env_file: Optional[str]) -> bool:
+    """
+    Checks whether the output file is newer than the source file
+    and the environment file.
+    """
+    try:
+        out_mtime = os.stat(out_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    if os.stat(src_path).st_mtime_ns >= out_mtime:
+        return False
+    return env_file is None or os.stat(env_file).st_mtime_ns < out_mtime
+
+
+#: Environment (shared by all files) and parse cache of the current worker process
+_worker_env: dict = {}
+_worker_parse_cache: Optional[ParseCache] = None
+
+
+def _init_worker(env_file: Optional[str], cache_dir: Optional[str]):
+    from paxter.syntax.cache import ParseCache
+    global _worker_env, _worker_parse_cache
+    warm_up()
+    _worker_env = _load_env(env_file)
+    _worker_parse_cache = ParseCache(cache_dir) if cache_dir else None
+
+
+def _load_env(env_file: Optional[str]) -> dict:
+    """
+    Creates the document environment from the environment file (if given).
+    """
+    return create_document_env(runpy.run_path(env_file) if env_file else {})
+
+
+def _build_file(pair: tuple[str, str]) -> BuildResult:
+    """
+    Renders a single source file into its output HTML file.
+    Any error raised while reading, rendering, or writing
+    is reported in the result instead of aborting the whole build.
+    """
+    src_path, out_path = pair
+    start = time.perf_counter()
+    try:
+        with open(src_path, encoding='utf-8') as fobj:
+            src_text = fobj.read()
+        env = Scope(_worker_env)
+        document = run_document_paxter(src_text, env, _worker_parse_cache)
+        html = document.html()
+        os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+        with open(out_path, 'w', encoding='utf-8') as fobj:
+            fobj.write(html)
+            fobj.write("\n")
+    except Exception as exc:
+        return BuildResult(
+            src_path, out_path, time.perf_counter() - start, error=_error_message(exc),
+        )
+    return BuildResult(src_path, out_path, time.perf_counter() - start)
+
+
+def _error_message(exc: Exception) -> str:
+    """
+    Describes the error raised while building.
+    """
+    if isinstance(exc, PaxterBaseException):
+        return exc.message
+    return f"{type(exc).__name__}: {exc}"
@@ -3,8 +3,10 @@ Collection of standard functions for Python quickauthor mode.
 """
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import Any, TYPE_CHECKING
+from types import CodeType
+from typing import Any, Optional, TYPE_CHECKING
 
 from paxter.exceptions import PaxterRenderError
 from paxter.interp import DirectApply
@@ -13,6 +15,12 @@ from paxter.syntax import Command, Text
 if TYPE_CHECKING:
     from paxter.interp.task import InterpretingTask
 
+#: Default maximum number of compiled phrases kept by :func:`phrase_unsafe_eval`
+DEFAULT_PHRASE_CACHE_SIZE = 1024
+
+#: Default maximum number of compiled code blocks kept by :func:`python_unsafe_exec`
+DEFAULT_PYTHON_CACHE_SIZE = 256
+
 
 def phrase_unsafe_eval(phrase: str, env: dict) -> Any:
     """
@@ -21,7 +29,9 @@ def phrase_unsafe_eval(phrase: str, env: dict) -> Any:
 
     1. Looks up the value from ``env['_extras_']`` dict using phrase as key
     2. Looks up the value from ``env`` dict using phrase as key
-    3. Invokes the built-in function :func:`eval`.
+    3. Invokes the built-in function :func:`eval`
+       on the phrase compiled into a code object,
+       which is cached across calls (see :func:`configure_phrase_cache`).
     """
     if not phrase:
         return None
@@ -30,7 +40,34 @@ def phrase_unsafe_eval(phrase: str, env: dict) -> Any:
         return extras[phrase]
     if phrase in env:
         return env[phrase]
-    return eval(phrase, env)
+    return eval(_compile_phrase(phrase), env)
+
+
+def _compile_phrase_uncached(phrase: str) -> CodeType:
+    # Leading spaces and tabs are stripped just like eval() does to strings
+    return compile(phrase.lstrip(' \t'), '<paxter>', 'eval')
+
+
+_compile_phrase = functools.lru_cache(maxsize=DEFAULT_PHRASE_CACHE_SIZE)(_compile_phrase_uncached)
+
+
+def configure_phrase_cache(maxsize: Optional[int] = DEFAULT_PHRASE_CACHE_SIZE):
+    """
+    Replaces the cache of compiled phrases used by :func:`phrase_unsafe_eval`
+    with an empty one of the given maximum size
+    (which may be 0 to disable caching or :const:`None` for no limit).
+    """
+    global _compile_phrase
+    _compile_phrase = functools.lru_cache(maxsize=maxsize)(_compile_phrase_uncached)
+
+
+def phrase_cache_info():
+    """
+    Reports the statistics (hits, misses, maxsize, and currsize)
+    of the cache of compiled phrases used by :func:`phrase_unsafe_eval`
+    as returned by ``cache_info()`` of :func:`functools.lru_cache`.
+    """
+    return _compile_phrase.cache_info()
 
 
 @DirectApply
@@ -38,13 +75,40 @@ def python_unsafe_exec(context: InterpretingTask, node: Command):
     """
     Unsafely executes the given python code
     using env dict as the namespace.
+    The code is dedented and compiled into a code object
+    which is cached across calls (see :func:`configure_python_cache`).
     """
     if node.options:
         raise PaxterRenderError("expected empty options section")
     if not isinstance(node.main_arg, Text):
         raise PaxterRenderError("expected raw text")
-    code = inspect.cleandoc(node.main_arg.inner)
-    exec(code, context.env)
+    exec(_compile_python(node.main_arg.inner), context.env)
+
+
+def _compile_python_uncached(code: str) -> CodeType:
+    return compile(inspect.cleandoc(code), '<paxter>', 'exec')
+
+
+_compile_python = functools.lru_cache(maxsize=DEFAULT_PYTHON_CACHE_SIZE)(_compile_python_uncached)
+
+
+def configure_python_cache(maxsize: Optional[int] = DEFAULT_PYTHON_CACHE_SIZE):
+    """
+    Replaces the cache of compiled code blocks used by :func:`python_unsafe_exec`
+    with an empty one of the given maximum size
+    (which may be 0 to disable caching or :const:`None` for no limit).
+    """
+    global _compile_python
+    _compile_python = functools.lru_cache(maxsize=maxsize)(_compile_python_uncached)
+
+
+def python_cache_info():
+    """
+    Reports the statistics (hits, misses, maxsize, and currsize)
+    of the cache of compiled code blocks used by :func:`python_unsafe_exec`
+    as returned by ``cache_info()`` of :func:`functools.lru_cache`.
+    """
+    return _compile_python.cache_info()
 
 
 def verbatim(text: Any) -> str:
@@ -4,17 +4,54 @@ the syntax functionality for Paxter language.
 """
 from __future__ import annotations
 
-from paxter.syntax.charloc import CharLoc
+import importlib
+from typing import TYPE_CHECKING
+
+from paxter.syntax.batch import parse_many
+from paxter.syntax.charloc import CharLoc, LineIndex
 from paxter.syntax.data import (
-    Command, Fragment, FragmentSeq, Identifier, Number, Operator, Text, Token, TokenSeq,
+    Command, ErrorFragment, Fragment, FragmentSeq, Identifier, LazyText, Number, Operator, Text,
+    Token, TokenSeq,
 )
 from paxter.syntax.enclosing import EnclosingPattern, GlobalEnclosingPattern
+from paxter.syntax.events import Event, EventParsingTask
+from paxter.syntax.incremental import TextEdit
+from paxter.syntax.iterative import IterativeParsingTask
+from paxter.syntax.lexers import warm_up
+from paxter.syntax.recovering import RecoveringParsingTask
+from paxter.syntax.streaming import StreamingParsingTask
 from paxter.syntax.task import ParsingTask
 
+if TYPE_CHECKING:
+    from paxter.syntax.cache import ParseCache
+    from paxter.syntax.flat import FlatTree
+    from paxter.syntax.mapped import MappedTree
+
 __all__ = [
-    'CharLoc',
-    'Command', 'Fragment', 'FragmentSeq', 'Identifier',
-    'Number', 'Operator', 'Text', 'Token', 'TokenSeq',
+    'CharLoc', 'LineIndex',
+    'Command', 'ErrorFragment', 'Fragment', 'FragmentSeq', 'Identifier',
+    'LazyText', 'Number', 'Operator', 'Text', 'Token', 'TokenSeq',
     'EnclosingPattern', 'GlobalEnclosingPattern',
-    'ParsingTask',
+    'ParsingTask', 'IterativeParsingTask', 'StreamingParsingTask', 'RecoveringParsingTask',
+    'TextEdit',
+    'Event', 'EventParsingTask', 'FlatTree', 'MappedTree', 'ParseCache',
+    'parse_many', 'warm_up',
 ]
+
+#: Names which are imported from their modules only upon first access
+#: as these modules pull in dependencies (such as hashlib and tempfile)
+#: which would otherwise slow down importing this package
+_LAZY_NAMES = {
+    'FlatTree': 'paxter.syntax.flat',
+    'MappedTree': 'paxter.syntax.mapped',
+    'ParseCache': 'paxter.syntax.cache',
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = getattr(importlib.import_module(module_name), name)
+    return value
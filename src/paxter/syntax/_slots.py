@@ -0,0 +1,59 @@
+"""
+Helper for declaring dataclasses with ``__slots__``
+(an equivalent of ``@dataclass(slots=True)`` which requires Python 3.10).
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import TypeVar
+
+__all__ = ['slotted']
+
+C = TypeVar('C', bound=type)
+
+
+def slotted(cls: C) -> C:
+    """
+    Recreates the given dataclass with ``__slots__``
+    for each of its fields not already declared by its base classes,
+    so that instances carry no per-instance ``__dict__``
+    (as long as all base classes are also slotted).
+
+    It must be applied on top of (i.e. after) the ``@dataclass`` decorator,
+    and methods of the class must not use the zero-argument ``super()``.
+    Fields with ``init=False`` no longer fall back to class-level defaults,
+    so they must be assigned in ``__post_init__``.
+    """
+    inherited_slots = {
+        name
+        for base in cls.__mro__[1:]
+        for name in base.__dict__.get('__slots__', ())
+    }
+    field_names = [field.name for field in dataclasses.fields(cls)]
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = tuple(
+        name for name in field_names if name not in inherited_slots
+    )
+    # Class attributes holding default values would shadow slot descriptors
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    # Default pickling restores slots with setattr() which frozen dataclasses forbid
+    if cls.__dataclass_params__.frozen:
+        cls_dict['__getstate__'] = _frozen_getstate
+        cls_dict['__setstate__'] = _frozen_setstate
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _frozen_getstate(self) -> list:
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def _frozen_setstate(self, state: list):
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
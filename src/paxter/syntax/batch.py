@@ -0,0 +1,121 @@
+"""
+Batch parsing of many independent source texts across a process pool.
+"""
+from __future__ import annotations
+
+import os
+from typing import Iterable, Optional, TYPE_CHECKING, Union
+
+from paxter.exceptions import PaxterSyntaxError
+from paxter.syntax.data import FragmentSeq
+from paxter.syntax.lexers import warm_up
+from paxter.syntax.task import ParsingTask
+
+if TYPE_CHECKING:
+    from paxter.syntax.flat import FlatTree
+
+__all__ = ['parse_many']
+
+#: Source text (as a string) or path to a source file (as a path-like object)
+Source = Union[str, os.PathLike]
+
+
+def parse_many(
+        sources: Iterable[Source],
+        workers: Optional[int] = None,
+        return_exceptions: bool = False,
+        flat: bool = False,
+) -> list[Union[FragmentSeq, FlatTree, PaxterSyntaxError]]:
+    """
+    Parses many independent sources in parallel
+    using a pool of (at most ``workers``) processes
+    and returns the parsed trees in the same order as the sources::
+
+        parsed_trees = parse_many(pathlib.Path('docs').glob('*.paxter'))
+
+    Each source is either the source text itself as a string
+    or a path-like object (such as :class:`pathlib.Path`) to the source file
+    which is then read by the worker process.
+    Parsed trees are sent back from workers in the binary encoding
+    (see :mod:`paxter.syntax.binary`) rather than pickled node objects.
+
+    Building node objects from the encoding takes place in the current process
+    one tree at a time, which limits the speedup from the parallelism.
+    If ``flat`` is set, the parsed trees are returned in the columnar representation
+    (see :class:`paxter.syntax.FlatTree`) instead, which is decoded cheaply;
+    callers may then build only the trees they need with ``to_tree()``
+    or read them through lazy views (see :func:`paxter.syntax.mapped.view_node`).
+
+    If a source contains a syntax error, the error of the first such source
+    is raised unless ``return_exceptions`` is set,
+    in which case the error takes the place of the parsed tree in the result.
+    The default number of workers is the number of CPUs,
+    and the sources are parsed in the current process if it is 1.
+    """
+    sources = list(sources)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(sources))
+
+    if workers <= 1:
+        results = [_parse_source(source, flat) for source in sources]
+    else:
+        # Process pools (and the binary encoding) are imported only when needed
+        # since they noticeably slow down importing this package
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Lexer patterns compiled here are inherited by forked workers,
+        # whereas workers started by spawn or forkserver compile them upon startup
+        warm_up()
+        chunksize = max(1, len(sources) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as executor:
+            encoded_results = executor.map(_parse_encoded, sources, chunksize=chunksize)
+            results = [_decode_result(result, flat) for result in encoded_results]
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, PaxterSyntaxError):
+                raise result
+    return results
+
+
+def _parse_source(
+        source: Source,
+        flat: bool = False,
+) -> Union[FragmentSeq, FlatTree, PaxterSyntaxError]:
+    """
+    Parses a single source into its parsed tree,
+    in the columnar representation if ``flat`` is set (or the syntax error).
+    """
+    if isinstance(source, str):
+        src_text = source
+    else:
+        with open(source, encoding='utf-8') as fobj:
+            src_text = fobj.read()
+    task = ParsingTask(src_text)
+    try:
+        return task.parse_flat() if flat else task.parse()
+    except PaxterSyntaxError as exc:
+        return exc
+
+
+def _parse_encoded(source: Source) -> Union[bytes, PaxterSyntaxError]:
+    """
+    Parses a single source into the binary encoding of its parsed tree
+    (or the syntax error) to be sent back from a worker process.
+    """
+    from paxter.syntax import binary
+    result = _parse_source(source, flat=True)
+    if isinstance(result, PaxterSyntaxError):
+        return result
+    return binary.encode(result)
+
+
+def _decode_result(
+        result: Union[bytes, PaxterSyntaxError],
+        flat: bool,
+) -> Union[FragmentSeq, FlatTree, PaxterSyntaxError]:
+    from paxter.syntax import binary
+    if isinstance(result, PaxterSyntaxError):
+        return result
+    return binary.decode(result) if flat else binary.loads(result)
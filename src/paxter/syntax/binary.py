@@ -0,0 +1,197 @@
+"""
+Versioned binary encoding of Paxter parsed trees,
+which is the serialized form of :class:`FlatTree <paxter.syntax.flat.FlatTree>`.
+
+The encoding consists of the following parts (all integers are little-endian):
+
+- A header containing the magic bytes ``PXTR``, the format version,
+  the number of nodes, the sizes of the string table and of the pattern table,
+  and the array type code of each column.
+- Each column of the flat tree in the order of :const:`COLUMNS`,
+  each of which is padded to a multiple of 8 bytes.
+  Every column is stored with the narrowest integer type
+  which holds all of its values (see :const:`TYPECODES`)
+  so that the nodes of small documents take 13 bytes each.
+- The UTF-8 string table.
+- The pattern table: enclosing left patterns, each terminated by a null byte.
+
+Columns keep fixed-width entries (rather than variable-length integers)
+so that they can be accessed by index directly from a memory-mapped file
+(see :class:`MappedTree <paxter.syntax.mapped.MappedTree>`).
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import BinaryIO, NamedTuple, Union
+
+from paxter.syntax.data import Token
+from paxter.syntax.flat import FlatTree
+
+__all__ = ['FORMAT_VERSION', 'dumps', 'loads', 'dump', 'load', 'encode', 'decode']
+
+MAGIC = b'PXTR'
+
+#: Version of the binary encoding; it must be bumped whenever
+#: the layout or the meaning of any of its parts changes
+FORMAT_VERSION = 3
+
+#: Attribute names of columns in the order of encoding
+COLUMNS = [
+    'kinds', 'flags', 'start_pos', 'end_pos',
+    'child_starts', 'str_starts', 'str_ends', 'enclosings',
+]
+
+#: Magic bytes and format version, which begin the header of every format version
+PREAMBLE = struct.Struct('<4sH')
+
+#: Magic bytes, format version, number of nodes,
+#: size of string table, size of pattern table, and type codes of columns
+HEADER = struct.Struct(f'<4sHQQQ{len(COLUMNS)}s')
+
+#: Array type codes of column entries from the narrowest,
+#: for columns without and with negative values respectively
+UNSIGNED_TYPECODES = 'BHIQ'
+SIGNED_TYPECODES = 'bhiq'
+TYPECODES = UNSIGNED_TYPECODES + SIGNED_TYPECODES
+
+ALIGNMENT = 8
+
+NEEDS_BYTESWAP = sys.byteorder != 'little'
+
+
+class Layout(NamedTuple):
+    """
+    Locations of parts within the encoded bytes.
+    """
+    #: Number of nodes
+    node_count: int
+
+    #: Attribute name, array type code, and byte offset of each column
+    columns: list[tuple[str, str, int]]
+
+    #: Byte ranges of the string table and of the pattern table
+    strings_range: tuple[int, int]
+    patterns_range: tuple[int, int]
+
+
+def encode(flat_tree: FlatTree) -> bytes:
+    """
+    Encodes the flat tree into bytes.
+    """
+    columns = [getattr(flat_tree, name) for name in COLUMNS]
+    typecodes = [narrowest_typecode(column) for column in columns]
+    patterns = b''.join(pattern.encode('utf-8') + b'\0' for pattern in flat_tree.patterns)
+    chunks = [HEADER.pack(
+        MAGIC, FORMAT_VERSION,
+        len(flat_tree), len(flat_tree.strings), len(patterns),
+        ''.join(typecodes).encode('ascii'),
+    ), bytes(_padding(HEADER.size))]
+    for column, typecode in zip(columns, typecodes):
+        if column.typecode != typecode:
+            column = array(typecode, column)
+        if NEEDS_BYTESWAP:  # pragma: no cover
+            column = array(typecode, column)
+            column.byteswap()
+        data = column.tobytes()
+        chunks.append(data)
+        chunks.append(bytes(_padding(len(data))))
+    chunks.append(flat_tree.strings)
+    chunks.append(patterns)
+    return b''.join(chunks)
+
+
+def decode(data: Union[bytes, bytearray, memoryview]) -> FlatTree:
+    """
+    Decodes bytes (produced by :func:`encode`) back into the flat tree.
+    """
+    layout = read_layout(data)
+    data = memoryview(data)
+    flat_tree = FlatTree()
+    for name, typecode, offset in layout.columns:
+        column = array(typecode)
+        column.frombytes(data[offset:offset + layout.node_count * column.itemsize])
+        if NEEDS_BYTESWAP:  # pragma: no cover
+            column.byteswap()
+        setattr(flat_tree, name, column)
+    flat_tree.strings = bytes(data[slice(*layout.strings_range)])
+    flat_tree.patterns = str(data[slice(*layout.patterns_range)], 'utf-8').split('\0')[:-1]
+    return flat_tree
+
+
+def read_layout(data: Union[bytes, bytearray, memoryview]) -> Layout:
+    """
+    Validates the header of the encoded bytes and computes the layout.
+    """
+    if len(data) < PREAMBLE.size:
+        raise ValueError("truncated binary parsed tree")
+    magic, version = PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a binary parsed tree")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary parsed tree format version {version}")
+    if len(data) < HEADER.size:
+        raise ValueError("truncated binary parsed tree")
+    _, _, node_count, strings_size, patterns_size, typecodes = HEADER.unpack_from(data)
+    typecodes = typecodes.decode('ascii', 'replace')
+    if not all(typecode in TYPECODES for typecode in typecodes):
+        raise ValueError("invalid column type codes of binary parsed tree")
+
+    offset = HEADER.size + _padding(HEADER.size)
+    columns = []
+    for name, typecode in zip(COLUMNS, typecodes):
+        columns.append((name, typecode, offset))
+        size = node_count * array(typecode).itemsize
+        offset += size + _padding(size)
+    strings_range = offset, offset + strings_size
+    patterns_range = strings_range[1], strings_range[1] + patterns_size
+    if len(data) != patterns_range[1]:
+        raise ValueError("truncated binary parsed tree")
+    return Layout(node_count, columns, strings_range, patterns_range)
+
+
+def narrowest_typecode(column: array) -> str:
+    """
+    Finds the array type code of the narrowest integer type
+    which holds all values of the given column.
+    """
+    low, high = min(column, default=0), max(column, default=0)
+    signed = low < 0
+    for typecode in SIGNED_TYPECODES if signed else UNSIGNED_TYPECODES:
+        bits = 8 * array(typecode).itemsize - signed
+        if -2 ** bits <= low and high < 2 ** bits:
+            return typecode
+    raise OverflowError("column values out of range of 64-bit integers")
+
+
+def _padding(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def dumps(tree: Token) -> bytes:
+    """
+    Serializes the parsed tree into bytes.
+    """
+    return encode(FlatTree.from_tree(tree))
+
+
+def loads(data: Union[bytes, bytearray, memoryview]) -> Token:
+    """
+    Deserializes bytes (produced by :func:`dumps`) back into the parsed tree.
+    """
+    return decode(data).to_tree()
+
+
+def dump(tree: Token, fobj: BinaryIO):
+    """
+    Serializes the parsed tree into the binary file object.
+    """
+    fobj.write(dumps(tree))
+
+
+def load(fobj: BinaryIO) -> Token:
+    """
+    Deserializes the parsed tree from the binary file object.
+    """
+    return loads(fobj.read())
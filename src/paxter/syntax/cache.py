@@ -0,0 +1,152 @@
+"""
+On-disk cache of parsed trees in the binary encoding
+(see :mod:`paxter.syntax.binary`) keyed by the content of source text.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import paxter
+from paxter.syntax import binary
+from paxter.syntax.data import FragmentSeq
+from paxter.syntax.flat import FlatTree, KIND_FRAGMENT_SEQ
+from paxter.syntax.task import ParsingTask
+
+__all__ = ['ParseCache']
+
+CACHE_FILE_SUFFIX = '.pxtree'
+
+
+@dataclass
+class ParseCache:
+    """
+    Persistent cache of parsed trees stored as files under the given directory.
+    Each entry is keyed by the hash of the source text
+    together with the paxter version and the binary format version,
+    so stale entries are never used after upgrading::
+
+        parse_cache = ParseCache('.paxter-cache')
+        parsed_tree = parse_cache.parse(src_text)
+
+    Entries are written atomically, hence the cache directory
+    may be shared by concurrent processes.
+
+    Building node objects takes most of the time of loading an entry.
+    If ``flat`` is set, :meth:`parse` and :meth:`get` return parsed trees
+    in the columnar representation (see :class:`paxter.syntax.FlatTree`) instead,
+    whose nodes may then be read through lazy views
+    (see :func:`paxter.syntax.mapped.view_node`).
+    """
+    #: Path to the cache directory (which is created on demand)
+    directory: str
+
+    #: Numbers of cache hits and misses by :meth:`get`
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def parse(self, src_text: str, flat: bool = False) -> Union[FragmentSeq, FlatTree]:
+        """
+        Returns the cached parsed tree of the source text if available.
+        Otherwise, parses the source text and stores the result into the cache.
+        """
+        parsed_tree = self.get(src_text, flat)
+        if parsed_tree is None:
+            task = ParsingTask(src_text)
+            parsed_tree = task.parse_flat() if flat else task.parse()
+            self.put(src_text, parsed_tree)
+        return parsed_tree
+
+    def get(self, src_text: str, flat: bool = False) -> Optional[Union[FragmentSeq, FlatTree]]:
+        """
+        Loads the cached parsed tree of the source text,
+        or returns :const:`None` if it is absent (or unreadable).
+        Entries which cannot be decoded (such as truncated or corrupted files)
+        are also treated as absent and are removed from the cache.
+        """
+        path = self.path(src_text)
+        try:
+            with open(path, 'rb') as fobj:
+                data = fobj.read()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            if flat:
+                parsed_tree = binary.decode(data)
+                _check_flat_tree(parsed_tree)
+            else:
+                parsed_tree = binary.loads(data)
+                if not isinstance(parsed_tree, FragmentSeq):
+                    raise ValueError("cached parsed tree is not a fragment sequence")
+        except Exception:
+            self.misses += 1
+            self._discard(path)
+            return None
+        self.hits += 1
+        return parsed_tree
+
+    def put(self, src_text: str, parsed_tree: Union[FragmentSeq, FlatTree]):
+        """
+        Stores the parsed tree of the source text
+        (in either representation) into the cache.
+        """
+        if not isinstance(parsed_tree, FlatTree):
+            parsed_tree = FlatTree.from_tree(parsed_tree)
+        path = self.path(src_text)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fobj:
+                fobj.write(binary.encode(parsed_tree))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _discard(path: str):
+        """
+        Removes the cache file at the given path if possible.
+        """
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def path(self, src_text: str) -> str:
+        """
+        Path to the cache file of the given source text.
+        """
+        key = self.key(src_text)
+        return os.path.join(self.directory, key[:2], key + CACHE_FILE_SUFFIX)
+
+    @staticmethod
+    def key(src_text: str) -> str:
+        """
+        Computes the cache key of the given source text.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(f'{paxter.__version__}:{binary.FORMAT_VERSION}:'.encode('utf-8'))
+        hasher.update(src_text.encode('utf-8', 'surrogatepass'))
+        return hasher.hexdigest()
+
+
+def _check_flat_tree(flat_tree: FlatTree):
+    """
+    Validates the cached flat tree as far as it can be done without visiting each node,
+    as the flat tree would otherwise fail only upon access to invalid nodes.
+    """
+    node_count = len(flat_tree)
+    if not node_count or flat_tree.kinds[0] != KIND_FRAGMENT_SEQ:
+        raise ValueError("cached parsed tree is not a fragment sequence")
+    if max(flat_tree.child_starts) > node_count or min(flat_tree.child_starts) < 1:
+        raise ValueError("invalid child index in cached parsed tree")
+    if max(flat_tree.str_ends) > len(flat_tree.strings):
+        raise ValueError("invalid string offset in cached parsed tree")
+    if max(flat_tree.enclosings) >= len(flat_tree.patterns):
+        raise ValueError("invalid pattern index in cached parsed tree")
+    flat_tree.strings.decode('utf-8')
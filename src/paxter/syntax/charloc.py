@@ -4,7 +4,38 @@ of the input text into 1-indexed line number and column number.
 """
 from __future__ import annotations
 
+import bisect
 from dataclasses import InitVar, dataclass, field
+from typing import Optional
+
+__all__ = ['CharLoc', 'LineIndex']
+
+
+@dataclass
+class LineIndex:
+    """
+    Precomputed starting positions of all lines within the input text
+    so that line and column values of any position
+    are looked up in logarithmic time.
+    """
+    src_text: InitVar[str]
+
+    #: Starting position of each line in ascending order
+    line_starts: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self, src_text: str):
+        self.line_starts = [0]
+        newline_pos = src_text.find('\n')
+        while newline_pos >= 0:
+            self.line_starts.append(newline_pos + 1)
+            newline_pos = src_text.find('\n', newline_pos + 1)
+
+    def locate(self, pos: int) -> tuple[int, int]:
+        """
+        Converts the given position into 1-indexed line and column values.
+        """
+        line = bisect.bisect_right(self.line_starts, pos)
+        return line, pos - self.line_starts[line - 1] + 1
 
 
 @dataclass
@@ -13,9 +44,14 @@ class CharLoc:
     Represents the position (starting or ending) of a token
     within the input text as a 1-indexed line and column value
     which is useful in understanding where an error occurs.
+
+    If the line index of the input text is provided,
+    it is used to look up the line and column values
+    instead of scanning the input text up to the position.
     """
     src_text: InitVar[str]
     pos: InitVar[int]
+    line_index: InitVar[Optional[LineIndex]] = None
 
     #: 1-index line number
     line: int = field(init=False)
@@ -23,7 +59,10 @@ class CharLoc:
     #: 1-index column index value
     col: int = field(init=False)
 
-    def __post_init__(self, src_text: str, pos: int):
+    def __post_init__(self, src_text: str, pos: int, line_index: Optional[LineIndex]):
+        if line_index is not None:
+            self.line, self.col = line_index.locate(pos)
+            return
         self.line = src_text.count('\n', 0, pos) + 1
         try:
             self.col = pos - src_text.rindex('\n', 0, pos)
@@ -1,12 +1,21 @@
 """
 Variable collection of character sets as defined by Paxter language.
 They are used to construct tokenizers for language syntax.
+
+Scanning the entire Unicode code space to classify characters is slow,
+so character sets are assembled from precomputed code point ranges
+(stored in :mod:`paxter.syntax._chartables`) whenever such ranges exist
+for the Unicode database version of the running Python interpreter.
+Otherwise, the code space is scanned once at import time.
 """
 from __future__ import annotations
 
+import os
 import re
 import sys
 import unicodedata
+from collections.abc import Iterable
+from typing import Optional, Tuple
 
 ID_START_CATEGORIES = ['Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nl']
 ID_CONT_CATEGORIES = ID_START_CATEGORIES + ['Mn', 'Mc', 'Nd', 'Pc']
@@ -14,28 +23,198 @@ SYMBOL_CATEGORIES = ['Ps', 'Pe', 'Pi', 'Pf', 'Pd', 'Po', 'Sc', 'Sk', 'Sm', 'So']
 OP_CATEGORIES = ['Pd', 'Po', 'Sc', 'Sk', 'Sm', 'So']
 OP_BANNED_CHARS = [',', ';', '@', '#', '"']
 
-ID_START_CHARS = ''.join(
-    c for c in map(chr, range(sys.maxunicode + 1))
-    if unicodedata.category(c) in ID_START_CATEGORIES or c == '_'
-)
-ID_CONT_CHARS = ''.join(
-    c for c in map(chr, range(sys.maxunicode + 1))
-    if unicodedata.category(c) in ID_CONT_CATEGORIES or c == '_'
-)
-SYMBOL_CHARS = ''.join(
-    c for c in map(chr, range(sys.maxunicode + 1))
-    if unicodedata.category(c) in SYMBOL_CATEGORIES
-)
-OP_CHARS = ''.join(
-    c for c in map(chr, range(sys.maxunicode + 1))
-    if unicodedata.category(c) in OP_CATEGORIES and c not in OP_BANNED_CHARS
-)
-
-IDENTIFIER_PATTERN = f'[{re.escape(ID_START_CHARS)}][{re.escape(ID_CONT_CHARS)}]*'
-SYMBOL_PATTERN = f'[{re.escape(SYMBOL_CHARS)}]'
-OPERATOR_PATTERN = f'[,;]|[{re.escape(OP_CHARS)}]+'
+#: Names of character sets whose code point ranges are precomputed
+CHARSET_NAMES = ['ID_START', 'ID_CONT', 'SYMBOL', 'OP']
+
+CodePointRanges = Tuple[Tuple[int, int], ...]
+
+
+def scan_ranges() -> dict[str, CodePointRanges]:
+    """
+    Scans the entire Unicode code space exactly once
+    and computes the inclusive code point ranges of every character set
+    listed in :const:`CHARSET_NAMES`.
+    """
+    ranges = {name: [] for name in CHARSET_NAMES}
+    for cp in range(sys.maxunicode + 1):
+        c = chr(cp)
+        category = unicodedata.category(c)
+        if category in ID_START_CATEGORIES or c == '_':
+            _extend_ranges(ranges['ID_START'], cp)
+        if category in ID_CONT_CATEGORIES or c == '_':
+            _extend_ranges(ranges['ID_CONT'], cp)
+        if category in SYMBOL_CATEGORIES:
+            _extend_ranges(ranges['SYMBOL'], cp)
+        if category in OP_CATEGORIES and c not in OP_BANNED_CHARS:
+            _extend_ranges(ranges['OP'], cp)
+    return {
+        name: tuple((first, last) for first, last in name_ranges)
+        for name, name_ranges in ranges.items()
+    }
+
+
+def _extend_ranges(ranges: list[list[int]], cp: int):
+    """
+    Appends the code point to the list of ranges
+    assuming that code points are added in increasing order.
+    """
+    if ranges and ranges[-1][1] == cp - 1:
+        ranges[-1][1] = cp
+    else:
+        ranges.append([cp, cp])
+
+
+def load_ranges() -> dict[str, CodePointRanges]:
+    """
+    Loads the precomputed code point ranges of every character set
+    for the Unicode database version of the running interpreter,
+    falling back to :func:`scan_ranges` if they are not available.
+    """
+    from paxter.syntax._chartables import RANGES_BY_UNIDATA_VERSION
+
+    try:
+        flat_ranges = RANGES_BY_UNIDATA_VERSION[unicodedata.unidata_version]
+    except KeyError:  # pragma: no cover
+        return scan_ranges()
+    return {
+        name: tuple(zip(flat[0::2], flat[1::2]))
+        for name, flat in flat_ranges.items()
+    }
+
+
+def chars_from_ranges(ranges: CodePointRanges) -> str:
+    """
+    Expands code point ranges into a string of all characters within them.
+    """
+    return ''.join(
+        map(chr, (cp for first, last in ranges for cp in range(first, last + 1))),
+    )
+
+
+def char_class(ranges: CodePointRanges) -> str:
+    """
+    Renders code point ranges into a regular expression character class
+    in which consecutive code points are collapsed into ``first-last`` form.
+    """
+    items = []
+    for first, last in ranges:
+        if first == last:
+            items.append(re.escape(chr(first)))
+        else:
+            items.append(f'{re.escape(chr(first))}-{re.escape(chr(last))}')
+    return f"[{''.join(items)}]"
+
+
+def regenerate_chartables(path: Optional[str] = None):  # pragma: no cover
+    """
+    Rewrites the module :mod:`paxter.syntax._chartables`
+    after adding (or replacing) code point ranges computed
+    for the Unicode database version of the running interpreter.
+    Ranges for other Unicode versions are kept intact.
+
+    This function should be run under every supported Python version
+    whose Unicode database differs from the others.
+    """
+    from paxter.syntax._chartables import RANGES_BY_UNIDATA_VERSION
+
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_chartables.py')
+    all_ranges = {
+        **RANGES_BY_UNIDATA_VERSION,
+        unicodedata.unidata_version: {
+            name: tuple(cp for pair in name_ranges for cp in pair)
+            for name, name_ranges in scan_ranges().items()
+        },
+    }
+    with open(path, 'w') as fobj:
+        fobj.write(_render_chartables(all_ranges))
+
+
+def _render_chartables(
+        all_ranges: dict[str, dict[str, tuple[int, ...]]],
+) -> str:  # pragma: no cover
+    """
+    Renders the python source code of :mod:`paxter.syntax._chartables`.
+    """
+    lines = [
+        '"""',
+        'Precomputed inclusive code point ranges of the character sets',
+        'defined in :mod:`paxter.syntax.charset`, keyed by the version',
+        'of the Unicode database from which they were computed.',
+        'Each range is flattened into two consecutive integers (first, last).',
+        '',
+        'This file is generated by :func:`paxter.syntax.charset.regenerate_chartables`;',
+        'do not edit by hand.',
+        '"""',
+        'RANGES_BY_UNIDATA_VERSION = {',
+    ]
+    for version in sorted(all_ranges, key=_version_key):
+        lines.append(f'    {version!r}: {{')
+        for name in CHARSET_NAMES:
+            lines.append(f'        {name!r}: (')
+            lines.extend(_render_code_points(all_ranges[version][name]))
+            lines.append('        ),')
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def _render_code_points(flat: Iterable[int], per_line: int = 8) -> list[str]:  # pragma: no cover
+    """
+    Renders a flattened sequence of code point ranges into lines of source code.
+    """
+    flat = list(flat)
+    return [
+        '            ' + ' '.join(f'0x{cp:04x},' for cp in flat[i:i + per_line])
+        for i in range(0, len(flat), per_line)
+    ]
+
+
+def _version_key(version: str) -> tuple[int, ...]:  # pragma: no cover
+    return tuple(int(part) for part in version.split('.'))
+
+
+_RANGES = load_ranges()
+
+ID_START_RANGES = _RANGES['ID_START']
+ID_CONT_RANGES = _RANGES['ID_CONT']
+SYMBOL_RANGES = _RANGES['SYMBOL']
+OP_RANGES = _RANGES['OP']
+
+IDENTIFIER_PATTERN = f'{char_class(ID_START_RANGES)}{char_class(ID_CONT_RANGES)}*'
+SYMBOL_PATTERN = char_class(SYMBOL_RANGES)
+OPERATOR_PATTERN = f'[,;]|{char_class(OP_RANGES)}+'
+
+ID_START_CHARS: str
+ID_CONT_CHARS: str
+SYMBOL_CHARS: str
+OP_CHARS: str
+
+#: Mapping from names of character strings (which are computed only on demand)
+#: to the code point ranges from which they are expanded
+_LAZY_CHARS = {
+    'ID_START_CHARS': ID_START_RANGES,
+    'ID_CONT_CHARS': ID_CONT_RANGES,
+    'SYMBOL_CHARS': SYMBOL_RANGES,
+    'OP_CHARS': OP_RANGES,
+}
+
+
+def __getattr__(name: str) -> str:
+    """
+    Expands character strings of each character set lazily upon first access
+    since they are no longer needed to construct the patterns.
+    """
+    try:
+        ranges = _LAZY_CHARS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    chars = globals()[name] = chars_from_ranges(ranges)
+    return chars
+
 
 __all__ = [
+    'ID_START_RANGES', 'ID_CONT_RANGES', 'SYMBOL_RANGES', 'OP_RANGES',
     'ID_START_CHARS', 'ID_CONT_CHARS', 'SYMBOL_CHARS', 'OP_CHARS',
     'IDENTIFIER_PATTERN', 'SYMBOL_PATTERN', 'OPERATOR_PATTERN',
 ]
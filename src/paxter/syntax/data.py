@@ -8,9 +8,11 @@ from abc import ABCMeta
 from dataclasses import dataclass, field
 from typing import Any, Match, Optional, TypeVar, Union
 
+from paxter.syntax._slots import slotted
 from paxter.syntax.enclosing import EnclosingPattern
 
 
+@slotted
 @dataclass
 class Token(metaclass=ABCMeta):
     """
@@ -61,6 +63,7 @@ class Token(metaclass=ABCMeta):
 T = TypeVar('T', bound=Token)
 
 
+@slotted
 @dataclass
 class Fragment(Token, metaclass=ABCMeta):
     """
@@ -70,6 +73,7 @@ class Fragment(Token, metaclass=ABCMeta):
     pass
 
 
+@slotted
 @dataclass
 class TokenSeq(Token):
     """
@@ -83,6 +87,7 @@ class TokenSeq(Token):
     sanitize = None
 
 
+@slotted
 @dataclass
 class Identifier(Token):
     """
@@ -93,6 +98,7 @@ class Identifier(Token):
     name: str
 
 
+@slotted
 @dataclass
 class Operator(Token):
     """
@@ -103,6 +109,7 @@ class Operator(Token):
     symbols: str
 
 
+@slotted
 @dataclass
 class Number(Token):
     """
@@ -117,6 +124,7 @@ class Number(Token):
         return json.loads(value)
 
 
+@slotted
 @dataclass
 class FragmentSeq(Token):
     """
@@ -137,6 +145,7 @@ class FragmentSeq(Token):
     sanitize = None
 
 
+@slotted
 @dataclass
 class Text(Fragment):
     """
@@ -155,6 +164,53 @@ class Text(Fragment):
     enclosing: EnclosingPattern
 
 
+class LazyText(Text):
+    """
+    Text node which keeps a reference to the shared source text
+    instead of its own copy of the inner string content.
+    The inner content (i.e. ``src_text[start_pos:end_pos]``) is sliced
+    from the source text only upon access.
+
+    Nodes of this type are created by parsing tasks with ``lazy_texts`` enabled
+    and they compare equal to (and are represented just like)
+    :class:`Text` nodes with the same inner content and enclosing pattern.
+    """
+    __slots__ = ('src_text',)
+
+    #: Source text containing the inner string content
+    src_text: str
+
+    def __init__(
+            self, start_pos: int, end_pos: int,
+            src_text: str, enclosing: EnclosingPattern,
+    ):
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self.src_text = src_text
+        self.enclosing = enclosing
+
+    @property
+    def inner(self) -> str:
+        return self.src_text[self.start_pos:self.end_pos]
+
+    def __eq__(self, other):
+        if not isinstance(other, Text):
+            return NotImplemented
+        return (self.inner, self.enclosing) == (other.inner, other.enclosing)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f'Text(start_pos={self.start_pos!r}, end_pos={self.end_pos!r}, '
+            f'inner={self.inner!r}, enclosing={self.enclosing!r})'
+        )
+
+    def __reduce__(self):
+        return LazyText, (self.start_pos, self.end_pos, self.src_text, self.enclosing)
+
+
+@slotted
 @dataclass
 class Command(Fragment):
     """
@@ -193,3 +249,17 @@ class Command(Fragment):
     #: The main argument section at the end of expression,
     #: or :const:`None` if this section is not present.
     main_arg: Optional[Union[FragmentSeq, Text]]
+
+
+@slotted
+@dataclass
+class ErrorFragment(Fragment):
+    """
+    Node type which represents a portion of the input text
+    that is skipped by the error-recovering parser
+    (see :class:`RecoveringParsingTask <paxter.syntax.RecoveringParsingTask>`)
+    in order to resume parsing after a syntax error.
+    It never appears in parsed trees which are free of syntax errors.
+    """
+    #: Skipped input text
+    inner: str
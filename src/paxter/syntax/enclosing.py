@@ -9,10 +9,12 @@ It is used in the following scenarios:
 """
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass, field
-from typing import Pattern
+from typing import Optional, Pattern
 
+from paxter.syntax._slots import slotted
 from paxter.syntax.lexers import _LEXER
 
 __all__ = ['EnclosingPattern', 'GlobalEnclosingPattern']
@@ -20,12 +22,21 @@ __all__ = ['EnclosingPattern', 'GlobalEnclosingPattern']
 ALLOWED_LEFT_PATTERN_RE = re.compile(r'(?:#*[|{"])?')
 LEFT_TO_RIGHT_TRANS = str.maketrans(r'#|{"', r'#|}"')
 
+#: Maximum number of distinct enclosing patterns shared via
+#: :meth:`EnclosingPattern.interned`
+INTERNED_CACHE_SIZE = 256
 
-@dataclass
+
+@slotted
+@dataclass(frozen=True)
 class EnclosingPattern:
     """
     Information regarding the enclosing (left and right) patterns
     for a particular scope of string data.
+
+    Instances are immutable; parsers share a single instance
+    for each distinct left pattern (see :meth:`interned`)
+    across all nodes of the parsed trees.
     """
     #: The left (i.e. opening) pattern enclosing the scope
     left: str
@@ -35,11 +46,19 @@ class EnclosingPattern:
 
     def __post_init__(self):
         if self.right is None:
-            self.right = self.flip_pattern(self.left)
+            object.__setattr__(self, 'right', self.flip_pattern(self.left))
 
     def __bool__(self):
         return bool(self.left)
 
+    @staticmethod
+    def interned(left: str) -> EnclosingPattern:
+        """
+        Returns the shared instance with the given left pattern
+        (and the corresponding right pattern).
+        """
+        return _interned_enclosing_pattern(left)
+
     @staticmethod
     def flip_pattern(left: str) -> str:
         """
@@ -69,8 +88,25 @@ class EnclosingPattern:
         """
         return _LEXER.rec_break_re(self.right)
 
+    def find_non_rec_break(self, src_text: str, pos: int) -> Optional[tuple[int, str]]:
+        """
+        Finds the enclosing right pattern in the source text
+        starting from the given position.
+        See :meth:`Lexer.find_non_rec_break() <paxter.syntax.lexers.Lexer.find_non_rec_break>`.
+        """
+        return _LEXER.find_non_rec_break(src_text, pos, self.right)
 
-@dataclass
+    def find_rec_break(self, src_text: str, pos: int) -> Optional[tuple[int, str]]:
+        """
+        Finds either the @-command switch symbol or the enclosing right pattern
+        in the source text starting from the given position.
+        See :meth:`Lexer.find_rec_break() <paxter.syntax.lexers.Lexer.find_rec_break>`.
+        """
+        return _LEXER.find_rec_break(src_text, pos, self.right)
+
+
+@slotted
+@dataclass(frozen=True)
 class GlobalEnclosingPattern(EnclosingPattern):
     """
     Specialized scope pattern just for global-level fragment sequence.
@@ -79,7 +115,8 @@ class GlobalEnclosingPattern(EnclosingPattern):
     right: str = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
-        pass
+        object.__setattr__(self, 'left', None)
+        object.__setattr__(self, 'right', None)
 
     @property
     def non_rec_break_re(self) -> Pattern[str]:
@@ -88,3 +125,14 @@ class GlobalEnclosingPattern(EnclosingPattern):
     @property
     def rec_break_re(self) -> Pattern[str]:
         return _LEXER.global_break_re
+
+    def find_non_rec_break(self, src_text: str, pos: int) -> Optional[tuple[int, str]]:
+        raise AttributeError
+
+    def find_rec_break(self, src_text: str, pos: int) -> Optional[tuple[int, str]]:
+        return _LEXER.find_global_break(src_text, pos)
+
+
+@functools.lru_cache(maxsize=INTERNED_CACHE_SIZE)
+def _interned_enclosing_pattern(left: str) -> EnclosingPattern:
+    return EnclosingPattern(left)
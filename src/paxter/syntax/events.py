@@ -0,0 +1,313 @@
+"""
+Event-based variant of the syntax of Paxter language
+which reports the structure of source text as a flat stream of events
+instead of building the parsed tree.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Callable, Match, NamedTuple, Optional, Union
+
+from paxter.syntax.data import Identifier, Number, Operator, Token
+from paxter.syntax.enclosing import EnclosingPattern, GlobalEnclosingPattern
+from paxter.syntax.task import (
+    ParsingTask, Phrase, STEP_COMMAND, STEP_FRAGMENT_SEQ, STEP_NODE, STEP_TOKEN_SEQ, _EMPTY_ENCLOSING,
+)
+
+__all__ = [
+    'Event', 'EventParsingTask',
+    'START_FRAGMENT_SEQ', 'END_FRAGMENT_SEQ', 'START_COMMAND', 'END_COMMAND',
+    'START_OPTIONS', 'END_OPTIONS', 'TEXT', 'IDENTIFIER', 'OPERATOR', 'NUMBER', 'ERROR',
+]
+
+#: Kinds of events, each of which is also the name of the handler method
+#: invoked by :meth:`EventParsingTask.dispatch`
+START_FRAGMENT_SEQ = 'start_fragment_seq'
+END_FRAGMENT_SEQ = 'end_fragment_seq'
+START_COMMAND = 'start_command'
+END_COMMAND = 'end_command'
+START_OPTIONS = 'start_options'
+END_OPTIONS = 'end_options'
+TEXT = 'text'
+IDENTIFIER = 'identifier'
+OPERATOR = 'operator'
+NUMBER = 'number'
+ERROR = 'error'
+
+
+class Event(NamedTuple):
+    """
+    A single parsing event. Events of ``start_*`` kinds do not know
+    their ending positions yet, hence ``end_pos`` is :const:`None`.
+    """
+    #: Kind of event (such as :const:`START_COMMAND`)
+    kind: str
+
+    #: The index of the starting position of the corresponding node
+    start_pos: int
+
+    #: The index right after the ending position of the corresponding node
+    end_pos: Optional[int]
+
+    #: The phrase of a command, the inner string of a text,
+    #: the name of an identifier, the symbols of an operator,
+    #: the value of a number, or the skipped input text of an error
+    #: (and :const:`None` for other kinds)
+    value: Any = None
+
+    #: Information of the enclosing pattern of a fragment sequence or a text,
+    #: or of the phrase of a command (and :const:`None` for other kinds)
+    enclosing: Optional[EnclosingPattern] = None
+
+
+class _FragmentSeqFrame:
+    """
+    Fragment sequence currently being parsed.
+    """
+    __slots__ = ('start_pos', 'enclosing')
+
+    def __init__(self, start_pos: int, enclosing: EnclosingPattern):
+        self.start_pos = start_pos
+        self.enclosing = enclosing
+
+
+class _TokenSeqFrame:
+    """
+    Token sequence (i.e. the options section) currently being parsed.
+    """
+    __slots__ = ('start_pos',)
+
+    def __init__(self, start_pos: int):
+        self.start_pos = start_pos
+
+
+class _CommandFrame:
+    """
+    Command currently being parsed whose phrase section has already been parsed.
+    """
+    __slots__ = ('start_pos', 'has_sections', 'stage')
+
+    #: Stage right after the phrase section
+    AFTER_PHRASE = 0
+    #: Stage waiting for (or right after) the options section
+    AFTER_OPTIONS = 1
+    #: Stage right after the main argument section
+    AFTER_MAIN_ARG = 2
+
+    def __init__(self, start_pos: int, has_sections: bool):
+        self.start_pos = start_pos
+        self.has_sections = has_sections
+        self.stage = self.AFTER_PHRASE
+
+
+_Frame = Union[_FragmentSeqFrame, _TokenSeqFrame, _CommandFrame]
+_Emit = Callable[[Event], None]
+
+#: Kind of event reporting each type of token node without children
+_TOKEN_EVENT_KINDS = {Identifier: IDENTIFIER, Operator: OPERATOR, Number: NUMBER}
+
+
+@dataclass
+class EventParsingTask(ParsingTask):
+    """
+    Implements the same syntax as :class:`ParsingTask` but,
+    rather than building the parsed tree, generates a stream of :class:`Event`
+    in the order of a depth-first traversal of the would-be parsed tree::
+
+        for event in EventParsingTask(src_text).iter_events():
+            if event.kind == START_COMMAND:
+                ...
+
+    Each node with children is reported by a pair of ``start_*`` and ``end_*``
+    events (wrapping the events of its children) whereas
+    other nodes are reported by a single event.
+    The main argument of a command (if present) is the last child
+    between its ``start_command`` and ``end_command`` events.
+
+    Events are generated lazily without creating any node:
+    the lexing steps shared with :class:`ParsingTask` create events
+    instead of nodes without children through the overridden factory methods
+    (such as :meth:`_text_node`).
+    Like :class:`IterativeParsingTask`, the nesting depth is not limited
+    by the Python recursion limit.
+    If the source text is malformed, :exc:`PaxterSyntaxError` is raised
+    after generating the events preceding the error
+    (unless combined with :class:`RecoveringParsingTask`,
+    in which case skipped input text is reported by :const:`ERROR` events).
+    """
+
+    def iter_events(self) -> Iterator[Event]:
+        """
+        Generates parsing events of the source text in order.
+        """
+        pending: list[Event] = []
+        stack = self._start(pending.append)
+        next_pos = 0
+        while stack:
+            next_pos = self._advance(next_pos, stack, pending.append)
+            yield from pending
+            pending.clear()
+        yield from pending
+
+    def dispatch(self, handler: Any):
+        """
+        Invokes the method of the given handler object named after the kind
+        of each event (such as ``handler.start_command(event)``) in order.
+        Events whose kinds have no corresponding methods are skipped.
+        """
+        methods = {}
+
+        def emit(event: Event):
+            try:
+                method = methods[event.kind]
+            except KeyError:
+                method = methods[event.kind] = getattr(handler, event.kind, None)
+            if method is not None:
+                method(event)
+
+        stack = self._start(emit)
+        next_pos = 0
+        while stack:
+            next_pos = self._advance(next_pos, stack, emit)
+
+    def _start(self, emit: _Emit) -> list[_Frame]:
+        """
+        Emits the event for the beginning of the global-level fragment sequence
+        and returns the initial stack of frames.
+        """
+        enclosing = GlobalEnclosingPattern()
+        emit(Event(START_FRAGMENT_SEQ, 0, None, None, enclosing))
+        return [_FragmentSeqFrame(0, enclosing)]
+
+    def _advance(self, next_pos: int, stack: list[_Frame], emit: _Emit) -> int:
+        """
+        Advances the frame at the top of the stack by a single step,
+        during which frames may be pushed onto or popped from the stack.
+        Returns the next position.
+        """
+        frame = stack[-1]
+        if isinstance(frame, _FragmentSeqFrame):
+            return self._advance_fragment_seq(next_pos, frame, stack, emit)
+        if isinstance(frame, _TokenSeqFrame):
+            return self._advance_token_seq(next_pos, frame, stack, emit)
+        return self._advance_cmd(next_pos, frame, stack, emit)
+
+    def _advance_fragment_seq(
+            self,
+            next_pos: int,
+            frame: _FragmentSeqFrame,
+            stack: list[_Frame],
+            emit: _Emit,
+    ) -> int:
+        """
+        Parses a possibly empty text followed by either an @-expression
+        or the closing (i.e. right) pattern of the fragment sequence.
+        """
+        text_end_pos, after_pos, end_pos = self._lex_fragment_seq_step(
+            next_pos, frame.start_pos, frame.enclosing,
+        )
+        if text_end_pos > next_pos:
+            emit(self._text_node(next_pos, text_end_pos, _EMPTY_ENCLOSING))
+        if end_pos is None:
+            return self._start_cmd(after_pos, stack, emit)
+        stack.pop()
+        emit(Event(END_FRAGMENT_SEQ, frame.start_pos, end_pos, None, frame.enclosing))
+        return after_pos
+
+    def _start_cmd(self, next_pos: int, stack: list[_Frame], emit: _Emit) -> int:
+        """
+        Parses the phrase section of an @-expression
+        starting from immediately after @-symbol
+        and pushes the command frame to parse the remaining sections.
+        """
+        next_pos, phrase = self._lex_phrase(next_pos)
+        if not isinstance(phrase, Phrase):
+            emit(phrase)
+            return next_pos
+        emit(Event(START_COMMAND, phrase.start_pos, None, phrase.phrase, phrase.enclosing))
+        stack.append(_CommandFrame(phrase.start_pos, phrase.has_sections))
+        return next_pos
+
+    def _advance_cmd(
+            self,
+            next_pos: int,
+            frame: _CommandFrame,
+            stack: list[_Frame],
+            emit: _Emit,
+    ) -> int:
+        """
+        Continues parsing the command after the phrase section
+        or after the options section.
+        """
+        if frame.stage != frame.AFTER_MAIN_ARG and frame.has_sections:
+            allow_options = frame.stage == frame.AFTER_PHRASE
+            next_pos, kind, value = self._lex_cmd_section(next_pos, allow_options)
+            if kind == STEP_TOKEN_SEQ:
+                frame.stage = frame.AFTER_OPTIONS
+                emit(Event(START_OPTIONS, next_pos, None))
+                stack.append(_TokenSeqFrame(next_pos))
+                return next_pos
+            frame.stage = frame.AFTER_MAIN_ARG
+            if kind == STEP_FRAGMENT_SEQ:
+                return self._start_fragment_seq(next_pos, value, stack, emit)
+            if kind == STEP_NODE:
+                emit(value)
+
+        stack.pop()
+        emit(Event(END_COMMAND, frame.start_pos, next_pos))
+        return next_pos
+
+    def _advance_token_seq(
+            self,
+            next_pos: int,
+            frame: _TokenSeqFrame,
+            stack: list[_Frame],
+            emit: _Emit,
+    ) -> int:
+        """
+        Parses the next token within the options section
+        (or the end of the section).
+        """
+        next_pos, kind, value = self._lex_options_step(next_pos, frame.start_pos)
+        if kind == STEP_NODE:
+            emit(value)
+        elif kind == STEP_FRAGMENT_SEQ:
+            return self._start_fragment_seq(next_pos, value, stack, emit)
+        elif kind == STEP_COMMAND:
+            return self._start_cmd(next_pos, stack, emit)
+        elif kind == STEP_TOKEN_SEQ:
+            emit(Event(START_OPTIONS, next_pos, None))
+            stack.append(_TokenSeqFrame(next_pos))
+        else:
+            stack.pop()
+            emit(Event(END_OPTIONS, frame.start_pos, value))
+        return next_pos
+
+    def _token_node(
+            self, node_type: type[Token], matchobj: Match[str], capture_name: str,
+    ) -> Event:
+        start_pos, end_pos = matchobj.span(capture_name)
+        value = node_type.sanitize(matchobj[capture_name])
+        return Event(_TOKEN_EVENT_KINDS[node_type], start_pos, end_pos, value)
+
+    def _text_node(self, start_pos: int, end_pos: int, enclosing: EnclosingPattern) -> Event:
+        return Event(TEXT, start_pos, end_pos, self.src_text[start_pos:end_pos], enclosing)
+
+    def _error_node(self, start_pos: int, end_pos: int) -> Event:
+        return Event(ERROR, start_pos, end_pos, self.src_text[start_pos:end_pos])
+
+    @staticmethod
+    def _start_fragment_seq(
+            next_pos: int,
+            enclosing: EnclosingPattern,
+            stack: list[_Frame],
+            emit: _Emit,
+    ) -> int:
+        """
+        Pushes the frame of the fragment sequence
+        enclosed by the given brace pattern.
+        """
+        emit(Event(START_FRAGMENT_SEQ, next_pos, None, None, enclosing))
+        stack.append(_FragmentSeqFrame(next_pos, enclosing))
+        return next_pos
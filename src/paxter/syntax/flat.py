@@ -0,0 +1,293 @@
+"""
+Columnar (flat array-backed) representation of Paxter parsed trees.
+"""
+from __future__ import annotations
+
+import json
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Optional
+
+from paxter.syntax.data import (
+    Command, ErrorFragment, FragmentSeq, Identifier, Number, Operator, Text, Token, TokenSeq,
+)
+from paxter.syntax.enclosing import EnclosingPattern, GlobalEnclosingPattern
+
+__all__ = [
+    'FlatTree',
+    'KIND_FRAGMENT_SEQ', 'KIND_TOKEN_SEQ', 'KIND_TEXT', 'KIND_COMMAND',
+    'KIND_IDENTIFIER', 'KIND_OPERATOR', 'KIND_NUMBER', 'KIND_ERROR',
+    'FLAG_HAS_OPTIONS', 'FLAG_HAS_MAIN_ARG', 'FLAG_GLOBAL_ENCLOSING',
+]
+
+#: Node kinds as stored in :attr:`FlatTree.kinds`
+KIND_FRAGMENT_SEQ = 0
+KIND_TOKEN_SEQ = 1
+KIND_TEXT = 2
+KIND_COMMAND = 3
+KIND_IDENTIFIER = 4
+KIND_OPERATOR = 5
+KIND_NUMBER = 6
+KIND_ERROR = 7
+
+#: Bit flags as stored in :attr:`FlatTree.flags`
+FLAG_HAS_OPTIONS = 0x01
+FLAG_HAS_MAIN_ARG = 0x02
+FLAG_GLOBAL_ENCLOSING = 0x04
+
+#: Array type codes of position columns and of node index columns
+POS_TYPECODE = 'q'
+INDEX_TYPECODE = 'i'
+
+
+@dataclass
+class FlatTree:
+    """
+    Parsed tree stored as parallel columns of :mod:`array` buffers,
+    one entry per node, with nodes laid out in breadth-first order
+    so that the children of each node occupy a contiguous range of indices
+    which ends where the children of the next node start.
+    The root node is at index 0::
+
+        flat_tree = FlatTree.from_tree(ParsingTask(src_text).parse())
+        for index in flat_tree.children(0):
+            ...
+
+    The children of a :class:`Command` node are its options section
+    followed by its main argument, each of which is present only if
+    the corresponding flag (:const:`FLAG_HAS_OPTIONS` or
+    :const:`FLAG_HAS_MAIN_ARG`) is set.
+
+    String values (the inner content of texts, phrases of commands,
+    names of identifiers, symbols of operators, JSON literals of numbers,
+    and the skipped input text of error nodes)
+    are UTF-8 encoded into a single string table and referred to by byte offsets.
+    Enclosing patterns are referred to by indices into the list of left patterns.
+    """
+    #: Kind of each node (see ``KIND_*`` constants)
+    kinds: array = field(default_factory=lambda: array('B'))
+
+    #: Bit flags of each node (see ``FLAG_*`` constants)
+    flags: array = field(default_factory=lambda: array('B'))
+
+    #: Starting and ending positions of each node
+    start_pos: array = field(default_factory=lambda: array(POS_TYPECODE))
+    end_pos: array = field(default_factory=lambda: array(POS_TYPECODE))
+
+    #: Index of the first child of each node
+    #: (or where it would be if the node has no children)
+    child_starts: array = field(default_factory=lambda: array(INDEX_TYPECODE))
+
+    #: Byte offsets of the string value of each node within the string table
+    str_starts: array = field(default_factory=lambda: array(POS_TYPECODE))
+    str_ends: array = field(default_factory=lambda: array(POS_TYPECODE))
+
+    #: Index of the enclosing (left) pattern of each node
+    #: (-1 if not applicable or if it is the global enclosing pattern)
+    enclosings: array = field(default_factory=lambda: array(INDEX_TYPECODE))
+
+    #: UTF-8 encoded string values of all nodes
+    strings: bytes = b''
+
+    #: Distinct enclosing left patterns
+    patterns: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @classmethod
+    def from_tree(cls, tree: Token) -> FlatTree:
+        """
+        Converts the given parsed tree (or subtree) into the flat representation.
+        """
+        flat_tree = cls()
+        string_chunks: list[bytes] = []
+        string_offsets: dict[str, tuple[int, int]] = {}
+        string_size = 0
+        pattern_indices: dict[str, int] = {}
+
+        nodes: list[Token] = [tree]
+        index = 0
+        while index < len(nodes):
+            node = nodes[index]
+            kind, flags, value, enclosing, children = _decompose_node(node)
+
+            # Registers the string value into the string table
+            if value is None:
+                str_start = str_end = 0
+            elif value in string_offsets:
+                str_start, str_end = string_offsets[value]
+            else:
+                encoded = value.encode('utf-8')
+                str_start, str_end = string_size, string_size + len(encoded)
+                string_offsets[value] = str_start, str_end
+                string_chunks.append(encoded)
+                string_size = str_end
+
+            # Registers the enclosing pattern
+            if isinstance(enclosing, GlobalEnclosingPattern):
+                flags |= FLAG_GLOBAL_ENCLOSING
+                pattern_index = -1
+            elif enclosing is None:
+                pattern_index = -1
+            elif enclosing.left in pattern_indices:
+                pattern_index = pattern_indices[enclosing.left]
+            else:
+                pattern_index = pattern_indices[enclosing.left] = len(flat_tree.patterns)
+                flat_tree.patterns.append(enclosing.left)
+
+            flat_tree.kinds.append(kind)
+            flat_tree.flags.append(flags)
+            flat_tree.start_pos.append(node.start_pos)
+            flat_tree.end_pos.append(node.end_pos)
+            flat_tree.child_starts.append(len(nodes))
+            flat_tree.str_starts.append(str_start)
+            flat_tree.str_ends.append(str_end)
+            flat_tree.enclosings.append(pattern_index)
+            nodes.extend(children)
+            index += 1
+
+        flat_tree.strings = b''.join(string_chunks)
+        return flat_tree
+
+    def to_tree(self, index: int = 0) -> Token:
+        """
+        Converts the subtree rooted at the node of the given index
+        (or the entire tree by default) back into node objects.
+        """
+        # Nodes are built in reverse breadth-first order
+        # so that children are always built before their parents
+        if index == 0:
+            indices = range(len(self) - 1, -1, -1)
+        else:
+            indices = [index]
+            for node_index in indices:
+                indices.extend(self.children(node_index))
+            indices.reverse()
+
+        kinds = self.kinds.tolist()
+        flags = self.flags.tolist()
+        start_pos = self.start_pos.tolist()
+        end_pos = self.end_pos.tolist()
+        child_starts = self.child_starts.tolist()
+        child_starts.append(len(self))
+        str_starts = self.str_starts.tolist()
+        str_ends = self.str_ends.tolist()
+        enclosings = self.enclosings.tolist()
+        strings = self.strings
+        patterns = [EnclosingPattern.interned(left) for left in self.patterns]
+
+        nodes: list[Optional[Token]] = [None] * len(self)
+        for node_index in indices:
+            kind = kinds[node_index]
+            if kind == KIND_FRAGMENT_SEQ or kind == KIND_TOKEN_SEQ:
+                children = nodes[child_starts[node_index]:child_starts[node_index + 1]]
+                if kind == KIND_TOKEN_SEQ:
+                    node = TokenSeq(start_pos[node_index], end_pos[node_index], children)
+                elif flags[node_index] & FLAG_GLOBAL_ENCLOSING:
+                    node = FragmentSeq(
+                        start_pos[node_index], end_pos[node_index], children,
+                        GlobalEnclosingPattern(),
+                    )
+                else:
+                    node = FragmentSeq(
+                        start_pos[node_index], end_pos[node_index], children,
+                        patterns[enclosings[node_index]],
+                    )
+            else:
+                value = str(strings[str_starts[node_index]:str_ends[node_index]], 'utf-8')
+                if kind == KIND_TEXT:
+                    node = Text(
+                        start_pos[node_index], end_pos[node_index], value,
+                        patterns[enclosings[node_index]],
+                    )
+                elif kind == KIND_COMMAND:
+                    node_flags = flags[node_index]
+                    child_index = child_starts[node_index]
+                    options = main_arg = None
+                    if node_flags & FLAG_HAS_OPTIONS:
+                        options = nodes[child_index]
+                        child_index += 1
+                    if node_flags & FLAG_HAS_MAIN_ARG:
+                        main_arg = nodes[child_index]
+                    node = Command(
+                        start_pos[node_index], end_pos[node_index], value,
+                        patterns[enclosings[node_index]], options, main_arg,
+                    )
+                elif kind == KIND_IDENTIFIER:
+                    node = Identifier(start_pos[node_index], end_pos[node_index], value)
+                elif kind == KIND_OPERATOR:
+                    node = Operator(start_pos[node_index], end_pos[node_index], value)
+                elif kind == KIND_NUMBER:
+                    node = Number(
+                        start_pos[node_index], end_pos[node_index], Number.sanitize(value),
+                    )
+                elif kind == KIND_ERROR:
+                    node = ErrorFragment(start_pos[node_index], end_pos[node_index], value)
+                else:
+                    raise ValueError(f"unrecognized node kind: {kind}")
+            nodes[node_index] = node
+        return nodes[index]
+
+    def children(self, index: int) -> range:
+        """
+        Range of indices of the children of the node of the given index.
+        """
+        if index + 1 < len(self):
+            return range(self.child_starts[index], self.child_starts[index + 1])
+        return range(self.child_starts[index], len(self))
+
+    def string(self, index: int) -> str:
+        """
+        String value of the node of the given index
+        (or an empty string if not applicable).
+        """
+        return str(self.strings[self.str_starts[index]:self.str_ends[index]], 'utf-8')
+
+    def enclosing(self, index: int) -> Optional[EnclosingPattern]:
+        """
+        Enclosing pattern of the node of the given index
+        (i.e. the phrase enclosing pattern for commands),
+        or :const:`None` if not applicable.
+        """
+        if self.flags[index] & FLAG_GLOBAL_ENCLOSING:
+            return GlobalEnclosingPattern()
+        pattern_index = self.enclosings[index]
+        if pattern_index < 0:
+            return None
+        return EnclosingPattern.interned(self.patterns[pattern_index])
+
+
+def _decompose_node(
+        node: Token,
+) -> tuple[int, int, Optional[str], Optional[EnclosingPattern], Sequence[Token]]:
+    """
+    Extracts the kind, the flags, the string value, the enclosing pattern,
+    and the children of the given node.
+    """
+    if isinstance(node, FragmentSeq):
+        return KIND_FRAGMENT_SEQ, 0, None, node.enclosing, node.children
+    if isinstance(node, TokenSeq):
+        return KIND_TOKEN_SEQ, 0, None, None, node.children
+    if isinstance(node, Text):
+        return KIND_TEXT, 0, node.inner, node.enclosing, ()
+    if isinstance(node, Command):
+        flags = 0
+        children = []
+        if node.options is not None:
+            flags |= FLAG_HAS_OPTIONS
+            children.append(node.options)
+        if node.main_arg is not None:
+            flags |= FLAG_HAS_MAIN_ARG
+            children.append(node.main_arg)
+        return KIND_COMMAND, flags, node.phrase, node.phrase_enclosing, children
+    if isinstance(node, Identifier):
+        return KIND_IDENTIFIER, 0, node.name, None, ()
+    if isinstance(node, Operator):
+        return KIND_OPERATOR, 0, node.symbols, None, ()
+    if isinstance(node, Number):
+        return KIND_NUMBER, 0, json.dumps(node.value), None, ()
+    if isinstance(node, ErrorFragment):
+        return KIND_ERROR, 0, node.inner, None, ()
+    raise TypeError(f"unrecognized node type: {type(node).__name__}")
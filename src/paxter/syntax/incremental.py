@@ -0,0 +1,381 @@
+"""
+Utilities supporting incremental re-parsing of edited source text.
+See :meth:`ParsingTask.reparse() <paxter.syntax.task.ParsingTask.reparse>`.
+"""
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from paxter.syntax.data import Command, Fragment, FragmentSeq, LazyText, Text, Token, TokenSeq
+
+__all__ = [
+    'TextEdit', 'edit_path', 'child_index_at', 'sync_pos', 'last_sync_index', 'sync_index_at',
+    'splice_path', 'reused_nodes',
+    'shifted_copy', 'shifted_view', 'shift_positions',
+]
+
+
+@dataclass
+class TextEdit:
+    """
+    Describes a single contiguous edit of source text
+    in which ``deleted_len`` characters starting at ``offset``
+    are replaced by ``inserted_text``.
+    """
+    #: The index of the starting position of the edit
+    offset: int
+
+    #: The number of characters deleted from the original source text
+    deleted_len: int
+
+    #: The string inserted in place of the deleted characters
+    inserted_text: str
+
+    def __post_init__(self):
+        if self.offset < 0 or self.deleted_len < 0:
+            raise ValueError("offset and deleted length must be non-negative")
+
+    @property
+    def delta(self) -> int:
+        """
+        The change of the length of source text caused by the edit.
+        """
+        return len(self.inserted_text) - self.deleted_len
+
+    def apply(self, src_text: str) -> str:
+        """
+        Applies the edit to the given original source text.
+        """
+        if self.offset + self.deleted_len > len(src_text):
+            raise ValueError("edit range exceeds the source text")
+        end = self.offset + self.deleted_len
+        return ''.join([src_text[:self.offset], self.inserted_text, src_text[end:]])
+
+
+def edit_path(tree: FragmentSeq, edit: TextEdit) -> list[Token]:
+    """
+    Lists nodes from the given parsed tree down to the innermost node
+    whose span contains the entire region deleted by the edit.
+    Each node in the list is a child (or a section of a command)
+    of the node preceding it.
+    """
+    edit_end = edit.offset + edit.deleted_len
+    path: list[Token] = [tree]
+    node: Token = tree
+    while True:
+        if isinstance(node, (FragmentSeq, TokenSeq)):
+            index = child_index_at(node.children, edit.offset)
+            child = node.children[index] if index >= 0 else None
+        elif isinstance(node, Command):
+            child = node.main_arg
+            if child is None or child.start_pos > edit.offset:
+                child = node.options
+        else:
+            child = None
+        if child is None or not child.start_pos <= edit.offset <= edit_end <= child.end_pos:
+            return path
+        path.append(child)
+        node = child
+
+
+def child_index_at(children: list[Token], pos: int) -> int:
+    """
+    Finds the index of the last child starting at or before the given position
+    (or -1 if there is no such child) using binary search.
+    """
+    low, high = 0, len(children)
+    while low < high:
+        mid = (low + high) // 2
+        if children[mid].start_pos <= pos:
+            low = mid + 1
+        else:
+            high = mid
+    return low - 1
+
+
+# Parsing of a fragment sequence restarts in a fresh state at its sync points,
+# i.e. the beginning of its inner content and right after each of its child commands.
+# The sync point before the child at some index is identified by that index.
+
+def sync_pos(fragment_seq: FragmentSeq, index: int) -> int:
+    """
+    Position of the sync point of the given fragment sequence
+    right before its child at the given index.
+    """
+    if index == 0:
+        return fragment_seq.start_pos
+    return fragment_seq.children[index - 1].end_pos
+
+
+def last_sync_index(children: list[Fragment], index: int, pos: int) -> int:
+    """
+    Finds the index of the last sync point at or before the given index
+    of a child (of a fragment sequence) whose position is at or before
+    the given position.
+    """
+    while index > 0:
+        child = children[index - 1]
+        if isinstance(child, Command) and child.end_pos <= pos:
+            return index
+        index -= 1
+    return 0
+
+
+def sync_index_at(children: list[Fragment], pos: int) -> Optional[int]:
+    """
+    Finds the index of the sync point (of a fragment sequence) at the given position
+    which is not the beginning of the inner content,
+    or :const:`None` if there is no such sync point.
+    """
+    index = child_index_at(children, pos - 1)
+    if index >= 0 and isinstance(children[index], Command) and children[index].end_pos == pos:
+        return index + 1
+    return None
+
+
+def splice_path(
+        path: list[Token],
+        node: Token,
+        delta: int,
+        src_text: str,
+        rebind: bool = False,
+) -> Token:
+    """
+    Replaces the last node of the given path (as listed by :func:`edit_path`)
+    by the given node without modifying any existing node.
+    Ancestors along the path are copied with their ending positions shifted,
+    and nodes after the replaced one are reused with both positions shifted
+    whereas nodes before it are reused as they are (see :func:`reused_nodes`).
+    Returns the new root node.
+    """
+    old_node = path[-1]
+    for parent in reversed(path[:-1]):
+        new_parent = copy.copy(parent)
+        new_parent.end_pos += delta
+        if isinstance(parent, (FragmentSeq, TokenSeq)):
+            children = parent.children
+            index = child_index_at(children, old_node.start_pos)
+            new_parent.children = [
+                *reused_nodes(children[:index], 0, src_text, rebind),
+                node,
+                *reused_nodes(children[index + 1:], delta, src_text, rebind),
+            ]
+        elif parent.options is old_node:
+            new_parent.options = node
+            if parent.main_arg is not None:
+                (new_parent.main_arg,) = reused_nodes([parent.main_arg], delta, src_text, rebind)
+        else:
+            if parent.options is not None:
+                (new_parent.options,) = reused_nodes([parent.options], 0, src_text, rebind)
+            new_parent.main_arg = node
+        old_node, node = parent, new_parent
+    return node
+
+
+def reused_nodes(
+        nodes: list[Token],
+        delta: int,
+        src_text: str,
+        rebind: bool = False,
+) -> list[Token]:
+    """
+    Prepares nodes of the previous parsed tree to be reused
+    in the parsed tree of the new source text, where their positions
+    are shifted by the given amount, without modifying the given nodes.
+
+    If ``rebind`` is set, the nodes are copied along with all of their descendants
+    so that no :class:`LazyText` node refers to the previous source text
+    (see :func:`shifted_copy`), which takes time linear in the number of nodes.
+    Otherwise, nodes whose positions are unchanged are shared
+    and the others are shifted lazily (see :func:`shifted_view`).
+    """
+    if rebind:
+        return [shifted_copy(node, delta, src_text) for node in nodes]
+    if delta:
+        return [shifted_view(node, delta, src_text) for node in nodes]
+    return nodes
+
+
+def shifted_copy(node: Token, delta: int, src_text: Optional[str] = None) -> Token:
+    """
+    Copies the given node and all of its descendants
+    with their starting and ending positions shifted by the given amount,
+    leaving the original nodes intact.
+    If the new source text is given, copied :class:`LazyText` nodes
+    are also bound to it.
+
+    Nodes are shared rather than copied if their positions are unchanged
+    and no new source text is given.
+    """
+    if not delta and src_text is None:
+        return node
+    root = _shifted_node(node, delta, src_text)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (FragmentSeq, TokenSeq)):
+            node.children = [_shifted_node(child, delta, src_text) for child in node.children]
+            stack.extend(node.children)
+        elif type(node) is Command:
+            if node.options is not None:
+                node.options = _shifted_node(node.options, delta, src_text)
+                stack.append(node.options)
+            if node.main_arg is not None:
+                node.main_arg = _shifted_node(node.main_arg, delta, src_text)
+                stack.append(node.main_arg)
+    return root
+
+
+def shifted_view(node: Token, delta: int, src_text: Optional[str] = None) -> Token:
+    """
+    Creates the node equivalent to :func:`shifted_copy`
+    in time independent of the size of the subtree: descendants of sequence nodes
+    are shifted (and :class:`LazyText` nodes bound to the new source text)
+    only upon the first access to the children of the returned node.
+    """
+    if not delta:
+        return node
+    node_type = type(node)
+    if node_type is FragmentSeq or node_type is _ShiftedFragmentSeq:
+        return _ShiftedFragmentSeq(node, delta, src_text)
+    if node_type is TokenSeq or node_type is _ShiftedTokenSeq:
+        return _ShiftedTokenSeq(node, delta, src_text)
+    if node_type is Command:
+        return Command(
+            node.start_pos + delta, node.end_pos + delta, node.phrase, node.phrase_enclosing,
+            None if node.options is None else shifted_view(node.options, delta, src_text),
+            None if node.main_arg is None else shifted_view(node.main_arg, delta, src_text),
+        )
+    return _shifted_node(node, delta, src_text)
+
+
+def _shifted_node(node: Token, delta: int, src_text: Optional[str]) -> Token:
+    """
+    Copies a single node (which still refers to the original descendants)
+    with its positions shifted.
+    """
+    start_pos, end_pos = node.start_pos + delta, node.end_pos + delta
+    node_type = type(node)
+    if node_type is Text:
+        return Text(start_pos, end_pos, node.inner, node.enclosing)
+    if node_type is LazyText:
+        src_text = node.src_text if src_text is None else src_text
+        return LazyText(start_pos, end_pos, src_text, node.enclosing)
+    if node_type is Command:
+        return Command(
+            start_pos, end_pos, node.phrase, node.phrase_enclosing,
+            node.options, node.main_arg,
+        )
+    if node_type is FragmentSeq or node_type is _ShiftedFragmentSeq:
+        return FragmentSeq(start_pos, end_pos, node.children, node.enclosing)
+    if node_type is TokenSeq or node_type is _ShiftedTokenSeq:
+        return TokenSeq(start_pos, end_pos, node.children)
+    node = copy.copy(node)
+    node.start_pos, node.end_pos = start_pos, end_pos
+    return node
+
+
+class _ShiftedChildren:
+    """
+    Mixin of sequence nodes created by :func:`shifted_view`
+    whose children are those of the source node shifted upon first access.
+    """
+    __slots__ = ()
+
+    @property
+    def children(self) -> list[Token]:
+        # The source is read before the children so that concurrent access
+        # never observes both of them missing
+        source = self._source
+        children = self._children
+        if children is None:
+            delta, src_text = self._delta, self._src_text
+            children = [shifted_view(child, delta, src_text) for child in source.children]
+            self._children = children
+            self._source = None
+        return children
+
+    @children.setter
+    def children(self, children: list[Token]):
+        self._children = children
+        self._source = None
+
+    def _init_shifted(self, node: Token, delta: int, src_text: Optional[str]):
+        self.start_pos = node.start_pos + delta
+        self.end_pos = node.end_pos + delta
+        self._children = None
+        self._src_text = src_text
+        # Views of views refer to the original source node with the deltas combined
+        source = getattr(node, '_source', None)
+        if source is not None:
+            node, delta = source, delta + node._delta
+        self._source = node
+        self._delta = delta
+
+    def __eq__(self, other):
+        return self._plain() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self._plain())
+
+    def __reduce__(self):
+        plain = self._plain()
+        return type(plain), tuple(getattr(plain, field.name) for field in fields(plain))
+
+
+class _ShiftedFragmentSeq(_ShiftedChildren, FragmentSeq):
+    """
+    Lazily shifted :class:`FragmentSeq` (see :func:`shifted_view`)
+    which compares equal to (and is represented just like) the ordinary one.
+    """
+    __slots__ = ('_children', '_source', '_delta', '_src_text')
+
+    def __init__(self, node: FragmentSeq, delta: int, src_text: Optional[str]):
+        self._init_shifted(node, delta, src_text)
+        self.enclosing = node.enclosing
+
+    def _plain(self) -> FragmentSeq:
+        return FragmentSeq(self.start_pos, self.end_pos, self.children, self.enclosing)
+
+
+class _ShiftedTokenSeq(_ShiftedChildren, TokenSeq):
+    """
+    Lazily shifted :class:`TokenSeq` (see :func:`shifted_view`)
+    which compares equal to (and is represented just like) the ordinary one.
+    """
+    __slots__ = ('_children', '_source', '_delta', '_src_text')
+
+    def __init__(self, node: TokenSeq, delta: int, src_text: Optional[str]):
+        self._init_shifted(node, delta, src_text)
+
+    def _plain(self) -> TokenSeq:
+        return TokenSeq(self.start_pos, self.end_pos, self.children)
+
+
+def shift_positions(node: Token, delta: int, src_text: Optional[str] = None):
+    """
+    Shifts the starting and ending positions of the given node
+    and all of its descendants in-place by the given amount.
+    This is meant for freshly parsed nodes not yet shared with any caller;
+    use :func:`shifted_copy` otherwise.
+    If the new source text is given, :class:`LazyText` nodes
+    are also rebound to it.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        node.start_pos += delta
+        node.end_pos += delta
+        if src_text is not None and isinstance(node, LazyText):
+            node.src_text = src_text
+        if isinstance(node, (FragmentSeq, TokenSeq)):
+            stack.extend(node.children)
+        elif isinstance(node, Command):
+            if node.options is not None:
+                stack.append(node.options)
+            if node.main_arg is not None:
+                stack.append(node.main_arg)
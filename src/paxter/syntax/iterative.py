@@ -0,0 +1,218 @@
+"""
+Non-recursive variant of the syntax of Paxter language
+which keeps its own explicit stack of partially parsed nodes
+instead of recursing through Python frames for each nesting level.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+from paxter.syntax.data import Command, Fragment, FragmentSeq, Text, Token, TokenSeq
+from paxter.syntax.enclosing import EnclosingPattern, GlobalEnclosingPattern
+from paxter.syntax.task import (
+    ParsingTask, Phrase, STEP_COMMAND, STEP_FRAGMENT_SEQ, STEP_NODE, STEP_TOKEN_SEQ, _EMPTY_ENCLOSING,
+)
+
+__all__ = ['IterativeParsingTask']
+
+
+class _FragmentSeqFrame:
+    """
+    Partially parsed :class:`FragmentSeq` node on the explicit stack.
+    """
+    __slots__ = ('start_pos', 'enclosing', 'children')
+
+    def __init__(self, start_pos: int, enclosing: EnclosingPattern):
+        self.start_pos = start_pos
+        self.enclosing = enclosing
+        self.children: list[Fragment] = []
+
+    def receive(self, node: Token):
+        self.children.append(node)
+
+
+class _TokenSeqFrame:
+    """
+    Partially parsed :class:`TokenSeq` node (i.e. the options section)
+    on the explicit stack.
+    """
+    __slots__ = ('start_pos', 'children')
+
+    def __init__(self, start_pos: int):
+        self.start_pos = start_pos
+        self.children: list[Token] = []
+
+    def receive(self, node: Token):
+        self.children.append(node)
+
+
+class _CommandFrame:
+    """
+    Partially parsed :class:`Command` node on the explicit stack
+    whose phrase section has already been parsed.
+    """
+    __slots__ = ('phrase', 'options', 'main_arg', 'stage')
+
+    #: Stage right after the phrase section
+    AFTER_PHRASE = 0
+    #: Stage waiting for (or right after) the options section
+    AFTER_OPTIONS = 1
+    #: Stage waiting for (or right after) the main argument section
+    AFTER_MAIN_ARG = 2
+
+    def __init__(self, phrase: Phrase):
+        self.phrase = phrase
+        self.options: Optional[TokenSeq] = None
+        self.main_arg: Optional[Union[FragmentSeq, Text]] = None
+        self.stage = self.AFTER_PHRASE
+
+    def receive(self, node: Token):
+        if self.stage == self.AFTER_OPTIONS:
+            self.options = node
+        else:
+            self.main_arg = node
+
+
+_Frame = Union[_FragmentSeqFrame, _TokenSeqFrame, _CommandFrame]
+_Step = Tuple[int, Union[Token, Tuple[_Frame, ...]]]
+
+
+@dataclass
+class IterativeParsingTask(ParsingTask):
+    """
+    Implements the same syntax as :class:`ParsingTask`
+    and produces identical parsed trees, but maintains an explicit stack
+    of partially parsed nodes instead of using recursive calls.
+    Hence, the nesting depth of the input text is limited only by memory
+    rather than by the Python recursion limit::
+
+        parsed_tree = IterativeParsingTask(src_text).parse()
+    """
+
+    def parse(self) -> FragmentSeq:
+        """
+        Parses source text written in Paxter language into the parsed tree
+        which is a node of type :class:`paxter.syntax.FragmentSeq`.
+        """
+        next_pos, node = self._run([_FragmentSeqFrame(0, GlobalEnclosingPattern())], 0)
+        if next_pos != len(self.src_text):  # pragma: no cover
+            raise RuntimeError("unexpected error; input text not fully consumed")
+        return node
+
+    def _parse_cmd(self, next_pos: int) -> tuple[int, Fragment]:
+        """
+        Parses @-expressions starting from immediately after @-symbol
+        without recursion. This allows methods inherited from :class:`ParsingTask`
+        (such as :meth:`reparse() <ParsingTask.reparse>`) to parse nested commands.
+        """
+        next_pos, result = self._start_cmd(next_pos)
+        if isinstance(result, Token):
+            return next_pos, result
+        return self._run(list(result), next_pos)
+
+    def _run(self, stack: list[_Frame], next_pos: int) -> tuple[int, Token]:
+        """
+        Runs the parsing loop starting from the given stack of frames
+        until the bottommost frame is completed.
+        """
+        while True:
+            # Advances the frame at the top of the stack until either
+            # it needs nested nodes to be parsed (whose frames are then pushed onto the stack)
+            # or it is completed (which is then popped and given to its parent).
+            frame = stack[-1]
+            if isinstance(frame, _FragmentSeqFrame):
+                next_pos, result = self._advance_fragment_seq(next_pos, frame)
+            elif isinstance(frame, _TokenSeqFrame):
+                next_pos, result = self._advance_token_seq(next_pos, frame)
+            else:
+                next_pos, result = self._advance_cmd(next_pos, frame)
+
+            if isinstance(result, Token):
+                stack.pop()
+                if not stack:
+                    return next_pos, result
+                stack[-1].receive(result)
+            else:
+                stack.extend(result)
+
+    def _advance_fragment_seq(self, next_pos: int, frame: _FragmentSeqFrame) -> _Step:
+        """
+        Continues parsing a sequence of fragment nodes.
+        """
+        while True:
+            text_end_pos, after_pos, end_pos = self._lex_fragment_seq_step(
+                next_pos, frame.start_pos, frame.enclosing,
+            )
+            if text_end_pos > next_pos:
+                frame.children.append(self._text_node(next_pos, text_end_pos, _EMPTY_ENCLOSING))
+            if end_pos is not None:
+                fragment_seq_node = FragmentSeq(
+                    frame.start_pos, end_pos, frame.children, frame.enclosing,
+                )
+                return after_pos, fragment_seq_node
+            next_pos, result = self._start_cmd(after_pos)
+            if not isinstance(result, Token):
+                return next_pos, result
+            frame.children.append(result)
+
+    def _start_cmd(self, next_pos: int) -> _Step:
+        """
+        Parses the phrase section of an @-expression
+        starting from immediately after @-symbol, and then continues
+        with the remaining sections as far as possible without nesting.
+        """
+        next_pos, phrase = self._lex_phrase(next_pos)
+        if not isinstance(phrase, Phrase):
+            return next_pos, phrase
+        frame = _CommandFrame(phrase)
+        next_pos, result = self._advance_cmd(next_pos, frame)
+        if isinstance(result, Token):
+            return next_pos, result
+        # The command frame must be pushed below any nested frame it requires
+        return next_pos, (frame, *result)
+
+    def _advance_cmd(self, next_pos: int, frame: _CommandFrame) -> _Step:
+        """
+        Continues parsing the command after the phrase section
+        or after the options section.
+        """
+        phrase = frame.phrase
+        if frame.stage != frame.AFTER_MAIN_ARG and phrase.has_sections:
+            allow_options = frame.stage == frame.AFTER_PHRASE
+            next_pos, kind, value = self._lex_cmd_section(next_pos, allow_options)
+            if kind == STEP_TOKEN_SEQ:
+                frame.stage = frame.AFTER_OPTIONS
+                return next_pos, (_TokenSeqFrame(next_pos),)
+            frame.stage = frame.AFTER_MAIN_ARG
+            if kind == STEP_FRAGMENT_SEQ:
+                return next_pos, (_FragmentSeqFrame(next_pos, value),)
+            if kind == STEP_NODE:
+                frame.main_arg = value
+
+        # Construct Command node
+        cmd_node = Command(
+            phrase.start_pos, next_pos, phrase.phrase, phrase.enclosing,
+            frame.options, frame.main_arg,
+        )
+        return next_pos, cmd_node
+
+    def _advance_token_seq(self, next_pos: int, frame: _TokenSeqFrame) -> _Step:
+        """
+        Continues parsing the options section until reaching the right square brackets.
+        """
+        while True:
+            next_pos, kind, value = self._lex_options_step(next_pos, frame.start_pos)
+            if kind == STEP_NODE:
+                frame.children.append(value)
+            elif kind == STEP_FRAGMENT_SEQ:
+                return next_pos, (_FragmentSeqFrame(next_pos, value),)
+            elif kind == STEP_COMMAND:
+                next_pos, result = self._start_cmd(next_pos)
+                if not isinstance(result, Token):
+                    return next_pos, result
+                frame.children.append(result)
+            elif kind == STEP_TOKEN_SEQ:
+                return next_pos, (_TokenSeqFrame(next_pos),)
+            else:
+                return next_pos, TokenSeq(frame.start_pos, value, frame.children)
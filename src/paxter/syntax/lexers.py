@@ -1,49 +1,182 @@
 """
 Regular expression based lexers for Paxter language.
+
+Patterns are compiled lazily upon first access
+so that importing Paxter (e.g. for command line help messages)
+does not pay the cost of building the large Unicode-aware patterns.
+Long-running processes which fork workers may call :func:`warm_up`
+to compile every pattern once in the parent process beforehand.
 """
 from __future__ import annotations
 
 import re
-from typing import Pattern
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple, Optional, Pattern, Union
+
+__all__ = ['CacheInfo', 'LazyPattern', 'Lexer', 'PatternCache', 'warm_up']
+
+#: Default maximum number of compiled break patterns kept per cache
+DEFAULT_BREAK_CACHE_SIZE = 256
+
+
+class LazyPattern:
+    """
+    Descriptor for a regular expression which is compiled upon first access.
+    The pattern may be given as a string or as a function returning the string
+    (for patterns whose construction is itself expensive).
+    """
+    _pattern: Union[str, Callable[[], str]]
+    _compiled: Optional[Pattern[str]]
+
+    def __init__(self, pattern: Union[str, Callable[[], str]]):
+        self._pattern = pattern
+        self._compiled = None
+
+    def __get__(self, instance, owner=None) -> Pattern[str]:
+        if self._compiled is None:
+            pattern = self._pattern() if callable(self._pattern) else self._pattern
+            self._compiled = re.compile(pattern)
+        return self._compiled
+
+    @property
+    def compiled(self) -> bool:
+        """
+        Whether the pattern has already been compiled.
+        """
+        return self._compiled is not None
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a :class:`PatternCache` instance.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PatternCache:
+    """
+    Thread-safe cache of compiled regular expressions keyed by strings
+    which evicts the least recently used pattern once it grows beyond ``maxsize``.
+    """
+    maxsize: int
+    _patterns: OrderedDict[str, Pattern[str]]
+    _lock: threading.Lock
+    _hits: int
+    _misses: int
+
+    def __init__(self, maxsize: int = DEFAULT_BREAK_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._patterns = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
-from paxter.syntax.charset import IDENTIFIER_PATTERN, OPERATOR_PATTERN, SYMBOL_PATTERN
+    def get(self, key: str, build: Callable[[str], str]) -> Pattern[str]:
+        """
+        Returns the compiled pattern cached under the given key.
+        On cache miss, the pattern string is built from the key by ``build``
+        and then compiled; the compilation happens outside of the lock.
+        """
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self._hits += 1
+                return compiled
+            self._misses += 1
+
+        compiled = re.compile(build(key))
+
+        with self._lock:
+            # Another thread may have inserted the same key in the meantime
+            compiled = self._patterns.setdefault(key, compiled)
+            self._patterns.move_to_end(key)
+            while len(self._patterns) > self.maxsize:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def info(self) -> CacheInfo:
+        """
+        Reports the cache statistics.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._patterns))
+
+    def clear(self):
+        """
+        Removes all cached patterns and resets the statistics.
+        """
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _from_charset(template: str) -> Callable[[], str]:
+    """
+    Defers the substitution of character set patterns
+    defined in :mod:`paxter.syntax.charset` into the given template
+    until the pattern is about to be compiled.
+    """
+
+    def render() -> str:
+        from paxter.syntax import charset
+        return template.format_map(vars(charset))
+
+    return render
 
 
 class Lexer:
     """
     Collection of compiled regular expressions to syntax Paxter language.
     """
-    _compiled_non_rec_breaks: dict[str, Pattern[str]]
-    _compiled_rec_breaks: dict[str, Pattern[str]]
-
-    ws_re = re.compile(r'\s*')
-    at_re = re.compile(r'@')
-    lbar_re = re.compile(r'(?P<left>#*\|)')
-    lbrace_re = re.compile(r'(?P<left>#*{)')
-    lquote_re = re.compile(r'(?P<left>#*")')
-    lbracket_re = re.compile(r'\[')
-    rbracket_re = re.compile(r']')
-    id_re = re.compile(rf'(?P<id>{IDENTIFIER_PATTERN})')
-    symbol_re = re.compile(rf'(?P<symbol>{SYMBOL_PATTERN})')
-    op_re = re.compile(rf'(?P<op>{OPERATOR_PATTERN})')
-    num_re = re.compile(r'(?P<num>-?(?:[1-9][0-9]*|0)(?:\.[0-9]+)?(?:[Ee][+-]?[0-9]+)?)')
-    global_break_re = re.compile(r'(?P<inner>(?s:.)*?)(?P<break>@|\Z)')
-
-    def __init__(self):
-        self._compiled_non_rec_breaks = {}
-        self._compiled_rec_breaks = {}
+    _non_rec_break_cache: PatternCache
+    _rec_break_cache: PatternCache
+
+    ws_re = LazyPattern(r'\s*')
+    at_re = LazyPattern(r'@')
+    lbar_re = LazyPattern(r'(?P<left>#*\|)')
+    lbrace_re = LazyPattern(r'(?P<left>#*{)')
+    lquote_re = LazyPattern(r'(?P<left>#*")')
+    lbracket_re = LazyPattern(r'\[')
+    rbracket_re = LazyPattern(r']')
+    id_re = LazyPattern(_from_charset(r'(?P<id>{IDENTIFIER_PATTERN})'))
+    symbol_re = LazyPattern(_from_charset(r'(?P<symbol>{SYMBOL_PATTERN})'))
+    op_re = LazyPattern(_from_charset(r'(?P<op>{OPERATOR_PATTERN})'))
+    num_re = LazyPattern(r'(?P<num>-?(?:[1-9][0-9]*|0)(?:\.[0-9]+)?(?:[Ee][+-]?[0-9]+)?)')
+    global_break_re = LazyPattern(r'(?P<inner>(?s:.)*?)(?P<break>@|\Z)')
+    rec_break_candidate_re = LazyPattern(r'[@}]')
+
+    def __init__(self, break_cache_size: int = DEFAULT_BREAK_CACHE_SIZE):
+        self._non_rec_break_cache = PatternCache(break_cache_size)
+        self._rec_break_cache = PatternCache(break_cache_size)
+
+    @classmethod
+    def warm_up(cls):
+        """
+        Compiles all lazily compiled patterns of the lexer class.
+        """
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, LazyPattern):
+                    getattr(cls, name)
 
     def non_rec_break_re(self, right_pattern: str) -> Pattern[str]:
         """
         Compiles a regular expression lexer to non-greedily match some text
         which is then followed by the given right enclosing pattern.
         """
-        right_pattern = re.escape(right_pattern)
-        if right_pattern not in self._compiled_non_rec_breaks:
-            self._compiled_non_rec_breaks[right_pattern] = re.compile(
-                rf'(?P<inner>(?s:.)*?)(?P<break>{right_pattern})',
-            )
-        return self._compiled_non_rec_breaks[right_pattern]
+        return self._non_rec_break_cache.get(
+            right_pattern,
+            lambda right: rf'(?P<inner>(?s:.)*?)(?P<break>{re.escape(right)})',
+        )
 
     def rec_break_re(self, right_pattern: str) -> Pattern[str]:
         """
@@ -51,12 +184,82 @@ class Lexer:
         which is then followed by either the @-command switch symbol
         or the given enclosing right pattern.
         """
-        right_pattern = re.escape(right_pattern)
-        if right_pattern not in self._compiled_rec_breaks:
-            self._compiled_rec_breaks[right_pattern] = re.compile(
-                rf'(?P<inner>(?s:.)*?)(?P<break>@|{right_pattern})',
-            )
-        return self._compiled_rec_breaks[right_pattern]
+        return self._rec_break_cache.get(
+            right_pattern,
+            lambda right: rf'(?P<inner>(?s:.)*?)(?P<break>@|{re.escape(right)})',
+        )
+
+    def find_non_rec_break(
+            self, src_text: str, pos: int, right_pattern: str,
+    ) -> Optional[tuple[int, str]]:
+        """
+        Finds the first occurrence of the given right enclosing pattern
+        starting from the given position without compiling any pattern.
+        Returns a tuple of the index of the occurrence and the pattern itself,
+        or :const:`None` if the pattern cannot be found.
+        """
+        break_pos = src_text.find(right_pattern, pos)
+        if break_pos < 0:
+            return None
+        return break_pos, right_pattern
+
+    def find_rec_break(
+            self, src_text: str, pos: int, right_pattern: str,
+    ) -> Optional[tuple[int, str]]:
+        """
+        Finds the first occurrence of either the @-command switch symbol
+        or the given right enclosing pattern starting from the given position.
+        Returns a tuple of the index of the occurrence and the matched string,
+        or :const:`None` if neither can be found.
+
+        Instead of compiling one pattern per right enclosing pattern,
+        a single shared pattern looks for candidate characters
+        and each candidate is then checked against the full right pattern
+        (i.e. including the number of hash characters).
+        Hence, the right pattern must be that of a fragment sequence
+        (i.e. a right curly brace followed by hash characters).
+        """
+        if not right_pattern.startswith('}'):
+            raise ValueError(f"unsupported recursive right pattern: {right_pattern!r}")
+        search = self.rec_break_candidate_re.search
+        while matchobj := search(src_text, pos):
+            break_pos = matchobj.start()
+            if matchobj.group() == '@':
+                return break_pos, '@'
+            if src_text.startswith(right_pattern, break_pos):
+                return break_pos, right_pattern
+            pos = break_pos + 1
+        return None
+
+    def find_global_break(self, src_text: str, pos: int) -> tuple[int, str]:
+        """
+        Finds the first occurrence of the @-command switch symbol
+        starting from the given position. Returns a tuple of the index
+        of the occurrence and the matched string (which is empty
+        if the end of input text is reached instead).
+        """
+        break_pos = src_text.find('@', pos)
+        if break_pos < 0:
+            return len(src_text), ''
+        return break_pos, '@'
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """
+        Reports the statistics of the caches of compiled break patterns.
+        """
+        return {
+            'non_rec_break': self._non_rec_break_cache.info(),
+            'rec_break': self._rec_break_cache.info(),
+        }
 
 
 _LEXER = Lexer()
+
+
+def warm_up():
+    """
+    Compiles all lexer patterns ahead of time.
+    This is useful for pre-fork servers so that the compilation cost
+    is paid only once in the parent process rather than in every worker.
+    """
+    _LEXER.warm_up()
@@ -0,0 +1,309 @@
+"""
+Memory-mapped parsed trees which are loaded lazily from files
+in the binary encoding (see :mod:`paxter.syntax.binary`).
+"""
+from __future__ import annotations
+
+import dataclasses
+import mmap
+import os
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from paxter.syntax import binary
+from paxter.syntax.data import (
+    Command, ErrorFragment, FragmentSeq, Identifier, Number, Operator, Text, Token, TokenSeq,
+)
+from paxter.syntax.enclosing import EnclosingPattern
+from paxter.syntax.flat import (
+    FLAG_HAS_MAIN_ARG, FLAG_HAS_OPTIONS, FlatTree, KIND_COMMAND, KIND_ERROR, KIND_FRAGMENT_SEQ,
+    KIND_IDENTIFIER, KIND_NUMBER, KIND_OPERATOR, KIND_TEXT, KIND_TOKEN_SEQ,
+)
+
+__all__ = [
+    'MappedTree', 'view_node',
+    'FragmentSeqView', 'TokenSeqView', 'TextView', 'CommandView',
+    'IdentifierView', 'OperatorView', 'NumberView', 'ErrorFragmentView',
+]
+
+
+@dataclass
+class MappedTree(FlatTree):
+    """
+    Flat tree whose columns are zero-copy views into a memory-mapped file
+    written by :func:`binary.dump() <paxter.syntax.binary.dump>`.
+    Opening the file only validates its header;
+    node data is paged in by the operating system as it is accessed::
+
+        with MappedTree.open(path) as mapped_tree:
+            for fragment in mapped_tree.root.children:
+                ...
+
+    The root node (as well as all of its descendants) is a lazy view
+    (such as :class:`CommandView`) which is a read-only instance
+    of the corresponding node type (such as :class:`Command`)
+    and reads its fields from the mapped file upon access.
+    Node views must no longer be used once the mapped tree is closed.
+    """
+    #: The memory-mapped file
+    _mmap: Optional[mmap.mmap] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> MappedTree:
+        """
+        Memory-maps the given file of a binary parsed tree.
+        """
+        with open(path, 'rb') as fobj:
+            mapped = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if binary.NEEDS_BYTESWAP:  # pragma: no cover
+                flat_tree = binary.decode(mapped)
+                return cls(**{
+                    f.name: getattr(flat_tree, f.name) for f in dataclasses.fields(FlatTree)
+                })
+            layout = binary.read_layout(mapped)
+        except BaseException:
+            mapped.close()
+            raise
+
+        buffer = memoryview(mapped)
+        mapped_tree = cls(_mmap=mapped)
+        for name, typecode, offset in layout.columns:
+            itemsize = array(typecode).itemsize
+            column = buffer[offset:offset + layout.node_count * itemsize].cast(typecode)
+            setattr(mapped_tree, name, column)
+        mapped_tree.strings = buffer[slice(*layout.strings_range)]
+        mapped_tree.patterns = str(buffer[slice(*layout.patterns_range)], 'utf-8').split('\0')[:-1]
+        buffer.release()
+        return mapped_tree
+
+    @property
+    def root(self) -> Token:
+        """
+        Lazy view of the root node.
+        """
+        return view_node(self, 0)
+
+    def close(self):
+        """
+        Releases all views into the mapped file and unmaps it.
+        """
+        if self._mmap is None:
+            return
+        for value in vars(self).values():
+            if isinstance(value, memoryview):
+                value.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> MappedTree:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def view_node(flat_tree: FlatTree, index: int) -> Token:
+    """
+    Creates the lazy view of the node of the given index within the flat tree.
+    """
+    return VIEW_CLASSES[flat_tree.kinds[index]](flat_tree, index)
+
+
+class _NodeView:
+    """
+    Mixin for lazy views of nodes whose field values are read from a flat tree.
+    Views compare equal to (and are represented just like)
+    ordinary nodes of the same type with the same field values.
+    """
+    __slots__ = ()
+
+    _flat_tree: FlatTree
+    _index: int
+
+    #: The viewed node type
+    node_type: type[Token]
+
+    def __init__(self, flat_tree: FlatTree, index: int):
+        self._flat_tree = flat_tree
+        self._index = index
+
+    @property
+    def start_pos(self) -> int:
+        return self._flat_tree.start_pos[self._index]
+
+    @property
+    def end_pos(self) -> int:
+        return self._flat_tree.end_pos[self._index]
+
+    def __eq__(self, other):
+        if not isinstance(other, self.node_type):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in dataclasses.fields(self.node_type) if f.compare
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        field_reprs = ', '.join(
+            f'{f.name}={getattr(self, f.name)!r}'
+            for f in dataclasses.fields(self.node_type) if f.repr
+        )
+        return f'{self.node_type.__qualname__}({field_reprs})'
+
+    def _string(self) -> str:
+        return self._flat_tree.string(self._index)
+
+    def _children(self) -> list[Token]:
+        return [view_node(self._flat_tree, index) for index in self._flat_tree.children(self._index)]
+
+
+class FragmentSeqView(_NodeView, FragmentSeq):
+    """
+    Lazy view of :class:`FragmentSeq` node.
+    """
+    __slots__ = ('_flat_tree', '_index', '_children_cache')
+    node_type = FragmentSeq
+
+    def __init__(self, flat_tree: FlatTree, index: int):
+        super().__init__(flat_tree, index)
+        self._children_cache = None
+
+    @property
+    def children(self) -> list[Token]:
+        if self._children_cache is None:
+            self._children_cache = self._children()
+        return self._children_cache
+
+    @property
+    def enclosing(self) -> EnclosingPattern:
+        return self._flat_tree.enclosing(self._index)
+
+
+class TokenSeqView(_NodeView, TokenSeq):
+    """
+    Lazy view of :class:`TokenSeq` node.
+    """
+    __slots__ = ('_flat_tree', '_index', '_children_cache')
+    node_type = TokenSeq
+
+    def __init__(self, flat_tree: FlatTree, index: int):
+        super().__init__(flat_tree, index)
+        self._children_cache = None
+
+    @property
+    def children(self) -> list[Token]:
+        if self._children_cache is None:
+            self._children_cache = self._children()
+        return self._children_cache
+
+
+class TextView(_NodeView, Text):
+    """
+    Lazy view of :class:`Text` node.
+    """
+    __slots__ = ('_flat_tree', '_index')
+    node_type = Text
+
+    @property
+    def inner(self) -> str:
+        return self._string()
+
+    @property
+    def enclosing(self) -> EnclosingPattern:
+        return self._flat_tree.enclosing(self._index)
+
+
+class CommandView(_NodeView, Command):
+    """
+    Lazy view of :class:`Command` node.
+    """
+    __slots__ = ('_flat_tree', '_index')
+    node_type = Command
+
+    @property
+    def phrase(self) -> str:
+        return self._string()
+
+    @property
+    def phrase_enclosing(self) -> EnclosingPattern:
+        return self._flat_tree.enclosing(self._index)
+
+    @property
+    def options(self) -> Optional[TokenSeq]:
+        if not self._flat_tree.flags[self._index] & FLAG_HAS_OPTIONS:
+            return None
+        return view_node(self._flat_tree, self._flat_tree.child_starts[self._index])
+
+    @property
+    def main_arg(self) -> Optional[Union[FragmentSeq, Text]]:
+        flags = self._flat_tree.flags[self._index]
+        if not flags & FLAG_HAS_MAIN_ARG:
+            return None
+        child_index = self._flat_tree.child_starts[self._index]
+        if flags & FLAG_HAS_OPTIONS:
+            child_index += 1
+        return view_node(self._flat_tree, child_index)
+
+
+class IdentifierView(_NodeView, Identifier):
+    """
+    Lazy view of :class:`Identifier` node.
+    """
+    __slots__ = ('_flat_tree', '_index')
+    node_type = Identifier
+
+    @property
+    def name(self) -> str:
+        return self._string()
+
+
+class OperatorView(_NodeView, Operator):
+    """
+    Lazy view of :class:`Operator` node.
+    """
+    __slots__ = ('_flat_tree', '_index')
+    node_type = Operator
+
+    @property
+    def symbols(self) -> str:
+        return self._string()
+
+
+class NumberView(_NodeView, Number):
+    """
+    Lazy view of :class:`Number` node.
+    """
+    __slots__ = ('_flat_tree', '_index')
+    node_type = Number
+
+    @property
+    def value(self) -> Union[int, float]:
+        return Number.sanitize(self._string())
+
+
+class ErrorFragmentView(_NodeView, ErrorFragment):
+    """
+    Lazy view of :class:`ErrorFragment` node.
+    """
+    __slots__ = ('_flat_tree', '_index')
+    node_type = ErrorFragment
+
+    @property
+    def inner(self) -> str:
+        return self._string()
+
+
+VIEW_CLASSES = {
+    KIND_FRAGMENT_SEQ: FragmentSeqView,
+    KIND_TOKEN_SEQ: TokenSeqView,
+    KIND_TEXT: TextView,
+    KIND_COMMAND: CommandView,
+    KIND_IDENTIFIER: IdentifierView,
+    KIND_OPERATOR: OperatorView,
+    KIND_NUMBER: NumberView,
+    KIND_ERROR: ErrorFragmentView,
+}
@@ -0,0 +1,77 @@
+"""
+Error-recovering variant of the syntax of Paxter language
+which reports all syntax errors within the input text in a single pass.
+"""
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+
+from paxter.exceptions import PaxterSyntaxError
+from paxter.syntax.data import FragmentSeq
+from paxter.syntax.task import ParsingTask
+
+__all__ = ['RecoveringParsingTask']
+
+
+@dataclass
+class RecoveringParsingTask(ParsingTask):
+    """
+    Implements the same syntax as :class:`ParsingTask`
+    but records syntax errors into :attr:`diagnostics` instead of raising them,
+    and resumes parsing from where the error is found::
+
+        task = RecoveringParsingTask(src_text)
+        parsed_tree = task.parse()
+        for error in task.diagnostics:
+            print(error)
+
+    Errors are recovered as follows:
+
+    - A fragment sequence whose enclosing right pattern is missing
+      is closed at the end of input.
+    - An options section whose closing bracket is missing
+      is closed at the first unparsable position.
+    - An unmatched enclosing left pattern of a quoted text or a phrase,
+      as well as an @-switch character not followed by a valid expression,
+      is skipped and kept in the parsed tree as
+      an :class:`ErrorFragment <paxter.syntax.ErrorFragment>` node.
+
+    The parsed tree is identical to that of :class:`ParsingTask`
+    if the input text contains no syntax errors.
+
+    Since error recovery is part of the lexing steps shared by all parsing tasks,
+    this class may be combined with other variants through multiple inheritance::
+
+        @dataclass
+        class RecoveringIterativeParsingTask(RecoveringParsingTask, IterativeParsingTask):
+            pass
+
+    When combined with :class:`EventParsingTask <paxter.syntax.EventParsingTask>`,
+    skipped input text is reported by ``error`` events
+    and :attr:`diagnostics` is not cleared between calls.
+    """
+    #: Syntax errors found by the last call to :meth:`parse` in the source order
+    diagnostics: list[PaxterSyntaxError] = field(default_factory=list, init=False)
+
+    #: Line and column values of each error in :attr:`diagnostics`
+    _diagnostic_locs: list[tuple[int, int]] = field(
+        default_factory=list, init=False, repr=False,
+    )
+
+    def parse(self) -> FragmentSeq:
+        """
+        Parses source text written in Paxter language into the (possibly partial)
+        parsed tree which is a node of type :class:`paxter.syntax.FragmentSeq`.
+        """
+        self.diagnostics = []
+        self._diagnostic_locs = []
+        return super().parse()
+
+    def _report_error(self, error: PaxterSyntaxError):
+        # Errors of enclosing nodes are found after those nested within them,
+        # so each error is inserted at its place in the source order
+        loc = min((charloc.line, charloc.col) for charloc in error.positions.values())
+        index = bisect.bisect_right(self._diagnostic_locs, loc)
+        self._diagnostic_locs.insert(index, loc)
+        self.diagnostics.insert(index, error)
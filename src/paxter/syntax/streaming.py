@@ -0,0 +1,168 @@
+"""
+Streaming variant of the syntax of Paxter language
+which reads the source text from a text stream in chunks
+and produces global-level fragments as soon as they are complete.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from paxter.exceptions import PaxterSyntaxError
+from paxter.syntax.charloc import CharLoc
+from paxter.syntax.data import Fragment, FragmentSeq
+from paxter.syntax.enclosing import GlobalEnclosingPattern
+from paxter.syntax.incremental import shift_positions
+from paxter.syntax.iterative import IterativeParsingTask
+
+__all__ = ['StreamingParsingTask']
+
+#: Default number of characters to read from the stream at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+NON_HASH_RE = re.compile(r'[^#]')
+
+
+@dataclass
+class _BufferParsingTask(IterativeParsingTask):
+    """
+    Parsing task over the buffered portion of the source text
+    which reports error positions relative to the entire source text.
+    """
+    #: Number of newline characters before the buffer
+    base_line: int = 0
+
+    #: Number of characters between the last newline before the buffer
+    #: and the beginning of the buffer
+    base_col: int = 0
+
+    def _charloc(self, pos: int) -> CharLoc:
+        charloc = super()._charloc(pos)
+        if charloc.line == 1:
+            charloc.col += self.base_col
+        charloc.line += self.base_line
+        return charloc
+
+
+@dataclass
+class StreamingParsingTask:
+    """
+    Parses Paxter language text input read from a text stream in chunks,
+    producing global-level fragments (i.e. direct children of
+    the global-level :class:`FragmentSeq`) as soon as they are complete.
+    Positions of the produced nodes are relative to the entire stream::
+
+        for fragment in StreamingParsingTask(stream).iter_fragments():
+            ...
+
+    Only the fragment currently being parsed is kept in memory,
+    so the memory usage is bounded by the size of the largest global-level fragment
+    (rather than the size of the entire input).
+    Note that a global-level text is complete only when the subsequent command
+    (or the end of input) is discovered.
+    """
+    #: Text stream of document source text
+    stream: TextIO
+
+    #: Number of characters to read from the stream at a time
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+
+    #: Unconsumed source text read from the stream
+    _buffer: str = field(default='', init=False, repr=False)
+
+    #: Index of the beginning of the buffer within the entire source text
+    _base_pos: int = field(default=0, init=False, repr=False)
+
+    #: Line and column bookkeeping of the beginning of the buffer
+    _base_line: int = field(default=0, init=False, repr=False)
+    _base_col: int = field(default=0, init=False, repr=False)
+
+    #: Whether the end of the stream has been reached
+    _eof: bool = field(default=False, init=False, repr=False)
+
+    def parse(self) -> FragmentSeq:
+        """
+        Parses the entire stream into the parsed tree
+        just like :meth:`ParsingTask.parse() <paxter.syntax.ParsingTask.parse>`.
+        """
+        children = list(self.iter_fragments())
+        return FragmentSeq(0, self._base_pos, children, GlobalEnclosingPattern())
+
+    def iter_fragments(self) -> Iterator[Fragment]:
+        """
+        Generates global-level fragments from the stream in order.
+        """
+        read_size = self.chunk_size
+        while True:
+            consumed, fragments, done = self._parse_buffer()
+            for fragment in fragments:
+                shift_positions(fragment, self._base_pos)
+            yield from fragments
+            self._consume(consumed)
+            if done:
+                return
+
+            # Reads more input; the amount grows with the pending fragment
+            # so that re-parsing it stays linear in the overall input size
+            read_size = self.chunk_size if consumed else max(read_size, len(self._buffer))
+            data = self.stream.read(read_size)
+            if data:
+                self._buffer += data
+            else:
+                self._eof = True
+
+    def _parse_buffer(self) -> tuple[int, list[Fragment], bool]:
+        """
+        Parses the buffer for as many complete global-level fragments as possible.
+        Returns the number of consumed characters, the list of complete fragments,
+        and whether the entire input has been parsed.
+        """
+        task = _BufferParsingTask(
+            self._buffer, base_line=self._base_line, base_col=self._base_col,
+        )
+        enclosing = GlobalEnclosingPattern()
+        children = []
+        consumed = 0
+        num_complete = 0
+        next_pos = 0
+
+        while True:
+            try:
+                next_pos, end_pos = task._parse_fragment_seq_step(next_pos, 0, enclosing, children)
+            except PaxterSyntaxError:
+                # The error may be caused by the truncated input
+                if self._eof:
+                    raise
+                break
+            if end_pos is not None:
+                # The end of buffer is reached, hence the trailing text is complete
+                # only if the end of input has also been reached.
+                if self._eof:
+                    return next_pos, children, True
+                break
+            # The command just parsed is complete only if the subsequent text
+            # can no longer extend it (e.g. hash characters followed by a brace)
+            if not self._eof and not NON_HASH_RE.search(self._buffer, next_pos):
+                break
+            consumed = next_pos
+            num_complete = len(children)
+
+        return consumed, children[:num_complete], False
+
+    def _consume(self, consumed: int):
+        """
+        Drops the consumed prefix from the buffer.
+        """
+        if not consumed:
+            return
+        prefix = self._buffer[:consumed]
+        newline_count = prefix.count('\n')
+        if newline_count:
+            self._base_line += newline_count
+            self._base_col = consumed - prefix.rindex('\n') - 1
+        else:
+            self._base_col += consumed
+        self._buffer = self._buffer[consumed:]
+        self._base_pos += consumed
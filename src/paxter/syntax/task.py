@@ -3,17 +3,53 @@ Recursive descent syntax of Paxter language.
 """
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import Match
+from typing import Any, Match, NamedTuple, Optional, TYPE_CHECKING, Union
 
 from paxter.exceptions import PaxterSyntaxError
-from paxter.syntax.charloc import CharLoc
+from paxter.syntax.charloc import CharLoc, LineIndex
 from paxter.syntax.data import (
-    Command, Fragment, FragmentSeq, Identifier, Number, Operator, Text, TokenSeq,
+    Command, ErrorFragment, Fragment, FragmentSeq, Identifier, LazyText, Number, Operator, Text,
+    Token, TokenSeq,
 )
 from paxter.syntax.enclosing import EnclosingPattern, GlobalEnclosingPattern
+from paxter.syntax.incremental import (
+    TextEdit, child_index_at, edit_path, last_sync_index, reused_nodes, splice_path, sync_index_at,
+    sync_pos,
+)
 from paxter.syntax.lexers import _LEXER
 
+if TYPE_CHECKING:
+    from paxter.syntax.flat import FlatTree
+
+#: Kinds of lexing steps (see :meth:`ParsingTask._lex_cmd_section`
+#: and :meth:`ParsingTask._lex_options_step`)
+STEP_NODE = 0
+STEP_FRAGMENT_SEQ = 1
+STEP_COMMAND = 2
+STEP_TOKEN_SEQ = 3
+STEP_END = 4
+
+_EMPTY_ENCLOSING = EnclosingPattern.interned('')
+
+
+class Phrase(NamedTuple):
+    """
+    Phrase section of a Command as lexed by :meth:`ParsingTask._lex_phrase`.
+    """
+    #: The index of the starting position of the Command
+    start_pos: int
+
+    #: Phrase string
+    phrase: str
+
+    #: Information of the enclosing bar pattern over the phrase section
+    enclosing: EnclosingPattern
+
+    #: Whether the options and the main argument sections may follow
+    has_sections: bool
+
 
 @dataclass
 class ParsingTask:
@@ -25,10 +61,18 @@ class ParsingTask:
     to obtain the parsed tree::
 
         parsed_tree = ParsingTask(src_text).parse()
+
+    If ``lazy_texts`` is enabled, text nodes are created as :class:`LazyText`
+    which slice their inner content from the source text only upon access
+    rather than holding a copy of it,
+    which roughly halves the memory retained by text-heavy parsed trees.
     """
     #: Document source text
     src_text: str
 
+    #: Whether to create text nodes referencing the source text
+    lazy_texts: bool = False
+
     def parse(self) -> FragmentSeq:
         """
         Parses source text written in Paxter language into the parsed tree
@@ -39,6 +83,109 @@ class ParsingTask:
         """
         return self._parse_global_fragment_seq()
 
+    def parse_flat(self) -> FlatTree:
+        """
+        Parses source text just like :meth:`parse`
+        but returns the parsed tree in the columnar representation
+        (see :class:`paxter.syntax.FlatTree`).
+        """
+        from paxter.syntax.flat import FlatTree
+        return FlatTree.from_tree(self.parse())
+
+    @functools.cached_property
+    def line_index(self) -> LineIndex:
+        """
+        Line index of the source text for error reporting,
+        which is built upon first use and kept by the task.
+        """
+        return LineIndex(self.src_text)
+
+    def reparse(self, prev_tree: FragmentSeq, edit: TextEdit) -> FragmentSeq:
+        """
+        Parses the source text (which must be the result of applying
+        the given edit to the source text of ``prev_tree``) by reusing
+        nodes of the previous parsed tree which are not affected by the edit.
+        Only the region around the edit within the innermost fragment sequence
+        enclosing the edit is parsed again; parsing moves out to the enclosing
+        fragment sequences only if the edit changes where that one ends.
+
+        The result is identical to the parsed tree from :meth:`parse`
+        and ``prev_tree`` is left intact: nodes before the edit are shared
+        between both trees whereas nodes after the edit are reused
+        with their positions shifted lazily, i.e. the descendants
+        of a reused sequence node are shifted upon first access to its children.
+        Hence the time taken does not grow with the size of the unaffected
+        parts of the tree.
+
+        With ``lazy_texts`` enabled, all reused nodes are instead copied
+        so that every :class:`LazyText` node is bound to the new source text
+        and no previous source text is kept alive by the resulting tree,
+        which takes time linear in the size of the whole tree.
+        """
+        if prev_tree.end_pos + edit.delta != len(self.src_text):
+            raise ValueError("edit is inconsistent with the previous tree and source text")
+
+        path = edit_path(prev_tree, edit)
+        for depth in reversed(range(len(path))):
+            prev_node = path[depth]
+            if not isinstance(prev_node, FragmentSeq):
+                continue
+            node = self._reparse_fragment_seq(prev_node, edit)
+            if node is not None:
+                return splice_path(
+                    path[:depth + 1], node, edit.delta, self.src_text, self.lazy_texts,
+                )
+        raise RuntimeError("unexpected error; global-level reparse failed")  # pragma: no cover
+
+    def _reparse_fragment_seq(
+            self,
+            prev_node: FragmentSeq,
+            edit: TextEdit,
+    ) -> Optional[FragmentSeq]:
+        """
+        Parses the fragment sequence of the previous parsed tree
+        which encloses the edit again, reusing its children unaffected by the edit.
+        It returns :const:`None` if the fragment sequence no longer ends
+        at the (shifted) ending position of the previous one.
+        """
+        old_children = prev_node.children
+        end_limit = prev_node.end_pos + edit.delta
+
+        # Finds where to restart parsing: the last step starting at or before the edit
+        # whose preceding command cannot be extended by the edit through its lookahead
+        # (such as an inserted opening brace after some hash characters)
+        first_affected = child_index_at(old_children, edit.offset) + 1
+        while True:
+            first_affected = last_sync_index(old_children, first_affected, edit.offset)
+            next_pos = sync_pos(prev_node, first_affected)
+            if first_affected == 0 or self.src_text[next_pos:edit.offset].strip('#'):
+                break
+            first_affected -= 1
+
+        # Parses step by step until the closing pattern is reached
+        # or until a step ends at a (shifted) step start of the previous node
+        # which lies entirely after the edit
+        children = reused_nodes(old_children[:first_affected], 0, self.src_text, self.lazy_texts)
+        end_pos = None
+        while end_pos is None:
+            next_pos, end_pos = self._parse_fragment_seq_step(
+                next_pos, prev_node.start_pos, prev_node.enclosing, children,
+            )
+            if end_pos is None and next_pos >= edit.offset + len(edit.inserted_text):
+                if next_pos > end_limit:
+                    return None
+                first_unaffected = sync_index_at(old_children, next_pos - edit.delta)
+                if first_unaffected is not None:
+                    following = old_children[first_unaffected:]
+                    children.extend(reused_nodes(
+                        following, edit.delta, self.src_text, self.lazy_texts,
+                    ))
+                    end_pos = end_limit
+
+        if end_pos != end_limit:
+            return None
+        return FragmentSeq(prev_node.start_pos, end_pos, children, prev_node.enclosing)
+
     def _parse_global_fragment_seq(self) -> FragmentSeq:
         """
         Parses the entirety of the already provided input text
@@ -62,119 +209,254 @@ class ParsingTask:
         """
         start_pos = next_pos
         children: list[Fragment] = []
+        end_pos = None
 
-        while True:
-            # Attempts to match the next break pattern
-            matchobj = enclosing.rec_break_re.match(self.src_text, next_pos)
-            if matchobj is None:
-                self._raise_cannot_match_enclosing(start_pos, enclosing)
-
-            # Append non-empty text node to children list
-            text_node = Text.from_matchobj(matchobj, 'inner', enclosing=EnclosingPattern(left=''))
-            if text_node.inner:
-                children.append(text_node)
-
-            # Dispatch syntax between the @-expression switch
-            # and the closing (i.e. right) pattern
-            next_pos = matchobj.end()
-            break_char = matchobj['break']
-            if break_char == '@':
-                next_pos, result_node = self._parse_cmd(next_pos)
-                children.append(result_node)
-            else:
-                break
+        while end_pos is None:
+            next_pos, end_pos = self._parse_fragment_seq_step(
+                next_pos, start_pos, enclosing, children,
+            )
 
-        end_pos = matchobj.end('inner')
         fragment_seq_node = FragmentSeq(start_pos, end_pos, children, enclosing)
         return next_pos, fragment_seq_node
 
-    def _parse_cmd(self, next_pos: int) -> tuple[int, Command]:
+    def _parse_fragment_seq_step(
+            self,
+            next_pos: int,
+            start_pos: int,
+            enclosing: EnclosingPattern,
+            children: list[Fragment],
+    ) -> tuple[int, Optional[int]]:
         """
-        Parses @-expressions starting from immediately after @-symbol
-        by attempting to dispatch the next step through lookahead patterns.
+        Parses a single step of a sequence of fragment nodes
+        (which started at ``start_pos``) from the given position:
+        a possibly empty text followed by either an @-expression
+        or the closing (i.e. right) pattern.
+        New nodes are appended to ``children``.
+
+        It returns the next position as well as the ending position
+        of the fragment sequence if the closing pattern was reached
+        (or :const:`None` otherwise).
         """
-        if matchobj := _LEXER.id_re.match(self.src_text, next_pos):
-            return self._parse_id_phrase_cmd(matchobj)
-
-        if matchobj := _LEXER.lbar_re.match(self.src_text, next_pos):
-            return self._parse_bar_phrase_cmd(matchobj)
-
-        if matchobj := _LEXER.symbol_re.match(self.src_text, next_pos):
-            return self._parse_single_symbol(matchobj)
-
-        self._raise_invalid_cmd(next_pos)
-
-    def _parse_id_phrase_cmd(self, id_matchobj: Match[str]) -> tuple[int, Command]:
+        text_end_pos, after_pos, end_pos = self._lex_fragment_seq_step(
+            next_pos, start_pos, enclosing,
+        )
+        if text_end_pos > next_pos:
+            children.append(self._text_node(next_pos, text_end_pos, _EMPTY_ENCLOSING))
+        if end_pos is not None:
+            return after_pos, end_pos
+        next_pos, result_node = self._parse_cmd(after_pos)
+        children.append(result_node)
+        return next_pos, None
+
+    def _parse_cmd(self, next_pos: int) -> tuple[int, Fragment]:
         """
-        Continues syntax the phrase section of the Command
-        by using the identifier name content as the phrase section.
+        Parses @-expressions starting from immediately after @-symbol.
         """
-        cmd_start_pos, next_pos = id_matchobj.span()
-        phrase = id_matchobj['id']
-        phrase_enclosing = EnclosingPattern(left='')
-        return self._parse_cmd_after_phrase(next_pos, cmd_start_pos, phrase, phrase_enclosing)
+        next_pos, phrase = self._lex_phrase(next_pos)
+        if not isinstance(phrase, Phrase):
+            return next_pos, phrase
+
+        options = None
+        main_arg = None
+        if phrase.has_sections:
+            next_pos, kind, value = self._lex_cmd_section(next_pos, True)
+            if kind == STEP_TOKEN_SEQ:
+                next_pos, options = self._parse_options(next_pos)
+                next_pos, kind, value = self._lex_cmd_section(next_pos, False)
+            if kind == STEP_FRAGMENT_SEQ:
+                next_pos, main_arg = self._parse_inner_fragment_seq(next_pos, value)
+            elif kind == STEP_NODE:
+                main_arg = value
+
+        cmd_node = Command(
+            phrase.start_pos, next_pos, phrase.phrase, phrase.enclosing, options, main_arg,
+        )
+        return next_pos, cmd_node
 
-    def _parse_bar_phrase_cmd(self, lbar_matchobj: Match[str]) -> tuple[int, Command]:
+    def _parse_options(self, next_pos: int) -> tuple[int, TokenSeq]:
         """
-        Continues syntax the phrase section of the Command
-        which is enclosed by the bar pattern.
+        Parses the options section until reaching the right square brackets.
         """
-        cmd_start_pos, next_pos = lbar_matchobj.span()
-        phrase_enclosing = EnclosingPattern(left=lbar_matchobj['left'])
+        start_pos = next_pos
+        children = []
 
-        inner_matchobj = phrase_enclosing.non_rec_break_re.match(self.src_text, next_pos)
-        if inner_matchobj is None:
-            self._raise_cannot_match_enclosing(next_pos, phrase_enclosing)
+        while True:
+            next_pos, kind, value = self._lex_options_step(next_pos, start_pos)
+            if kind == STEP_NODE:
+                children.append(value)
+            elif kind == STEP_FRAGMENT_SEQ:
+                next_pos, fragment_seq_node = self._parse_inner_fragment_seq(next_pos, value)
+                children.append(fragment_seq_node)
+            elif kind == STEP_COMMAND:
+                next_pos, at_expr_node = self._parse_cmd(next_pos)
+                children.append(at_expr_node)
+            elif kind == STEP_TOKEN_SEQ:
+                next_pos, token_seq_node = self._parse_options(next_pos)
+                children.append(token_seq_node)
+            else:
+                return next_pos, TokenSeq(start_pos, value, children)
 
-        next_pos = inner_matchobj.end()
-        phrase = inner_matchobj['inner']
-        return self._parse_cmd_after_phrase(next_pos, cmd_start_pos, phrase, phrase_enclosing)
+    # The following lexing steps decide what comes next in the input text
+    # and are shared by all variants of parsing tasks
+    # so that the grammar is implemented in a single place.
+    # Each variant then builds (or reports) nodes from the result of each step,
+    # parsing nested nodes in its own way.
+    # Nodes without children are created by the factory methods
+    # (such as _text_node) which variants may override.
 
-    def _parse_cmd_after_phrase(
+    def _lex_fragment_seq_step(
             self,
             next_pos: int,
-            cmd_start_pos: int,
-            phrase: str,
-            phrase_enclosing: EnclosingPattern,
-    ) -> tuple[int, Command]:
-        """
-        Continues syntax the Command after the phrase section.
-        """
-        # If phrase is empty, stop syntax for options or main argument
-        if not phrase:
-            options = None
-            main_arg = None
-        else:
-            # Parses for options section (square brackets)
-            if lbracket_matchobj := _LEXER.lbracket_re.match(self.src_text, next_pos):
-                next_pos = lbracket_matchobj.end()
-                next_pos, options = self._parse_options(next_pos)
-            else:
-                options = None
+            start_pos: int,
+            enclosing: EnclosingPattern,
+    ) -> tuple[int, int, Optional[int]]:
+        """
+        Lexes a single step of a sequence of fragment nodes
+        (which started at ``start_pos``) from the given position:
+        a possibly empty text followed by either an @-switch character
+        or the closing (i.e. right) pattern.
+
+        It returns the ending position of the text, the position right after
+        the @-switch character or the closing pattern, and the ending position
+        of the fragment sequence if the closing pattern was reached
+        (or :const:`None` otherwise).
+        """
+        # Attempts to find the next break pattern
+        found = enclosing.find_rec_break(self.src_text, next_pos)
+        if found is None:
+            self._raise_cannot_match_enclosing(start_pos, enclosing)
+            # Recovers by closing the fragment sequence at the end of input
+            found = len(self.src_text), ''
+        break_pos, break_str = found
+
+        # Dispatch syntax between the @-expression switch
+        # and the closing (i.e. right) pattern
+        next_pos = break_pos + len(break_str)
+        if break_str == '@':
+            return break_pos, next_pos, None
+        return break_pos, next_pos, break_pos
+
+    def _lex_phrase(self, next_pos: int) -> tuple[int, Union[Phrase, ErrorFragment]]:
+        """
+        Lexes the phrase section of @-expressions starting from immediately after @-symbol
+        by attempting to dispatch through lookahead patterns.
+        It returns the next position as well as the phrase
+        (or the error node if the phrase section cannot be recovered from).
+        """
+        if matchobj := _LEXER.id_re.match(self.src_text, next_pos):
+            cmd_start_pos, next_pos = matchobj.span()
+            return next_pos, Phrase(cmd_start_pos, matchobj['id'], _EMPTY_ENCLOSING, True)
 
-            # Parses for main argument
-            if lbrace_matchobj := _LEXER.lbrace_re.match(self.src_text, next_pos):
-                next_pos, main_arg = self._parse_fragment_seq(lbrace_matchobj)
-            elif lquote_matchobj := _LEXER.lquote_re.match(self.src_text, next_pos):
-                next_pos, main_arg = self._parse_text(lquote_matchobj)
-            else:
-                main_arg = None
+        if matchobj := _LEXER.lbar_re.match(self.src_text, next_pos):
+            cmd_start_pos, next_pos = matchobj.span()
+            phrase_enclosing = EnclosingPattern.interned(matchobj['left'])
+            found = phrase_enclosing.find_non_rec_break(self.src_text, next_pos)
+            if found is None:
+                self._raise_cannot_match_enclosing(next_pos, phrase_enclosing)
+                # Recovers by skipping the enclosing left pattern
+                return next_pos, self._error_node(cmd_start_pos, next_pos)
+            break_pos, break_str = found
+            phrase = self.src_text[next_pos:break_pos]
+            # If phrase is empty, stop syntax for options or main argument
+            phrase_tuple = Phrase(cmd_start_pos, phrase, phrase_enclosing, bool(phrase))
+            return break_pos + len(break_str), phrase_tuple
+
+        # A special case of @-expression (called a "single symbol")
+        # where a single-character symbol follows the @-switch character
+        if matchobj := _LEXER.symbol_re.match(self.src_text, next_pos):
+            cmd_start_pos, next_pos = matchobj.span()
+            return next_pos, Phrase(cmd_start_pos, matchobj['symbol'], _EMPTY_ENCLOSING, False)
 
-        # Construct Command node
-        cmd_node = Command(cmd_start_pos, next_pos, phrase, phrase_enclosing, options, main_arg)
-        return next_pos, cmd_node
+        self._raise_invalid_cmd(next_pos)
+        # Recovers by skipping the @-switch character
+        return next_pos, self._error_node(next_pos - 1, next_pos)
 
-    def _parse_fragment_seq(self, lbrace_matchobj: Match[str]) -> tuple[int, FragmentSeq]:
+    def _lex_cmd_section(self, next_pos: int, allow_options: bool) -> tuple[int, int, Any]:
         """
-        Recursively parses the input until the enclosing right pattern
-        corresponding to the enclosing left pattern
-        (captured by the provided match object) is discovered.
+        Lexes the next section of a Command after its phrase section:
+        either the options section (only if ``allow_options`` is set)
+        or the main argument. It returns the next position,
+        the kind of step (see ``STEP_*`` constants) as well as its value:
+
+        - :const:`STEP_TOKEN_SEQ` if the options section begins,
+        - :const:`STEP_FRAGMENT_SEQ` with the enclosing pattern
+          if the main argument is a fragment sequence,
+        - :const:`STEP_NODE` with the text node (or the error node)
+          if the main argument is a quoted text, or
+        - :const:`STEP_END` if there are no more sections.
         """
-        next_pos = lbrace_matchobj.end()
-        enclosing = EnclosingPattern(left=lbrace_matchobj['left'])
-        return self._parse_inner_fragment_seq(next_pos, enclosing)
-
-    def _parse_text(self, lquote_matchobj: Match[str]) -> tuple[int, Text]:
+        # Parses for options section (square brackets)
+        if allow_options:
+            if lbracket_matchobj := _LEXER.lbracket_re.match(self.src_text, next_pos):
+                return lbracket_matchobj.end(), STEP_TOKEN_SEQ, None
+
+        # Parses for main argument
+        if lbrace_matchobj := _LEXER.lbrace_re.match(self.src_text, next_pos):
+            enclosing = EnclosingPattern.interned(lbrace_matchobj['left'])
+            return lbrace_matchobj.end(), STEP_FRAGMENT_SEQ, enclosing
+        if lquote_matchobj := _LEXER.lquote_re.match(self.src_text, next_pos):
+            next_pos, text_node = self._parse_text(lquote_matchobj)
+            return next_pos, STEP_NODE, text_node
+        return next_pos, STEP_END, None
+
+    def _lex_options_step(self, next_pos: int, start_pos: int) -> tuple[int, int, Any]:
+        """
+        Lexes the next token within the options section (which started at ``start_pos``)
+        or the end of the section. It returns the next position,
+        the kind of step (see ``STEP_*`` constants) as well as its value:
+
+        - :const:`STEP_NODE` with the node of a token which has no nested tokens,
+        - :const:`STEP_FRAGMENT_SEQ` with the enclosing pattern
+          if a fragment sequence begins,
+        - :const:`STEP_COMMAND` if an @-expression begins,
+        - :const:`STEP_TOKEN_SEQ` if a sub-level sequence of tokens begins, or
+        - :const:`STEP_END` with the ending position of the options section.
+        """
+        # Remove leading whitespaces
+        next_pos = _LEXER.ws_re.match(self.src_text, next_pos).end()
+
+        # Attempts to extract identifier node
+        if id_matchobj := _LEXER.id_re.match(self.src_text, next_pos):
+            return id_matchobj.end(), STEP_NODE, self._token_node(Identifier, id_matchobj, 'id')
+
+        # Attempts to extract operator node
+        if op_matchobj := _LEXER.op_re.match(self.src_text, next_pos):
+            return op_matchobj.end(), STEP_NODE, self._token_node(Operator, op_matchobj, 'op')
+
+        # Attempts to extract number literal node
+        if num_matchobj := _LEXER.num_re.match(self.src_text, next_pos):
+            return num_matchobj.end(), STEP_NODE, self._token_node(Number, num_matchobj, 'num')
+
+        # Attempts to extract fragment sequence node
+        if lbrace_matchobj := _LEXER.lbrace_re.match(self.src_text, next_pos):
+            enclosing = EnclosingPattern.interned(lbrace_matchobj['left'])
+            return lbrace_matchobj.end(), STEP_FRAGMENT_SEQ, enclosing
+
+        # Attempts to extract text node
+        if lquote_matchobj := _LEXER.lquote_re.match(self.src_text, next_pos):
+            next_pos, text_node = self._parse_text(lquote_matchobj)
+            return next_pos, STEP_NODE, text_node
+
+        # Attempts to extract @-expressions
+        if at_matchobj := _LEXER.at_re.match(self.src_text, next_pos):
+            return at_matchobj.end(), STEP_COMMAND, None
+
+        # Attempts to syntax a sub-level sequence of tokens
+        if lbracket_matchobj := _LEXER.lbracket_re.match(self.src_text, next_pos):
+            return lbracket_matchobj.end(), STEP_TOKEN_SEQ, None
+
+        # Attempts to syntax the end of token sequence
+        if rbracket_matchobj := _LEXER.rbracket_re.match(self.src_text, next_pos):
+            end_pos, next_pos = rbracket_matchobj.span()
+            return next_pos, STEP_END, end_pos
+
+        # Else, something was wrong at the syntax,
+        # perhaps reaching the end of text or found unmatched parenthesis.
+        self._raise_cannot_match_char(start_pos, '[', ']')
+        # Recovers by closing the options section without consuming any input
+        return next_pos, STEP_END, next_pos
+
+    def _parse_text(self, lquote_matchobj: Match[str]) -> tuple[int, Fragment]:
         """
         Continues syntax the input for raw :class:`Text` node
         until the enclosing right pattern corresponding to the
@@ -182,130 +464,85 @@ class ParsingTask:
         is discovered.
         """
         next_pos = lquote_matchobj.end()
-        enclosing = EnclosingPattern(left=lquote_matchobj['left'])
+        enclosing = EnclosingPattern.interned(lquote_matchobj['left'])
 
-        inner_matchobj = enclosing.non_rec_break_re.match(self.src_text, next_pos)
-        if inner_matchobj is None:
+        found = enclosing.find_non_rec_break(self.src_text, next_pos)
+        if found is None:
             self._raise_cannot_match_enclosing(next_pos, enclosing)
+            # Recovers by skipping the enclosing left pattern
+            return next_pos, self._error_node(lquote_matchobj.start(), next_pos)
 
-        next_pos = inner_matchobj.end()
-        text_node = Text.from_matchobj(inner_matchobj, 'inner', enclosing)
-        return next_pos, text_node
-
-    def _parse_single_symbol(self, symbol_matchobj: Match[str]) -> tuple[int, Command]:
-        """
-        A special case of @-expression (called a "single symbol")
-        where a single-character symbol follows the @-switch character.
-        """
-        cmd_start_pos, next_pos = symbol_matchobj.span()
-        phrase = symbol_matchobj['symbol']
-        phrase_enclosing = EnclosingPattern(left='')
-        command_node = Command(
-            cmd_start_pos,
-            next_pos,
-            phrase,
-            phrase_enclosing,
-            options=None,
-            main_arg=None,
-        )
-        return next_pos, command_node
+        break_pos, break_str = found
+        text_node = self._text_node(next_pos, break_pos, enclosing)
+        return break_pos + len(break_str), text_node
 
-    def _parse_options(self, next_pos: int) -> tuple[int, TokenSeq]:
+    def _token_node(
+            self, node_type: type[Token], matchobj: Match[str], capture_name: str,
+    ) -> Token:
         """
-        Parses the options section until reaching the right square brackets.
+        Creates an identifier, operator, or number node (according to ``node_type``)
+        from the given match object under the given capture group name.
         """
-        start_pos = next_pos
-        children = []
-
-        while True:
-            # Remove leading whitespaces
-            ws_matchobj = _LEXER.ws_re.match(self.src_text, next_pos)
-            next_pos = ws_matchobj.end()
-
-            # Attempts to extract identifier node
-            if id_matchobj := _LEXER.id_re.match(self.src_text, next_pos):
-                next_pos = id_matchobj.end()
-                id_node = Identifier.from_matchobj(id_matchobj, 'id')
-                children.append(id_node)
-                continue
-
-            # Attempts to extract operator node
-            if op_matchobj := _LEXER.op_re.match(self.src_text, next_pos):
-                next_pos = op_matchobj.end()
-                op_node = Operator.from_matchobj(op_matchobj, 'op')
-                children.append(op_node)
-                continue
-
-            # Attempts to extract number literal node
-            if num_matchobj := _LEXER.num_re.match(self.src_text, next_pos):
-                next_pos = num_matchobj.end()
-                num_node = Number.from_matchobj(num_matchobj, 'num')
-                children.append(num_node)
-                continue
-
-            # Attempts to extract fragment sequence node
-            if lbrace_matchobj := _LEXER.lbrace_re.match(self.src_text, next_pos):
-                next_pos, fragment_seq_node = self._parse_fragment_seq(lbrace_matchobj)
-                children.append(fragment_seq_node)
-                continue
-
-            # Attempts to extract text node
-            if lquote_matchobj := _LEXER.lquote_re.match(self.src_text, next_pos):
-                next_pos, text_node = self._parse_text(lquote_matchobj)
-                children.append(text_node)
-                continue
+        return node_type.from_matchobj(matchobj, capture_name)
 
-            # Attempts to extract @-expressions
-            if at_matchobj := _LEXER.at_re.match(self.src_text, next_pos):
-                next_pos = at_matchobj.end()
-                next_pos, at_expr_node = self._parse_cmd(next_pos)
-                children.append(at_expr_node)
-                continue
+    def _text_node(self, start_pos: int, end_pos: int, enclosing: EnclosingPattern) -> Text:
+        """
+        Creates a text node whose inner content spans
+        between the given positions of the source text.
+        """
+        if self.lazy_texts:
+            return LazyText(start_pos, end_pos, self.src_text, enclosing)
+        return Text(start_pos, end_pos, self.src_text[start_pos:end_pos], enclosing)
 
-            # Attempts to syntax a sub-level sequence of tokens
-            if lbracket_matchobj := _LEXER.lbracket_re.match(self.src_text, next_pos):
-                next_pos = lbracket_matchobj.end()
-                next_pos, token_seq_node = self._parse_options(next_pos)
-                children.append(token_seq_node)
-                continue
+    def _error_node(self, start_pos: int, end_pos: int) -> ErrorFragment:
+        """
+        Creates an error node for the input text skipped
+        between the given positions while recovering from a syntax error.
+        """
+        return ErrorFragment(start_pos, end_pos, self.src_text[start_pos:end_pos])
 
-            # Attempts to syntax the end of token sequence
-            # Return the token sequence if this is the case
-            if rbracket_matchobj := _LEXER.rbracket_re.match(self.src_text, next_pos):
-                end_pos, next_pos = rbracket_matchobj.span()
-                return next_pos, TokenSeq(start_pos, end_pos, children)
+    def _charloc(self, pos: int) -> CharLoc:
+        """
+        Converts the index of a position within the source text
+        into the line and column values for error reporting.
+        """
+        return CharLoc(self.src_text, pos, self.line_index)
 
-            # Else, something was wrong at the syntax,
-            # perhaps reaching the end of text or found unmatched parenthesis.
-            self._raise_cannot_match_char(start_pos, '[', ']')
+    def _report_error(self, error: PaxterSyntaxError):
+        """
+        Reports the given syntax error, which is raised right away by default.
+        Subclasses may record the error and return instead,
+        in which case parsing resumes by recovering from the error.
+        """
+        raise error
 
     def _raise_cannot_match_enclosing(self, pos: int, enclosing: EnclosingPattern):
         """
-        Raises syntax error for failing to match enclosing right pattern
+        Reports syntax error for failing to match enclosing right pattern
         to the corresponding enclosing left pattern.
         """
-        raise PaxterSyntaxError(
+        self._report_error(PaxterSyntaxError(
             f"cannot match enclosing right pattern {enclosing.right!r} "
             f"to the left pattern {enclosing.left!r} at %(pos)s",
-            pos=CharLoc(self.src_text, pos - len(enclosing.left)),
-        )
+            pos=self._charloc(pos - len(enclosing.left)),
+        ))
 
     def _raise_cannot_match_char(self, pos: int, left_char: str, right_char: str):
         """
-        Raises syntax error for failing to match enclosing right char
+        Reports syntax error for failing to match enclosing right char
         to the corresponding enclosing left char.
         """
-        raise PaxterSyntaxError(
+        self._report_error(PaxterSyntaxError(
             f"cannot match enclosing right character {right_char!r} "
             f"to the left character {left_char!r} at %(pos)s",
-            pos=CharLoc(self.src_text, pos - len(left_char)),
-        )
+            pos=self._charloc(pos - len(left_char)),
+        ))
 
     def _raise_invalid_cmd(self, pos: int):
         """
-        Raises syntax error for failing to syntax @-command.
+        Reports syntax error for failing to syntax @-command.
         """
-        raise PaxterSyntaxError(
+        self._report_error(PaxterSyntaxError(
             "invalid expression after @-command at %(pos)s",
-            pos=CharLoc(self.src_text, pos),
-        )
+            pos=self._charloc(pos),
+        ))
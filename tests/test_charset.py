@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import re
+import sys
+
+import pytest
+
+from paxter.syntax.charset import (
+    OP_RANGES, SYMBOL_RANGES, char_class, chars_from_ranges, load_ranges, scan_ranges,
+)
+
+
+def test_precomputed_ranges_match_unicode_database():
+    assert load_ranges() == scan_ranges()
+
+
+@pytest.mark.parametrize(
+    "ranges",
+    [
+        pytest.param(SYMBOL_RANGES, id="symbol"),
+        pytest.param(OP_RANGES, id="op"),
+        pytest.param(((ord('-'), ord('-')), (ord('['), ord('^'))), id="special"),
+    ],
+)
+def test_char_class_matches_exactly_ranges(ranges):
+    char_class_re = re.compile(char_class(ranges))
+    chars = set(chars_from_ranges(ranges))
+    for c in map(chr, range(sys.maxunicode + 1)):
+        assert bool(char_class_re.fullmatch(c)) == (c in chars)
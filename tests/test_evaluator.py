@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import os
-from typing import Tuple
+import socket
+from typing import Tuple, Union
 
 import pytest
 from click.testing import CliRunner
 
-from paxter.interp import InterpretingTask
+from paxter.exceptions import PaxterRenderError
+from paxter.interp import BindingScope, CompiledTree, InterpretingTask, Scope
 from paxter.quickauthor import create_document_env
 from paxter.quickauthor.elements import Document
-from paxter.syntax import ParsingTask
+from paxter.syntax import MappedTree, ParsingTask, binary
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "document")
 
@@ -44,6 +46,188 @@ def test_evaluator_document(src_file, expected_file):
     assert document.html() == expected_text
 
 
+@pytest.mark.parametrize(("src_file", "expected_file"), TESTS)
+def test_evaluator_mapped_tree(tmp_path, src_file, expected_file):
+    with open(src_file) as fobj:
+        src_text = fobj.read()
+    with open(expected_file) as fobj:
+        expected_text = fobj.read()
+
+    tree_file = tmp_path / 'tree.pxtree'
+    with open(tree_file, 'wb') as fobj:
+        binary.dump(ParsingTask(src_text).parse(), fobj)
+
+    with MappedTree.open(tree_file) as mapped_tree:
+        env = create_document_env()
+        rendered = InterpretingTask(src_text, env, mapped_tree.root).interp()
+        document = Document.from_fragments(rendered)
+        assert document.html() == expected_text
+
+
+@pytest.mark.parametrize(("src_file", "expected_file"), TESTS)
+def test_evaluator_compiled_tree(src_file, expected_file):
+    with open(src_file) as fobj:
+        src_text = fobj.read()
+    with open(expected_file) as fobj:
+        expected_text = fobj.read()
+
+    compiled_tree = CompiledTree(src_text, ParsingTask(src_text).parse())
+    for _ in range(3):
+        rendered = compiled_tree.interp(create_document_env())
+        document = Document.from_fragments(rendered)
+        assert document.html() == expected_text
+
+
+@pytest.mark.parametrize("src_text", [
+    "@f[1, @g{x}, key=2.5]{main}",
+    "@for[i in @items]{@f[@i, key=@if[@i then {yes} else {no}]]}",
+    "@python##\"n = 3\"##@n",
+    "@f[key=1, 2]",
+    "@f[key=1, key=2]",
+    "@f[1 2]",
+    "@f[[1]]",
+    "@missing{x}",
+])
+def test_compiled_tree_matches_interpreter(src_text):
+    parsed_tree = ParsingTask(src_text).parse()
+    compiled_tree = CompiledTree(src_text, parsed_tree)
+
+    def render(interp):
+        env = create_document_env({
+            'f': lambda *args, **kwargs: (args, kwargs),
+            'g': lambda text: ''.join(text).upper(),
+            'items': [0, 1],
+        })
+        try:
+            return interp(env)
+        except PaxterRenderError as exc:
+            return exc.message
+
+    expected = render(lambda env: InterpretingTask(src_text, env, parsed_tree).interp())
+    assert render(compiled_tree.interp) == expected
+    assert render(compiled_tree.interp) == expected
+
+
+def test_register_transformer():
+    from paxter.syntax import ErrorFragment, RecoveringParsingTask
+
+    class LenientInterpretingTask(InterpretingTask):
+        def transform_text(self, token):
+            return token.inner.upper()
+
+    @LenientInterpretingTask.register_transformer(ErrorFragment)
+    def transform_error_fragment(task, fragment):
+        return f"<{fragment.inner}>"
+
+    src_text = "a @ b"
+    parsed_tree = RecoveringParsingTask(src_text).parse()
+    env = create_document_env()
+    rendered = LenientInterpretingTask(src_text, env, parsed_tree).interp()
+    assert list(rendered) == ["A ", "<@>", " B"]
+
+    # The base class is not affected by the registration to the subclass
+    with pytest.raises(PaxterRenderError, match="unrecognized fragment"):
+        InterpretingTask(src_text, env, parsed_tree).interp()
+
+
+def test_phrase_cache():
+    from paxter.quickauthor import run_simple_paxter
+    from paxter.quickauthor.standards import configure_phrase_cache, phrase_cache_info
+
+    src_text = "@for[row in @rows]{@| row['values'][0] + 1|}"
+    env = create_document_env({'rows': [{'values': [i]} for i in range(5)]})
+    try:
+        configure_phrase_cache(maxsize=8)
+        assert list(run_simple_paxter(src_text, env).flatten()) == [1, 2, 3, 4, 5]
+        info = phrase_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (4, 1, 8, 1)
+
+        configure_phrase_cache(maxsize=0)
+        assert list(run_simple_paxter(src_text, env).flatten()) == [1, 2, 3, 4, 5]
+        assert phrase_cache_info().hits == 0
+    finally:
+        configure_phrase_cache()
+
+
+def test_python_cache():
+    from paxter.quickauthor import run_simple_paxter
+    from paxter.quickauthor.standards import configure_python_cache, python_cache_info
+
+    src_text = '@python##"\n    total = sum(range(count))\n"##@total'
+    try:
+        configure_python_cache(maxsize=8)
+        for count in [3, 5]:
+            env = create_document_env({'count': count})
+            assert list(run_simple_paxter(src_text, env)) == [sum(range(count))]
+        info = python_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 8, 1)
+    finally:
+        configure_python_cache()
+
+
+def test_scope():
+    base_env = {'a': 1, 'b': 2}
+    env = Scope(base_env, b=3)
+    env['c'] = 4
+    assert (env['a'], env['b'], env['c']) == (1, 3, 4)
+    assert 'a' in env and 'd' not in env
+    assert env.get('a') == 1 and env.get('d') is None
+    assert eval('a + b + c', env) == 8
+    with pytest.raises(KeyError):
+        env['d']
+    assert base_env == {'a': 1, 'b': 2}
+
+    scope = BindingScope(env, a=5)
+    exec('a += 1\nd = a + c', scope)
+    assert (scope['a'], env['a'], env['d']) == (6, 1, 10)
+    del scope['d']
+    assert 'd' not in env and scope['a'] == 6
+
+
+def test_scoped_for_statement():
+    src_text = (
+        '@python##"total = 0"##'
+        '@for[i in @items]{@python##"total += i"##@i @total,}'
+        '@total'
+    )
+    parsed_tree = ParsingTask(src_text).parse()
+    base_env = create_document_env({'items': [1, 2, 3]})
+    base_keys = set(base_env)
+
+    env = Scope(base_env)
+    rendered = InterpretingTask(src_text, env, parsed_tree).interp()
+    assert list(rendered.flatten()) == [1, ' ', 1, ',', 2, ' ', 3, ',', 3, ' ', 6, ',', 6]
+    assert 'i' not in env
+    assert env['total'] == 6
+    assert set(base_env) == base_keys
+
+    env = Scope(base_env, i='outer')
+    InterpretingTask(src_text, env, parsed_tree).interp()
+    assert env['i'] == 'outer'
+    src_text = '@for[i in @items]{@for[i in @items]{@i}@i}'
+    parsed_tree = ParsingTask(src_text).parse()
+    rendered = InterpretingTask(src_text, Scope(base_env), parsed_tree).interp()
+    assert list(rendered.flatten()) == [1, 2, 3, 1, 1, 2, 3, 2, 1, 2, 3, 3]
+
+
+def test_for_statement_shared_env():
+    # Renderings sharing the same environment (without scopes of their own)
+    # neither see nor remove each other's loop variables
+    inner_text = '@for[i in @items]{@i}'
+    inner_tree = ParsingTask(inner_text).parse()
+    env = create_document_env({'items': ['a', 'b'], 'numbers': [1, 2]})
+
+    def render_inner():
+        return InterpretingTask(inner_text, env, inner_tree).interp()
+
+    env['render_inner'] = render_inner
+    src_text = '@python##"count = 0"##@for[i in @numbers]{@i@render_inner[]@i@python##"count += 1"##}'
+    rendered = InterpretingTask(src_text, env, ParsingTask(src_text).parse()).interp()
+    assert list(rendered.flatten()) == [1, 'a', 'b', 1, 2, 'a', 'b', 2]
+    assert 'i' not in env
+    assert env['count'] == 2
+
+
 @pytest.mark.parametrize(("src_file", "expected_file"), TESTS)
 def test_cli_document(src_file, expected_file):
     from paxter.__main__ import program
@@ -54,3 +238,192 @@ def test_cli_document(src_file, expected_file):
     runner = CliRunner()
     result = runner.invoke(program, ['html', '-i', src_file])
     assert result.output == expected_text + '\n'
+
+
+def test_build_site(tmp_path):
+    from paxter.quickauthor import build_site
+
+    src_dir = tmp_path / 'src'
+    out_dir = tmp_path / 'out'
+    (src_dir / 'sub').mkdir(parents=True)
+    for param, target in zip(TESTS, [src_dir, src_dir / 'sub']):
+        src_file, _ = param.values
+        with open(src_file) as fobj:
+            (target / os.path.basename(src_file)).write_text(fobj.read())
+    (src_dir / 'bad.paxter').write_text('@a{')
+    (src_dir / 'notes.txt').write_text('@a{')
+
+    results = build_site(str(src_dir), str(out_dir), workers=1)
+    assert [os.path.relpath(result.out_path, out_dir) for result in results] == [
+        'bad.html', 'blog.html', os.path.join('sub', 'table.html'),
+    ]
+    assert [result.skipped for result in results] == [False, False, False]
+    assert results[0].error.startswith("cannot match enclosing right pattern")
+    assert not os.path.exists(results[0].out_path)
+    for result, param in zip(results[1:], TESTS):
+        _, expected_file = param.values
+        with open(expected_file) as fobj, open(result.out_path) as out_fobj:
+            assert out_fobj.read() == fobj.read() + '\n'
+
+    results = build_site(str(src_dir), str(out_dir), workers=1)
+    assert [result.skipped for result in results] == [False, True, True]
+    out_mtime = os.stat(results[1].out_path).st_mtime_ns
+    os.utime(results[1].src_path, ns=(out_mtime + 10 ** 9, out_mtime + 10 ** 9))
+    results = build_site(str(src_dir), str(out_dir), workers=2)
+    assert [result.skipped for result in results] == [False, False, True]
+    assert results[1].error is None
+
+
+def test_cli_build(tmp_path):
+    from paxter.__main__ import program
+
+    src_dir = tmp_path / 'src'
+    src_dir.mkdir()
+    (src_dir / 'a.paxter').write_text('@bold{a}')
+    (src_dir / 'b.paxter').write_text('@a{')
+
+    runner = CliRunner()
+    result = runner.invoke(program, ['build', str(src_dir), str(tmp_path / 'out'), '-j', '2'])
+    assert result.exit_code == 1
+    assert "failed 1" in result.output.splitlines()[-1]
+    assert "b.paxter: cannot match" in result.output
+    assert (tmp_path / 'out' / 'a.html').read_text() == '<b>a</b>\n'
+
+
+def test_watch_site(tmp_path):
+    from paxter.quickauthor import watch_site
+
+    src_dir = tmp_path / 'src'
+    out_dir = tmp_path / 'out'
+    src_dir.mkdir()
+    env_file = tmp_path / 'env.py'
+    env_file.write_text("name = 'world'\n")
+    (src_dir / 'a.paxter').write_text('@bold{a}')
+    (src_dir / 'b.paxter').write_text('Hello @name')
+
+    def touch(path, text):
+        mtime = path.stat().st_mtime_ns if path.exists() else 0
+        path.write_text(text)
+        os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+    rounds = watch_site(str(src_dir), str(out_dir), str(env_file), workers=1, interval=0.01)
+    assert [os.path.basename(result.src_path) for result in next(rounds)] == [
+        'a.paxter', 'b.paxter',
+    ]
+
+    touch(src_dir / 'a.paxter', '@italic{a}')
+    assert [os.path.basename(result.src_path) for result in next(rounds)] == ['a.paxter']
+    assert (out_dir / 'a.html').read_text() == '<i>a</i>\n'
+
+    touch(src_dir / 'c.paxter', '@c{')
+    (result,) = next(rounds)
+    assert os.path.basename(result.src_path) == 'c.paxter'
+    assert result.error is not None
+
+    touch(env_file, "name = 'there'\n")
+    assert len(next(rounds)) == 3
+    assert (out_dir / 'b.html').read_text() == '<p>Hello there</p>\n'
+
+    touch(env_file, "name = \n")
+    touch(src_dir / 'b.paxter', 'Bye @name')
+    env_result, b_result = next(rounds)
+    assert env_result.src_path == str(env_file)
+    assert env_result.error.startswith("SyntaxError: ")
+    assert b_result.error is None
+    assert (out_dir / 'b.html').read_text() == '<p>Bye there</p>\n'
+
+    (src_dir / 'd.paxter').write_bytes(b'\xff')
+    touch(src_dir / 'e.paxter', '@python"1 / 0"')
+    d_result, e_result = next(rounds)
+    assert d_result.error.startswith("UnicodeDecodeError: ")
+    assert e_result.error is not None
+    rounds.close()
+
+
+def test_render_server(tmp_path, monkeypatch):
+    import threading
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
+    from paxter.quickauthor.server import RenderRequestHandler, RenderServer
+
+    env_file = tmp_path / 'env.py'
+    env_file.write_text("name = 'world'\n")
+    monkeypatch.setattr(RenderRequestHandler, 'log_message', lambda *args: None)
+    server = RenderServer(('127.0.0.1', 0), {'default': None, 'greet': str(env_file)})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    def post(path: str, src_text: Union[str, bytes], **headers: str) -> tuple[int, str]:
+        if isinstance(src_text, str):
+            src_text = src_text.encode('utf-8')
+        headers.setdefault('Content-Type', 'application/x-paxter')
+        try:
+            with urlopen(Request(base_url + path, src_text, headers)) as response:
+                return response.status, response.read().decode('utf-8')
+        except HTTPError as exc:
+            return exc.code, exc.read().decode('utf-8')
+
+    try:
+        with open(TESTS[0].values[0]) as fobj:
+            src_text = fobj.read()
+        with open(TESTS[0].values[1]) as fobj:
+            assert post('/render', src_text) == (200, fobj.read())
+        assert post('/render?env=greet', 'Hello @name') == (200, '<p>Hello world</p>')
+        assert post('/render?env=greet', '@python##"\nname = 1\n"##') == (200, '')
+        assert post('/render?env=greet', '@name') == (200, '<p>world</p>')
+        assert post('/render', 'Hello @name')[0] == 422
+        assert post('/render', '@a{')[1].startswith("cannot match enclosing right pattern")
+        assert post('/render?env=other', '')[0] == 404
+        assert post('/other', '')[0] == 404
+        assert post('/render', b'Hello \xff')[0] == 400
+
+        assert post('/render', 'Hello', Origin='https://example.com')[0] == 403
+        assert post('/render', 'Hello', **{'Content-Type': 'text/plain'})[0] == 415
+        assert post('/render', 'Hello', **{'Content-Type': 'application/x-paxter; charset=utf-8'}) == (
+            200, '<p>Hello</p>',
+        )
+
+        with socket.create_connection(server.server_address) as sock:
+            sock.sendall(
+                b'POST /render HTTP/1.0\r\nContent-Type: application/x-paxter\r\n'
+                b'Content-Length: abc\r\n\r\n',
+            )
+            assert sock.makefile('rb').readline().split()[1] == b'400'
+
+        def fail_render(src_text, env_name):
+            raise RuntimeError("broken environment")
+
+        monkeypatch.setattr(server, 'render', fail_render)
+        assert post('/render', 'Hello') == (500, "RuntimeError: broken environment")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="requires Unix domain sockets")
+def test_unix_render_server(tmp_path, monkeypatch):
+    import threading
+
+    from paxter.quickauthor.server import RenderRequestHandler, UnixRenderServer
+
+    monkeypatch.setattr(RenderRequestHandler, 'log_message', lambda *args: None)
+    socket_path = str(tmp_path / 'paxter.sock')
+    server = UnixRenderServer(socket_path, {'default': None})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(socket_path)
+            sock.sendall(
+                b'POST /render HTTP/1.0\r\nContent-Type: application/x-paxter\r\n'
+                b'Content-Length: 8\r\n\r\n@bold{a}',
+            )
+            response = sock.makefile('rb').read()
+        assert response.split()[1] == b'200'
+        assert response.endswith(b'\r\n\r\n<b>a</b>')
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not os.path.exists(socket_path)
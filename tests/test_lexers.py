@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from paxter.syntax.lexers import CacheInfo, LazyPattern, Lexer, PatternCache
+
+
+def test_lazy_pattern_compiles_on_first_access():
+    class DummyLexer:
+        word_re = LazyPattern(lambda: r'\w+')
+
+    descriptor = vars(DummyLexer)['word_re']
+    assert not descriptor.compiled
+    assert DummyLexer().word_re.fullmatch('hello')
+    assert descriptor.compiled
+    assert DummyLexer.word_re is DummyLexer().word_re
+
+
+def test_warm_up_compiles_all_patterns():
+    Lexer.warm_up()
+    assert all(
+        value.compiled
+        for value in vars(Lexer).values()
+        if isinstance(value, LazyPattern)
+    )
+
+
+def test_pattern_cache_evicts_least_recently_used():
+    cache = PatternCache(maxsize=2)
+    first = cache.get('a', re.escape)
+    cache.get('b', re.escape)
+    assert cache.get('a', re.escape) is first
+    cache.get('c', re.escape)  # evicts 'b'
+    assert cache.info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+    cache.get('b', re.escape)
+    assert cache.info().misses == 4
+
+
+def test_lexer_break_cache_stays_bounded():
+    lexer = Lexer(break_cache_size=8)
+    for size in range(100):
+        right_pattern = '}' + '#' * size
+        assert lexer.rec_break_re(right_pattern).match(f'x@{right_pattern}')['break'] == '@'
+        assert lexer.non_rec_break_re(right_pattern).match(f'x@{right_pattern}')['inner'] == 'x@'
+    info = lexer.cache_info()
+    assert info['rec_break'].currsize == info['non_rec_break'].currsize == 8
+    assert info['rec_break'].misses == 100
+
+
+def test_pattern_cache_is_thread_safe():
+    cache = PatternCache(maxsize=16)
+
+    def worker(offset: int):
+        for i in range(200):
+            cache.get(str((i + offset) % 32), re.escape)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(worker, range(8)))
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 200
+    assert info.currsize == 16
+
+
+@pytest.mark.parametrize(
+    ("src_text", "right_pattern", "expected"),
+    [
+        pytest.param('abc}##', '}##', (3, '}##'), id="right"),
+        pytest.param('a}#b@c}##', '}##', (4, '@'), id="at-before-right"),
+        pytest.param('a}#b}##@', '}##', (4, '}##'), id="fewer-hashes-skipped"),
+        pytest.param('abc}#', '}##', None, id="not-found"),
+    ],
+)
+def test_find_rec_break(src_text, right_pattern, expected):
+    lexer = Lexer()
+    assert lexer.find_rec_break(src_text, 0, right_pattern) == expected
+    matchobj = lexer.rec_break_re(right_pattern).match(src_text)
+    if expected is None:
+        assert matchobj is None
+    else:
+        assert (matchobj.end('inner'), matchobj['break']) == expected
+
+
+@pytest.mark.parametrize("right_pattern", ['', '|', '"#'])
+def test_find_rec_break_unsupported(right_pattern):
+    with pytest.raises(ValueError):
+        Lexer().find_rec_break('a"b|c@', 0, right_pattern)
@@ -1,974 +1,881 @@
 from __future__ import annotations
 
+import io
+import os
+import pickle
+import subprocess
+import sys
+from array import array
+from dataclasses import dataclass
+
 import pytest
 
+from paxter.exceptions import PaxterSyntaxError
 from paxter.syntax import (
-    Command, EnclosingPattern, FragmentSeq, GlobalEnclosingPattern, Identifier,
-    Number, Operator, ParsingTask, Text, Token, TokenSeq,
+    CharLoc, Command, EnclosingPattern, ErrorFragment, Event, EventParsingTask, FlatTree,
+    FragmentSeq, GlobalEnclosingPattern, Identifier, IterativeParsingTask, LazyText, LineIndex,
+    MappedTree, Number, Operator, ParseCache, ParsingTask, RecoveringParsingTask,
+    StreamingParsingTask, Text, TextEdit, Token, TokenSeq, parse_many,
 )
+from paxter.syntax import binary, events, flat, mapped
 
-
-@pytest.mark.parametrize(
-    ("src_text", "expected"),
-    [
-        pytest.param(
-            '',
-            FragmentSeq(
-                start_pos=0, end_pos=0,
-                children=[],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+PARSER_TESTS = [
+    pytest.param(
+        '',
+        FragmentSeq(
+            start_pos=0, end_pos=0,
+            children=[],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '1',
-            FragmentSeq(
-                start_pos=0, end_pos=1,
-                children=[
-                    Text(
-                        start_pos=0, end_pos=1,
-                        inner="1",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+    ),
+    pytest.param(
+        '1',
+        FragmentSeq(
+            start_pos=0, end_pos=1,
+            children=[
+                Text(
+                    start_pos=0, end_pos=1,
+                    inner="1",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@hello',
-            FragmentSeq(
-                start_pos=0, end_pos=6,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=6,
-                        phrase="hello",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+    ),
+    pytest.param(
+        '@hello',
+        FragmentSeq(
+            start_pos=0, end_pos=6,
+            children=[
+                Command(
+                    start_pos=1, end_pos=6,
+                    phrase="hello",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            'Hello, my name is @name.',
-            FragmentSeq(
-                start_pos=0, end_pos=24,
-                children=[
-                    Text(
-                        start_pos=0, end_pos=18,
-                        inner="Hello, my name is ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=19, end_pos=23,
-                        phrase="name",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=23, end_pos=24,
-                        inner=".",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+    ),
+    pytest.param(
+        'Hello, my name is @name.',
+        FragmentSeq(
+            start_pos=0, end_pos=24,
+            children=[
+                Text(
+                    start_pos=0, end_pos=18,
+                    inner="Hello, my name is ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=19, end_pos=23,
+                    phrase="name",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=23, end_pos=24,
+                    inner=".",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            'The result of 1 + 1 is @|1 + 1|. Yes! @##|1 + 1|##',
-            FragmentSeq(
-                start_pos=0, end_pos=50,
-                children=[
-                    Text(
-                        start_pos=0, end_pos=23,
-                        inner="The result of 1 + 1 is ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=24, end_pos=31,
-                        phrase="1 + 1",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=31, end_pos=38,
-                        inner=". Yes! ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=39, end_pos=50,
-                        phrase="1 + 1",
-                        phrase_enclosing=EnclosingPattern(left="##|", right="|##"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+    ),
+    pytest.param(
+        'The result of 1 + 1 is @|1 + 1|. Yes! @##|1 + 1|##',
+        FragmentSeq(
+            start_pos=0, end_pos=50,
+            children=[
+                Text(
+                    start_pos=0, end_pos=23,
+                    inner="The result of 1 + 1 is ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=24, end_pos=31,
+                    phrase="1 + 1",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=31, end_pos=38,
+                    inner=". Yes! ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=39, end_pos=50,
+                    phrase="1 + 1",
+                    phrase_enclosing=EnclosingPattern(left="##|", right="|##"),
+                    options=None,
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@|N @ M @ K|',
-            FragmentSeq(
-                start_pos=0, end_pos=12,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=12,
-                        phrase="N @ M @ K",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+    ),
+    pytest.param(
+        '@|N @ M @ K|',
+        FragmentSeq(
+            start_pos=0, end_pos=12,
+            children=[
+                Command(
+                    start_pos=1, end_pos=12,
+                    phrase="N @ M @ K",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@##|#|#|#|## @||@|@|@|,|@|;|@|#|@#|||#  @@@,@;@#@@@"@{@}',
-            FragmentSeq(
-                start_pos=0, end_pos=56,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=12,
-                        phrase="#|#|#",
-                        phrase_enclosing=EnclosingPattern(left="##|", right="|##"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=12, end_pos=13,
-                        inner=" ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=14, end_pos=16,
-                        phrase="",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=17, end_pos=20,
-                        phrase="@",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=21, end_pos=24,
-                        phrase=",",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=25, end_pos=28,
-                        phrase=";",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=29, end_pos=32,
-                        phrase="#",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=33, end_pos=38,
-                        phrase="|",
-                        phrase_enclosing=EnclosingPattern(left="#|", right="|#"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=38, end_pos=40,
-                        inner="  ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=41, end_pos=42,
-                        phrase="@",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=43, end_pos=44,
-                        phrase=",",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=45, end_pos=46,
-                        phrase=";",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=47, end_pos=48,
-                        phrase="#",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=49, end_pos=50,
-                        phrase="@",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=51, end_pos=52,
-                        phrase='"',
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=53, end_pos=54,
-                        phrase="{",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Command(
-                        start_pos=55, end_pos=56,
-                        phrase="}",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+    ),
+    pytest.param(
+        '@##|#|#|#|## @||@|@|@|,|@|;|@|#|@#|||#  @@@,@;@#@@@"@{@}',
+        FragmentSeq(
+            start_pos=0, end_pos=56,
+            children=[
+                Command(
+                    start_pos=1, end_pos=12,
+                    phrase="#|#|#",
+                    phrase_enclosing=EnclosingPattern(left="##|", right="|##"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=12, end_pos=13,
+                    inner=" ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=14, end_pos=16,
+                    phrase="",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=17, end_pos=20,
+                    phrase="@",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=21, end_pos=24,
+                    phrase=",",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=25, end_pos=28,
+                    phrase=";",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=29, end_pos=32,
+                    phrase="#",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=33, end_pos=38,
+                    phrase="|",
+                    phrase_enclosing=EnclosingPattern(left="#|", right="|#"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=38, end_pos=40,
+                    inner="  ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=41, end_pos=42,
+                    phrase="@",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=43, end_pos=44,
+                    phrase=",",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=45, end_pos=46,
+                    phrase=";",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=47, end_pos=48,
+                    phrase="#",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=49, end_pos=50,
+                    phrase="@",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=51, end_pos=52,
+                    phrase='"',
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=53, end_pos=54,
+                    phrase="{",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Command(
+                    start_pos=55, end_pos=56,
+                    phrase="}",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@||["foo"]{bar} @|@|["foo"]{bar} @@["foo"]{bar}',
-            FragmentSeq(
-                start_pos=0, end_pos=47,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=3,
-                        phrase="",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=3, end_pos=16,
-                        inner='["foo"]{bar} ',
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=17, end_pos=32,
-                        phrase="@",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=TokenSeq(
-                            start_pos=21, end_pos=26,
-                            children=[
-                                Text(
-                                    start_pos=22,
-                                    end_pos=25,
-                                    inner="foo",
-                                    enclosing=EnclosingPattern(left='"', right='"'),
-                                ),
-                            ],
-                        ),
-                        main_arg=FragmentSeq(
-                            start_pos=28, end_pos=31,
-                            children=[
-                                Text(
-                                    start_pos=28, end_pos=31,
-                                    inner="bar",
-                                    enclosing=EnclosingPattern(left="", right=""),
-                                ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
+    ),
+    pytest.param(
+        '@||["foo"]{bar} @|@|["foo"]{bar} @@["foo"]{bar}',
+        FragmentSeq(
+            start_pos=0, end_pos=47,
+            children=[
+                Command(
+                    start_pos=1, end_pos=3,
+                    phrase="",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=3, end_pos=16,
+                    inner='["foo"]{bar} ',
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=17, end_pos=32,
+                    phrase="@",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=TokenSeq(
+                        start_pos=21, end_pos=26,
+                        children=[
+                            Text(
+                                start_pos=22,
+                                end_pos=25,
+                                inner="foo",
+                                enclosing=EnclosingPattern(left='"', right='"'),
+                            ),
+                        ],
                     ),
-                    Text(
-                        start_pos=32, end_pos=33,
-                        inner=" ",
-                        enclosing=EnclosingPattern(left="", right=""),
+                    main_arg=FragmentSeq(
+                        start_pos=28, end_pos=31,
+                        children=[
+                            Text(
+                                start_pos=28, end_pos=31,
+                                inner="bar",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
                     ),
-                    Command(
-                        start_pos=34, end_pos=35,
-                        phrase="@",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=35, end_pos=47,
-                        inner='["foo"]{bar}',
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                ),
+                Text(
+                    start_pos=32, end_pos=33,
+                    inner=" ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=34, end_pos=35,
+                    phrase="@",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=35, end_pos=47,
+                    inner='["foo"]{bar}',
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            'This is @em{not} a drill!',
-            FragmentSeq(
-                start_pos=0, end_pos=25,
-                children=[
-                    Text(
-                        start_pos=0, end_pos=8,
-                        inner="This is ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=9, end_pos=16,
-                        phrase="em",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=FragmentSeq(
-                            start_pos=12, end_pos=15,
-                            children=[
-                                Text(
-                                    start_pos=12, end_pos=15,
-                                    inner="not",
-                                    enclosing=EnclosingPattern(left="", right=""),
-                                ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
-                    ),
-                    Text(
-                        start_pos=16, end_pos=25,
-                        inner=" a drill!",
-                        enclosing=EnclosingPattern(left="", right=""),
+    ),
+    pytest.param(
+        'This is @em{not} a drill!',
+        FragmentSeq(
+            start_pos=0, end_pos=25,
+            children=[
+                Text(
+                    start_pos=0, end_pos=8,
+                    inner="This is ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=9, end_pos=16,
+                    phrase="em",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=FragmentSeq(
+                        start_pos=12, end_pos=15,
+                        children=[
+                            Text(
+                                start_pos=12, end_pos=15,
+                                inner="not",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                ),
+                Text(
+                    start_pos=16, end_pos=25,
+                    inner=" a drill!",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@|foo.process|{yes} @#|foo#process|#["no"]#"#"#',
-            FragmentSeq(
-                start_pos=0, end_pos=47,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=19,
-                        phrase="foo.process",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=FragmentSeq(
-                            start_pos=15, end_pos=18,
-                            children=[
-                                Text(
-                                    start_pos=15, end_pos=18,
-                                    inner="yes",
-                                    enclosing=EnclosingPattern(left="", right=""),
-                                ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
+    ),
+    pytest.param(
+        '@|foo.process|{yes} @#|foo#process|#["no"]#"#"#',
+        FragmentSeq(
+            start_pos=0, end_pos=47,
+            children=[
+                Command(
+                    start_pos=1, end_pos=19,
+                    phrase="foo.process",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=FragmentSeq(
+                        start_pos=15, end_pos=18,
+                        children=[
+                            Text(
+                                start_pos=15, end_pos=18,
+                                inner="yes",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
                     ),
-                    Text(
-                        start_pos=19, end_pos=20,
-                        inner=" ",
-                        enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Text(
+                    start_pos=19, end_pos=20,
+                    inner=" ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=21, end_pos=47,
+                    phrase="foo#process",
+                    phrase_enclosing=EnclosingPattern(left="#|", right="|#"),
+                    options=TokenSeq(
+                        start_pos=37, end_pos=41,
+                        children=[
+                            Text(
+                                start_pos=38, end_pos=40,
+                                inner="no",
+                                enclosing=EnclosingPattern(left='"', right='"'),
+                            ),
+                        ],
                     ),
-                    Command(
-                        start_pos=21, end_pos=47,
-                        phrase="foo#process",
-                        phrase_enclosing=EnclosingPattern(left="#|", right="|#"),
-                        options=TokenSeq(
-                            start_pos=37, end_pos=41,
-                            children=[
-                                Text(
-                                    start_pos=38, end_pos=40,
-                                    inner="no",
-                                    enclosing=EnclosingPattern(left='"', right='"'),
-                                ),
-                            ],
-                        ),
-                        main_arg=Text(
-                            start_pos=44, end_pos=45,
-                            inner="#",
-                            enclosing=EnclosingPattern(left='#"', right='"#'),
-                        ),
+                    main_arg=Text(
+                        start_pos=44, end_pos=45,
+                        inner="#",
+                        enclosing=EnclosingPattern(left='#"', right='"#'),
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            "Level 0 @level1{ @level2{ @level3 } }",
-            FragmentSeq(
-                start_pos=0, end_pos=37,
-                children=[
-                    Text(
-                        start_pos=0, end_pos=8,
-                        inner="Level 0 ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=9, end_pos=37,
-                        phrase="level1",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=FragmentSeq(
-                            start_pos=16, end_pos=36,
-                            children=[
-                                Text(
-                                    start_pos=16, end_pos=17,
-                                    inner=" ",
-                                    enclosing=EnclosingPattern(left="", right=""),
+    ),
+    pytest.param(
+        "Level 0 @level1{ @level2{ @level3 } }",
+        FragmentSeq(
+            start_pos=0, end_pos=37,
+            children=[
+                Text(
+                    start_pos=0, end_pos=8,
+                    inner="Level 0 ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=9, end_pos=37,
+                    phrase="level1",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=FragmentSeq(
+                        start_pos=16, end_pos=36,
+                        children=[
+                            Text(
+                                start_pos=16, end_pos=17,
+                                inner=" ",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                            Command(
+                                start_pos=18, end_pos=35,
+                                phrase="level2",
+                                phrase_enclosing=EnclosingPattern(
+                                    left="", right="",
                                 ),
-                                Command(
-                                    start_pos=18, end_pos=35,
-                                    phrase="level2",
-                                    phrase_enclosing=EnclosingPattern(
-                                        left="", right="",
-                                    ),
-                                    options=None,
-                                    main_arg=FragmentSeq(
-                                        start_pos=25, end_pos=34,
-                                        children=[
-                                            Text(
-                                                start_pos=25, end_pos=26,
-                                                inner=" ",
-                                                enclosing=EnclosingPattern(
-                                                    left="", right="",
-                                                ),
+                                options=None,
+                                main_arg=FragmentSeq(
+                                    start_pos=25, end_pos=34,
+                                    children=[
+                                        Text(
+                                            start_pos=25, end_pos=26,
+                                            inner=" ",
+                                            enclosing=EnclosingPattern(
+                                                left="", right="",
                                             ),
-                                            Command(
-                                                start_pos=27, end_pos=33,
-                                                phrase="level3",
-                                                phrase_enclosing=EnclosingPattern(
-                                                    left="", right="",
-                                                ),
-                                                options=None,
-                                                main_arg=None,
+                                        ),
+                                        Command(
+                                            start_pos=27, end_pos=33,
+                                            phrase="level3",
+                                            phrase_enclosing=EnclosingPattern(
+                                                left="", right="",
                                             ),
-                                            Text(
-                                                start_pos=33, end_pos=34,
-                                                inner=" ",
-                                                enclosing=EnclosingPattern(
-                                                    left="", right="",
-                                                ),
+                                            options=None,
+                                            main_arg=None,
+                                        ),
+                                        Text(
+                                            start_pos=33, end_pos=34,
+                                            inner=" ",
+                                            enclosing=EnclosingPattern(
+                                                left="", right="",
                                             ),
-                                        ],
-                                        enclosing=EnclosingPattern(left="{", right="}"),
-                                    ),
-                                ),
-                                Text(
-                                    start_pos=35, end_pos=36,
-                                    inner=" ",
-                                    enclosing=EnclosingPattern(left="", right=""),
+                                        ),
+                                    ],
+                                    enclosing=EnclosingPattern(left="{", right="}"),
                                 ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
+                            ),
+                            Text(
+                                start_pos=35, end_pos=36,
+                                inner=" ",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@say[greet=##"hello"##]{John} at @email##"john@example.com"##!',
-            FragmentSeq(
-                start_pos=0, end_pos=62,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=29,
-                        phrase="say",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=5, end_pos=22,
-                            children=[
-                                Identifier(start_pos=5, end_pos=10, name="greet"),
-                                Operator(start_pos=10, end_pos=11, symbols="="),
-                                Text(
-                                    start_pos=14, end_pos=19,
-                                    inner="hello",
-                                    enclosing=EnclosingPattern(left='##"', right='"##'),
-                                ),
-                            ],
-                        ),
-                        main_arg=FragmentSeq(
-                            start_pos=24, end_pos=28,
-                            children=[
-                                Text(
-                                    start_pos=24, end_pos=28,
-                                    inner="John",
-                                    enclosing=EnclosingPattern(left="", right=""),
-                                ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
-                    ),
-                    Text(
-                        start_pos=29, end_pos=33,
-                        inner=" at ",
-                        enclosing=EnclosingPattern(left="", right=""),
+    ),
+    pytest.param(
+        '@say[greet=##"hello"##]{John} at @email##"john@example.com"##!',
+        FragmentSeq(
+            start_pos=0, end_pos=62,
+            children=[
+                Command(
+                    start_pos=1, end_pos=29,
+                    phrase="say",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=5, end_pos=22,
+                        children=[
+                            Identifier(start_pos=5, end_pos=10, name="greet"),
+                            Operator(start_pos=10, end_pos=11, symbols="="),
+                            Text(
+                                start_pos=14, end_pos=19,
+                                inner="hello",
+                                enclosing=EnclosingPattern(left='##"', right='"##'),
+                            ),
+                        ],
                     ),
-                    Command(
-                        start_pos=34, end_pos=61,
-                        phrase="email",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=Text(
-                            start_pos=42, end_pos=58,
-                            inner="john@example.com",
-                            enclosing=EnclosingPattern(left='##"', right='"##'),
-                        ),
+                    main_arg=FragmentSeq(
+                        start_pos=24, end_pos=28,
+                        children=[
+                            Text(
+                                start_pos=24, end_pos=28,
+                                inner="John",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
                     ),
-                    Text(
-                        start_pos=61, end_pos=62,
-                        inner="!",
-                        enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Text(
+                    start_pos=29, end_pos=33,
+                    inner=" at ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=34, end_pos=61,
+                    phrase="email",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=Text(
+                        start_pos=42, end_pos=58,
+                        inner="john@example.com",
+                        enclosing=EnclosingPattern(left='##"', right='"##'),
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                ),
+                Text(
+                    start_pos=61, end_pos=62,
+                    inner="!",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@###|state|###[x=1] @state[x=2]',
-            FragmentSeq(
-                start_pos=0, end_pos=31,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=19,
-                        phrase="state",
-                        phrase_enclosing=EnclosingPattern(left="###|", right="|###"),
-                        options=TokenSeq(
-                            start_pos=15, end_pos=18,
-                            children=[
-                                Identifier(start_pos=15, end_pos=16, name="x"),
-                                Operator(start_pos=16, end_pos=17, symbols="="),
-                                Number(start_pos=17, end_pos=18, value=1),
-                            ],
-                        ),
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=19, end_pos=20,
-                        inner=" ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=21, end_pos=31,
-                        phrase="state",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=27, end_pos=30,
-                            children=[
-                                Identifier(start_pos=27, end_pos=28, name="x"),
-                                Operator(start_pos=28, end_pos=29, symbols="="),
-                                Number(start_pos=29, end_pos=30, value=2),
-                            ],
-                        ),
-                        main_arg=None,
+    ),
+    pytest.param(
+        '@###|state|###[x=1] @state[x=2]',
+        FragmentSeq(
+            start_pos=0, end_pos=31,
+            children=[
+                Command(
+                    start_pos=1, end_pos=19,
+                    phrase="state",
+                    phrase_enclosing=EnclosingPattern(left="###|", right="|###"),
+                    options=TokenSeq(
+                        start_pos=15, end_pos=18,
+                        children=[
+                            Identifier(start_pos=15, end_pos=16, name="x"),
+                            Operator(start_pos=16, end_pos=17, symbols="="),
+                            Number(start_pos=17, end_pos=18, value=1),
+                        ],
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
-        ),
-        pytest.param(
-            '@state[x=1,y=2,z=3]#"This symbol " is a quote!"#',
-            FragmentSeq(
-                start_pos=0, end_pos=48,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=48,
-                        phrase="state",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=7, end_pos=18,
-                            children=[
-                                Identifier(start_pos=7, end_pos=8, name="x"),
-                                Operator(start_pos=8, end_pos=9, symbols="="),
-                                Number(start_pos=9, end_pos=10, value=1),
-                                Operator(start_pos=10, end_pos=11, symbols=","),
-                                Identifier(start_pos=11, end_pos=12, name="y"),
-                                Operator(start_pos=12, end_pos=13, symbols="="),
-                                Number(start_pos=13, end_pos=14, value=2),
-                                Operator(start_pos=14, end_pos=15, symbols=","),
-                                Identifier(start_pos=15, end_pos=16, name="z"),
-                                Operator(start_pos=16, end_pos=17, symbols="="),
-                                Number(start_pos=17, end_pos=18, value=3),
-                            ],
-                        ),
-                        main_arg=Text(
-                            start_pos=21, end_pos=46,
-                            inner='This symbol " is a quote!',
-                            enclosing=EnclosingPattern(left='#"', right='"#'),
-                        ),
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=19, end_pos=20,
+                    inner=" ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=21, end_pos=31,
+                    phrase="state",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=27, end_pos=30,
+                        children=[
+                            Identifier(start_pos=27, end_pos=28, name="x"),
+                            Operator(start_pos=28, end_pos=29, symbols="="),
+                            Number(start_pos=29, end_pos=30, value=2),
+                        ],
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@|| @#||# @foo[{@bar}"@baz"##{}###""#]',
-            FragmentSeq(
-                start_pos=0,
-                end_pos=38,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=3,
-                        phrase="",
-                        phrase_enclosing=EnclosingPattern(left="|", right="|"),
-                        options=None,
-                        main_arg=None,
-                    ),
-                    Text(
-                        start_pos=3, end_pos=4,
-                        inner=" ",
-                        enclosing=EnclosingPattern(left="", right=""),
-                    ),
-                    Command(
-                        start_pos=5, end_pos=9,
-                        phrase="",
-                        phrase_enclosing=EnclosingPattern(left="#|", right="|#"),
-                        options=None,
-                        main_arg=None,
+    ),
+    pytest.param(
+        '@state[x=1,y=2,z=3]#"This symbol " is a quote!"#',
+        FragmentSeq(
+            start_pos=0, end_pos=48,
+            children=[
+                Command(
+                    start_pos=1, end_pos=48,
+                    phrase="state",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=7, end_pos=18,
+                        children=[
+                            Identifier(start_pos=7, end_pos=8, name="x"),
+                            Operator(start_pos=8, end_pos=9, symbols="="),
+                            Number(start_pos=9, end_pos=10, value=1),
+                            Operator(start_pos=10, end_pos=11, symbols=","),
+                            Identifier(start_pos=11, end_pos=12, name="y"),
+                            Operator(start_pos=12, end_pos=13, symbols="="),
+                            Number(start_pos=13, end_pos=14, value=2),
+                            Operator(start_pos=14, end_pos=15, symbols=","),
+                            Identifier(start_pos=15, end_pos=16, name="z"),
+                            Operator(start_pos=16, end_pos=17, symbols="="),
+                            Number(start_pos=17, end_pos=18, value=3),
+                        ],
                     ),
-                    Text(
-                        start_pos=9, end_pos=10,
-                        inner=" ",
-                        enclosing=EnclosingPattern(left="", right=""),
+                    main_arg=Text(
+                        start_pos=21, end_pos=46,
+                        inner='This symbol " is a quote!',
+                        enclosing=EnclosingPattern(left='#"', right='"#'),
                     ),
-                    Command(
-                        start_pos=11, end_pos=38,
-                        phrase="foo",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=15, end_pos=37,
-                            children=[
-                                FragmentSeq(
-                                    start_pos=16, end_pos=20,
-                                    children=[
-                                        Command(
-                                            start_pos=17, end_pos=20,
-                                            phrase="bar",
-                                            phrase_enclosing=EnclosingPattern(
-                                                left="", right="",
-                                            ),
-                                            options=None,
-                                            main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
+        ),
+    ),
+    pytest.param(
+        '@|| @#||# @foo[{@bar}"@baz"##{}###""#]',
+        FragmentSeq(
+            start_pos=0,
+            end_pos=38,
+            children=[
+                Command(
+                    start_pos=1, end_pos=3,
+                    phrase="",
+                    phrase_enclosing=EnclosingPattern(left="|", right="|"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=3, end_pos=4,
+                    inner=" ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=5, end_pos=9,
+                    phrase="",
+                    phrase_enclosing=EnclosingPattern(left="#|", right="|#"),
+                    options=None,
+                    main_arg=None,
+                ),
+                Text(
+                    start_pos=9, end_pos=10,
+                    inner=" ",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+                Command(
+                    start_pos=11, end_pos=38,
+                    phrase="foo",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=15, end_pos=37,
+                        children=[
+                            FragmentSeq(
+                                start_pos=16, end_pos=20,
+                                children=[
+                                    Command(
+                                        start_pos=17, end_pos=20,
+                                        phrase="bar",
+                                        phrase_enclosing=EnclosingPattern(
+                                            left="", right="",
                                         ),
-                                    ],
-                                    enclosing=EnclosingPattern(left="{", right="}"),
-                                ),
-                                Text(
-                                    start_pos=22, end_pos=26,
-                                    inner="@baz",
-                                    enclosing=EnclosingPattern(left='"', right='"'),
-                                ),
-                                FragmentSeq(
-                                    start_pos=30, end_pos=30,
-                                    children=[],
-                                    enclosing=EnclosingPattern(left="##{", right="}##"),
-                                ),
-                                Text(
-                                    start_pos=35, end_pos=35,
-                                    inner="",
-                                    enclosing=EnclosingPattern(left='#"', right='"#'),
-                                ),
-                            ],
-                        ),
-                        main_arg=None,
+                                        options=None,
+                                        main_arg=None,
+                                    ),
+                                ],
+                                enclosing=EnclosingPattern(left="{", right="}"),
+                            ),
+                            Text(
+                                start_pos=22, end_pos=26,
+                                inner="@baz",
+                                enclosing=EnclosingPattern(left='"', right='"'),
+                            ),
+                            FragmentSeq(
+                                start_pos=30, end_pos=30,
+                                children=[],
+                                enclosing=EnclosingPattern(left="##{", right="}##"),
+                            ),
+                            Text(
+                                start_pos=35, end_pos=35,
+                                inner="",
+                                enclosing=EnclosingPattern(left='#"', right='"#'),
+                            ),
+                        ],
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@foo[bar = "x" + @|foo|[bar={x@x}|>3]]',
-            FragmentSeq(
-                start_pos=0, end_pos=38,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=38,
-                        phrase="foo",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=5, end_pos=37,
-                            children=[
-                                Identifier(start_pos=5, end_pos=8, name="bar"),
-                                Operator(start_pos=9, end_pos=10, symbols="="),
-                                Text(
-                                    start_pos=12, end_pos=13,
-                                    inner="x",
-                                    enclosing=EnclosingPattern(left='"', right='"'),
+    ),
+    pytest.param(
+        '@foo[bar = "x" + @|foo|[bar={x@x}|>3]]',
+        FragmentSeq(
+            start_pos=0, end_pos=38,
+            children=[
+                Command(
+                    start_pos=1, end_pos=38,
+                    phrase="foo",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=5, end_pos=37,
+                        children=[
+                            Identifier(start_pos=5, end_pos=8, name="bar"),
+                            Operator(start_pos=9, end_pos=10, symbols="="),
+                            Text(
+                                start_pos=12, end_pos=13,
+                                inner="x",
+                                enclosing=EnclosingPattern(left='"', right='"'),
+                            ),
+                            Operator(start_pos=15, end_pos=16, symbols="+"),
+                            Command(
+                                start_pos=18, end_pos=37,
+                                phrase="foo",
+                                phrase_enclosing=EnclosingPattern(
+                                    left="|", right="|",
                                 ),
-                                Operator(start_pos=15, end_pos=16, symbols="+"),
-                                Command(
-                                    start_pos=18, end_pos=37,
-                                    phrase="foo",
-                                    phrase_enclosing=EnclosingPattern(
-                                        left="|", right="|",
-                                    ),
-                                    options=TokenSeq(
-                                        start_pos=24, end_pos=36,
-                                        children=[
-                                            Identifier(
-                                                start_pos=24, end_pos=27,
-                                                name="bar",
-                                            ),
-                                            Operator(
-                                                start_pos=27, end_pos=28,
-                                                symbols="=",
-                                            ),
-                                            FragmentSeq(
-                                                start_pos=29,
-                                                end_pos=32,
-                                                children=[
-                                                    Text(
-                                                        start_pos=29, end_pos=30,
-                                                        inner="x",
-                                                        enclosing=EnclosingPattern(
-                                                            left="", right="",
-                                                        ),
-                                                    ),
-                                                    Command(
-                                                        start_pos=31, end_pos=32,
-                                                        phrase="x",
-                                                        phrase_enclosing=(
-                                                                EnclosingPattern(
-                                                                    left="", right="",
-                                                                )
-                                                        ),
-                                                        options=None,
-                                                        main_arg=None,
+                                options=TokenSeq(
+                                    start_pos=24, end_pos=36,
+                                    children=[
+                                        Identifier(
+                                            start_pos=24, end_pos=27,
+                                            name="bar",
+                                        ),
+                                        Operator(
+                                            start_pos=27, end_pos=28,
+                                            symbols="=",
+                                        ),
+                                        FragmentSeq(
+                                            start_pos=29,
+                                            end_pos=32,
+                                            children=[
+                                                Text(
+                                                    start_pos=29, end_pos=30,
+                                                    inner="x",
+                                                    enclosing=EnclosingPattern(
+                                                        left="", right="",
                                                     ),
-                                                ],
-                                                enclosing=EnclosingPattern(
-                                                    left="{", right="}",
                                                 ),
-                                            ),
-                                            Operator(
-                                                start_pos=33, end_pos=35,
-                                                symbols="|>",
-                                            ),
-                                            Number(start_pos=35, end_pos=36, value=3),
-                                        ],
-                                    ),
-                                    main_arg=None,
-                                ),
-                            ],
-                        ),
-                        main_arg=None,
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
-        ),
-        pytest.param(
-            '@x{@expand[1->2,<-3,stop,"foo",{bar},,@|cool.fm|]{@|4+4|}}',
-            FragmentSeq(
-                start_pos=0, end_pos=58,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=58,
-                        phrase="x",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=None,
-                        main_arg=FragmentSeq(
-                            start_pos=3, end_pos=57,
-                            children=[
-                                Command(
-                                    start_pos=4, end_pos=57,
-                                    phrase="expand",
-                                    phrase_enclosing=EnclosingPattern(
-                                        left="", right="",
-                                    ),
-                                    options=TokenSeq(
-                                        start_pos=11, end_pos=48,
-                                        children=[
-                                            Number(start_pos=11, end_pos=12, value=1),
-                                            Operator(
-                                                start_pos=12, end_pos=14,
-                                                symbols="->",
-                                            ),
-                                            Number(start_pos=14, end_pos=15, value=2),
-                                            Operator(
-                                                start_pos=15, end_pos=16,
-                                                symbols=",",
-                                            ),
-                                            Operator(
-                                                start_pos=16, end_pos=18,
-                                                symbols="<-",
-                                            ),
-                                            Number(start_pos=18, end_pos=19, value=3),
-                                            Operator(
-                                                start_pos=19, end_pos=20,
-                                                symbols=",",
-                                            ),
-                                            Identifier(
-                                                start_pos=20, end_pos=24,
-                                                name="stop",
-                                            ),
-                                            Operator(
-                                                start_pos=24, end_pos=25,
-                                                symbols=",",
-                                            ),
-                                            Text(
-                                                start_pos=26,
-                                                end_pos=29,
-                                                inner="foo",
-                                                enclosing=EnclosingPattern(
-                                                    left='"', right='"',
-                                                ),
-                                            ),
-                                            Operator(
-                                                start_pos=30, end_pos=31,
-                                                symbols=",",
-                                            ),
-                                            FragmentSeq(
-                                                start_pos=32, end_pos=35,
-                                                children=[
-                                                    Text(
-                                                        start_pos=32, end_pos=35,
-                                                        inner="bar",
-                                                        enclosing=EnclosingPattern(
-                                                            left="", right="",
-                                                        ),
+                                                Command(
+                                                    start_pos=31, end_pos=32,
+                                                    phrase="x",
+                                                    phrase_enclosing=(
+                                                            EnclosingPattern(
+                                                                left="", right="",
+                                                            )
                                                     ),
-                                                ],
-                                                enclosing=EnclosingPattern(
-                                                    left="{", right="}",
+                                                    options=None,
+                                                    main_arg=None,
                                                 ),
+                                            ],
+                                            enclosing=EnclosingPattern(
+                                                left="{", right="}",
                                             ),
-                                            Operator(
-                                                start_pos=36, end_pos=37,
-                                                symbols=",",
-                                            ),
-                                            Operator(
-                                                start_pos=37, end_pos=38,
-                                                symbols=",",
-                                            ),
-                                            Command(
-                                                start_pos=39, end_pos=48,
-                                                phrase="cool.fm",
-                                                phrase_enclosing=EnclosingPattern(
-                                                    left="|", right="|",
-                                                ),
-                                                options=None,
-                                                main_arg=None,
-                                            ),
-                                        ],
-                                    ),
-                                    main_arg=FragmentSeq(
-                                        start_pos=50, end_pos=56,
-                                        children=[
-                                            Command(
-                                                start_pos=51, end_pos=56,
-                                                phrase="4+4",
-                                                phrase_enclosing=EnclosingPattern(
-                                                    left="|", right="|",
-                                                ),
-                                                options=None,
-                                                main_arg=None,
-                                            ),
-                                        ],
-                                        enclosing=EnclosingPattern(left="{", right="}"),
-                                    ),
+                                        ),
+                                        Operator(
+                                            start_pos=33, end_pos=35,
+                                            symbols="|>",
+                                        ),
+                                        Number(start_pos=35, end_pos=36, value=3),
+                                    ],
                                 ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
+                                main_arg=None,
+                            ),
+                        ],
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-        pytest.param(
-            '@foo[[]->[],{}->[],@||]',
-            FragmentSeq(
-                start_pos=0, end_pos=23,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=23,
-                        phrase="foo",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=5, end_pos=22,
-                            children=[
-                                TokenSeq(start_pos=6, end_pos=6, children=[]),
-                                Operator(start_pos=7, end_pos=9, symbols="->"),
-                                TokenSeq(start_pos=10, end_pos=10, children=[]),
-                                Operator(start_pos=11, end_pos=12, symbols=","),
-                                FragmentSeq(
-                                    start_pos=13, end_pos=13,
-                                    children=[],
-                                    enclosing=EnclosingPattern(left="{", right="}"),
+    ),
+    pytest.param(
+        '@x{@expand[1->2,<-3,stop,"foo",{bar},,@|cool.fm|]{@|4+4|}}',
+        FragmentSeq(
+            start_pos=0, end_pos=58,
+            children=[
+                Command(
+                    start_pos=1, end_pos=58,
+                    phrase="x",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=None,
+                    main_arg=FragmentSeq(
+                        start_pos=3, end_pos=57,
+                        children=[
+                            Command(
+                                start_pos=4, end_pos=57,
+                                phrase="expand",
+                                phrase_enclosing=EnclosingPattern(
+                                    left="", right="",
                                 ),
-                                Operator(start_pos=14, end_pos=16, symbols="->"),
-                                TokenSeq(start_pos=17, end_pos=17, children=[]),
-                                Operator(start_pos=18, end_pos=19, symbols=","),
-                                Command(
-                                    start_pos=20, end_pos=22,
-                                    phrase="",
-                                    phrase_enclosing=EnclosingPattern(
-                                        left="|", right="|",
-                                    ),
-                                    options=None,
-                                    main_arg=None,
-                                ),
-                            ],
-                        ),
-                        main_arg=None,
-                    ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
-        ),
-        pytest.param(
-            '@foo[\n  a = {1 -> 2},\n  b = {My name is @name},\n]{bar}\n',
-            FragmentSeq(
-                start_pos=0, end_pos=55,
-                children=[
-                    Command(
-                        start_pos=1, end_pos=54,
-                        phrase="foo",
-                        phrase_enclosing=EnclosingPattern(left="", right=""),
-                        options=TokenSeq(
-                            start_pos=5, end_pos=48,
-                            children=[
-                                Identifier(start_pos=8, end_pos=9, name="a"),
-                                Operator(start_pos=10, end_pos=11, symbols="="),
-                                FragmentSeq(
-                                    start_pos=13, end_pos=19,
+                                options=TokenSeq(
+                                    start_pos=11, end_pos=48,
                                     children=[
+                                        Number(start_pos=11, end_pos=12, value=1),
+                                        Operator(
+                                            start_pos=12, end_pos=14,
+                                            symbols="->",
+                                        ),
+                                        Number(start_pos=14, end_pos=15, value=2),
+                                        Operator(
+                                            start_pos=15, end_pos=16,
+                                            symbols=",",
+                                        ),
+                                        Operator(
+                                            start_pos=16, end_pos=18,
+                                            symbols="<-",
+                                        ),
+                                        Number(start_pos=18, end_pos=19, value=3),
+                                        Operator(
+                                            start_pos=19, end_pos=20,
+                                            symbols=",",
+                                        ),
+                                        Identifier(
+                                            start_pos=20, end_pos=24,
+                                            name="stop",
+                                        ),
+                                        Operator(
+                                            start_pos=24, end_pos=25,
+                                            symbols=",",
+                                        ),
                                         Text(
-                                            start_pos=13, end_pos=19,
-                                            inner="1 -> 2",
+                                            start_pos=26,
+                                            end_pos=29,
+                                            inner="foo",
                                             enclosing=EnclosingPattern(
-                                                left="", right="",
+                                                left='"', right='"',
                                             ),
                                         ),
-                                    ],
-                                    enclosing=EnclosingPattern(left="{", right="}"),
-                                ),
-                                Operator(start_pos=20, end_pos=21, symbols=","),
-                                Identifier(start_pos=24, end_pos=25, name="b"),
-                                Operator(start_pos=26, end_pos=27, symbols="="),
-                                FragmentSeq(
-                                    start_pos=29, end_pos=45,
-                                    children=[
-                                        Text(
-                                            start_pos=29, end_pos=40,
-                                            inner="My name is ",
+                                        Operator(
+                                            start_pos=30, end_pos=31,
+                                            symbols=",",
+                                        ),
+                                        FragmentSeq(
+                                            start_pos=32, end_pos=35,
+                                            children=[
+                                                Text(
+                                                    start_pos=32, end_pos=35,
+                                                    inner="bar",
+                                                    enclosing=EnclosingPattern(
+                                                        left="", right="",
+                                                    ),
+                                                ),
+                                            ],
                                             enclosing=EnclosingPattern(
-                                                left="", right="",
+                                                left="{", right="}",
                                             ),
                                         ),
+                                        Operator(
+                                            start_pos=36, end_pos=37,
+                                            symbols=",",
+                                        ),
+                                        Operator(
+                                            start_pos=37, end_pos=38,
+                                            symbols=",",
+                                        ),
                                         Command(
-                                            start_pos=41, end_pos=45,
-                                            phrase="name",
+                                            start_pos=39, end_pos=48,
+                                            phrase="cool.fm",
                                             phrase_enclosing=EnclosingPattern(
-                                                left="", right="",
+                                                left="|", right="|",
+                                            ),
+                                            options=None,
+                                            main_arg=None,
+                                        ),
+                                    ],
+                                ),
+                                main_arg=FragmentSeq(
+                                    start_pos=50, end_pos=56,
+                                    children=[
+                                        Command(
+                                            start_pos=51, end_pos=56,
+                                            phrase="4+4",
+                                            phrase_enclosing=EnclosingPattern(
+                                                left="|", right="|",
                                             ),
                                             options=None,
                                             main_arg=None,
@@ -976,34 +883,818 @@ from paxter.syntax import (
                                     ],
                                     enclosing=EnclosingPattern(left="{", right="}"),
                                 ),
-                                Operator(start_pos=46, end_pos=47, symbols=","),
-                            ],
-                        ),
-                        main_arg=FragmentSeq(
-                            start_pos=50, end_pos=53,
-                            children=[
-                                Text(
-                                    start_pos=50, end_pos=53,
-                                    inner="bar",
-                                    enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
+                    ),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
+        ),
+    ),
+    pytest.param(
+        '@foo[[]->[],{}->[],@||]',
+        FragmentSeq(
+            start_pos=0, end_pos=23,
+            children=[
+                Command(
+                    start_pos=1, end_pos=23,
+                    phrase="foo",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=5, end_pos=22,
+                        children=[
+                            TokenSeq(start_pos=6, end_pos=6, children=[]),
+                            Operator(start_pos=7, end_pos=9, symbols="->"),
+                            TokenSeq(start_pos=10, end_pos=10, children=[]),
+                            Operator(start_pos=11, end_pos=12, symbols=","),
+                            FragmentSeq(
+                                start_pos=13, end_pos=13,
+                                children=[],
+                                enclosing=EnclosingPattern(left="{", right="}"),
+                            ),
+                            Operator(start_pos=14, end_pos=16, symbols="->"),
+                            TokenSeq(start_pos=17, end_pos=17, children=[]),
+                            Operator(start_pos=18, end_pos=19, symbols=","),
+                            Command(
+                                start_pos=20, end_pos=22,
+                                phrase="",
+                                phrase_enclosing=EnclosingPattern(
+                                    left="|", right="|",
                                 ),
-                            ],
-                            enclosing=EnclosingPattern(left="{", right="}"),
-                        ),
+                                options=None,
+                                main_arg=None,
+                            ),
+                        ],
+                    ),
+                    main_arg=None,
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
+        ),
+    ),
+    pytest.param(
+        '@foo[\n  a = {1 -> 2},\n  b = {My name is @name},\n]{bar}\n',
+        FragmentSeq(
+            start_pos=0, end_pos=55,
+            children=[
+                Command(
+                    start_pos=1, end_pos=54,
+                    phrase="foo",
+                    phrase_enclosing=EnclosingPattern(left="", right=""),
+                    options=TokenSeq(
+                        start_pos=5, end_pos=48,
+                        children=[
+                            Identifier(start_pos=8, end_pos=9, name="a"),
+                            Operator(start_pos=10, end_pos=11, symbols="="),
+                            FragmentSeq(
+                                start_pos=13, end_pos=19,
+                                children=[
+                                    Text(
+                                        start_pos=13, end_pos=19,
+                                        inner="1 -> 2",
+                                        enclosing=EnclosingPattern(
+                                            left="", right="",
+                                        ),
+                                    ),
+                                ],
+                                enclosing=EnclosingPattern(left="{", right="}"),
+                            ),
+                            Operator(start_pos=20, end_pos=21, symbols=","),
+                            Identifier(start_pos=24, end_pos=25, name="b"),
+                            Operator(start_pos=26, end_pos=27, symbols="="),
+                            FragmentSeq(
+                                start_pos=29, end_pos=45,
+                                children=[
+                                    Text(
+                                        start_pos=29, end_pos=40,
+                                        inner="My name is ",
+                                        enclosing=EnclosingPattern(
+                                            left="", right="",
+                                        ),
+                                    ),
+                                    Command(
+                                        start_pos=41, end_pos=45,
+                                        phrase="name",
+                                        phrase_enclosing=EnclosingPattern(
+                                            left="", right="",
+                                        ),
+                                        options=None,
+                                        main_arg=None,
+                                    ),
+                                ],
+                                enclosing=EnclosingPattern(left="{", right="}"),
+                            ),
+                            Operator(start_pos=46, end_pos=47, symbols=","),
+                        ],
                     ),
-                    Text(
-                        start_pos=54, end_pos=55,
-                        inner="\n",
-                        enclosing=EnclosingPattern(left="", right=""),
+                    main_arg=FragmentSeq(
+                        start_pos=50, end_pos=53,
+                        children=[
+                            Text(
+                                start_pos=50, end_pos=53,
+                                inner="bar",
+                                enclosing=EnclosingPattern(left="", right=""),
+                            ),
+                        ],
+                        enclosing=EnclosingPattern(left="{", right="}"),
                     ),
-                ],
-                enclosing=GlobalEnclosingPattern(),
-            ),
+                ),
+                Text(
+                    start_pos=54, end_pos=55,
+                    inner="\n",
+                    enclosing=EnclosingPattern(left="", right=""),
+                ),
+            ],
+            enclosing=GlobalEnclosingPattern(),
         ),
-    ],
-)
+    ),
+]
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
 def test_parser(src_text: str, expected: Token):
     parsed_tree = ParsingTask(src_text).parse()
     assert parsed_tree == expected
     assert parsed_tree.start_pos == expected.start_pos
     assert parsed_tree.end_pos == expected.end_pos
+
+
+@pytest.mark.parametrize("src_text", ['', 'abc', '\n', 'a\nbc\n\nd', '\n\nx\n'])
+def test_line_index(src_text: str):
+    line_index = LineIndex(src_text)
+    for pos in range(len(src_text) + 1):
+        assert CharLoc(src_text, pos, line_index) == CharLoc(src_text, pos)
+    task = ParsingTask(src_text)
+    assert task.line_index is task.line_index
+    assert task._charloc(len(src_text)) == CharLoc(src_text, len(src_text))
+
+
+def test_syntax_error_position():
+    src_text = 'a\nb @c{d\n @e[f]{g}'
+    with pytest.raises(PaxterSyntaxError, match="line 2 col 5"):
+        ParsingTask(src_text).parse()
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_recovering_parser(src_text: str, expected: Token):
+    task = RecoveringParsingTask(src_text)
+    parsed_tree = task.parse()
+    assert task.diagnostics == []
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+
+
+@pytest.mark.parametrize(
+    ("src_text", "messages"),
+    [
+        pytest.param('@a{b', ["right pattern '}' to the left pattern '{' at line 1 col 3"], id="brace"),
+        pytest.param('@', ["invalid expression after @-command at line 1 col 2"], id="switch"),
+        pytest.param(
+            '@a"oops\n@ @|b\n@c[1,} @d{e',
+            [
+                "right pattern '\"' to the left pattern '\"' at line 1 col 3",
+                "invalid expression after @-command at line 2 col 2",
+                "right pattern '|' to the left pattern '|' at line 2 col 4",
+                "right character ']' to the left character '[' at line 3 col 3",
+                "right pattern '}' to the left pattern '{' at line 3 col 10",
+            ],
+            id="many",
+        ),
+        pytest.param(
+            '@a[x @b[y}',
+            [
+                "right character ']' to the left character '[' at line 1 col 3",
+                "right character ']' to the left character '[' at line 1 col 8",
+            ],
+            id="nested-options",
+        ),
+        pytest.param(
+            '@a{@b{@c{',
+            [
+                "right pattern '}' to the left pattern '{' at line 1 col 3",
+                "right pattern '}' to the left pattern '{' at line 1 col 6",
+                "right pattern '}' to the left pattern '{' at line 1 col 9",
+            ],
+            id="nested-fragment-seqs",
+        ),
+        pytest.param(
+            '@f[a @',
+            [
+                "right character ']' to the left character '[' at line 1 col 3",
+                "invalid expression after @-command at line 1 col 7",
+            ],
+            id="switch-in-options",
+        ),
+    ],
+)
+def test_recovering_parser_errors(src_text: str, messages: list[str]):
+    with pytest.raises(PaxterSyntaxError) as first_error:
+        ParsingTask(src_text).parse()
+    task = RecoveringParsingTask(src_text)
+    parsed_tree = task.parse()
+    assert len(task.diagnostics) == len(messages)
+    for error, message in zip(task.diagnostics, messages):
+        assert error.message.endswith(message)
+    assert first_error.value.message in [error.message for error in task.diagnostics]
+    assert parsed_tree.end_pos == len(src_text)
+
+
+def test_recovering_parser_error_nodes():
+    parsed_tree = RecoveringParsingTask('@a"b @ c').parse()
+    assert parsed_tree == FragmentSeq.without_pos(
+        [
+            Command.without_pos('a', EnclosingPattern(left=''), None, ErrorFragment(2, 3, '"')),
+            Text.without_pos('b ', EnclosingPattern(left='')),
+            ErrorFragment.without_pos('@'),
+            Text.without_pos(' c', EnclosingPattern(left='')),
+        ],
+        GlobalEnclosingPattern(),
+    )
+
+
+@dataclass
+class RecoveringIterativeParsingTask(RecoveringParsingTask, IterativeParsingTask):
+    pass
+
+
+@dataclass
+class RecoveringEventParsingTask(RecoveringParsingTask, EventParsingTask):
+    pass
+
+
+@pytest.mark.parametrize(
+    "src_text",
+    ['@a{b', '@', '@a"oops\n@ @|b\n@c[1,} @d{e', '@a[x @b[y}', '@a"b @ c', '@a[@b"c]{@|d'],
+)
+def test_recovering_parser_variants(tmp_path, src_text: str):
+    task = RecoveringParsingTask(src_text)
+    expected = task.parse()
+    messages = [error.message for error in task.diagnostics]
+
+    iterative_task = RecoveringIterativeParsingTask(src_text)
+    assert repr(iterative_task.parse()) == repr(expected)
+    assert [error.message for error in iterative_task.diagnostics] == messages
+
+    event_task = RecoveringEventParsingTask(src_text)
+    assert repr(build_tree_from_events(event_task.iter_events())) == repr(expected)
+    assert [error.message for error in event_task.diagnostics] == messages
+
+    assert repr(FlatTree.from_tree(expected).to_tree()) == repr(expected)
+    path = tmp_path / 'tree.pxtree'
+    with open(path, 'wb') as fobj:
+        binary.dump(expected, fobj)
+    with MappedTree.open(path) as mapped_tree:
+        assert repr(mapped_tree.root) == repr(expected)
+
+
+def test_cli_check():
+    from click.testing import CliRunner
+
+    from paxter.__main__ import program
+
+    runner = CliRunner()
+    result = runner.invoke(program, ['check'], input='@a{b @c[')
+    assert result.exit_code == 1
+    assert result.output.splitlines() == [
+        "cannot match enclosing right pattern '}' to the left pattern '{' at line 1 col 3",
+        "cannot match enclosing right character ']' to the left character '[' at line 1 col 8",
+    ]
+    result = runner.invoke(program, ['check'], input='@a{b}')
+    assert (result.exit_code, result.output) == (0, '')
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_iterative_parser(src_text: str, expected: Token):
+    parsed_tree = IterativeParsingTask(src_text).parse()
+    assert parsed_tree == expected
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+
+
+@pytest.mark.parametrize(
+    ("prefix", "suffix"),
+    [
+        pytest.param('@a{', '}', id="main-arg"),
+        pytest.param('@a[', ']', id="options"),
+        pytest.param('@a[b, {', '}]', id="options-fragment-seq"),
+    ],
+)
+def test_iterative_parser_deep_nesting(prefix: str, suffix: str):
+    depth = 20000
+    src_text = prefix * depth + 'x' + suffix * depth
+    with pytest.raises(RecursionError):
+        ParsingTask(src_text).parse()
+
+    node = IterativeParsingTask(src_text).parse()
+    for _ in range(depth):
+        (node,) = node.children
+        node = node.main_arg or node.options
+        if isinstance(node, TokenSeq) and len(node.children) > 1:
+            node = node.children[-1]
+    assert node.end_pos - node.start_pos == 1
+
+
+@pytest.mark.parametrize("task_cls", [ParsingTask, IterativeParsingTask])
+@pytest.mark.parametrize(
+    ("src_text", "edit"),
+    [
+        pytest.param('Hello @name. Bye @name!', TextEdit(1, 4, 'i'), id="text-before"),
+        pytest.param('Hello @name. Bye @name!', TextEdit(9, 0, 'ick'), id="inside-command"),
+        pytest.param('a @b{c @d e} f @g h', TextEdit(7, 0, '@x{y}'), id="nested-insert"),
+        pytest.param('@foo## bar @baz', TextEdit(6, 0, '{x}##'), id="extends-command"),
+        pytest.param('@foo bar @baz', TextEdit(4, 0, '[1]'), id="adds-options"),
+        pytest.param('@a{b} c @d{e} f', TextEdit(0, 15, ''), id="delete-all"),
+        pytest.param('@a{b} c @d{e} f', TextEdit(15, 0, ' @g'), id="append"),
+        pytest.param('@a{b @c{d @e f} g} h', TextEdit(10, 1, 'xy'), id="deeply-nested"),
+        pytest.param('@a{b @c{d @e f} g} h', TextEdit(9, 0, '}'), id="nested-closes-early"),
+        pytest.param('@a{b @c#{d}# e} f', TextEdit(10, 0, '#'), id="nested-hashes"),
+        pytest.param('@a[x, {b @c d}, 1]{e} f', TextEdit(9, 2, '@g{h}'), id="options-nested"),
+        pytest.param('@a{b @c{d} e}', TextEdit(10, 0, '{x}'), id="nested-extends-command"),
+    ],
+)
+def test_reparse(task_cls, src_text: str, edit: TextEdit):
+    prev_tree = ParsingTask(src_text).parse()
+    prev_repr = repr(prev_tree)
+    new_src_text = edit.apply(src_text)
+    reparsed_tree = task_cls(new_src_text).reparse(prev_tree, edit)
+    assert repr(reparsed_tree) == repr(ParsingTask(new_src_text).parse())
+    assert repr(prev_tree) == prev_repr
+
+
+def test_reparse_reuses_nested_nodes():
+    src_text = '@a{b @c{d} e @f{g}} h @i{j}'
+    edit = TextEdit(16, 1, 'xyz')
+    prev_tree = ParsingTask(src_text).parse()
+    new_src_text = edit.apply(src_text)
+    reparsed_tree = ParsingTask(new_src_text).reparse(prev_tree, edit)
+    assert repr(reparsed_tree) == repr(ParsingTask(new_src_text).parse())
+    prev_inner = prev_tree.children[0].main_arg.children
+    inner = reparsed_tree.children[0].main_arg.children
+    assert all(node is prev_node for node, prev_node in zip(inner[:3], prev_inner))
+    assert reparsed_tree.children[-1] is not prev_tree.children[-1]
+    assert prev_tree.children[-1].start_pos == 23
+
+
+def test_reparse_shifts_lazily():
+    src_text = 'a @y @b{c @d[x, {e}]{f}} g'
+    prev_tree = tree = ParsingTask(src_text).parse()
+    for edit in [TextEdit(0, 0, 'xy'), TextEdit(1, 0, 'z'), TextEdit(0, 3, '')]:
+        src_text = edit.apply(src_text)
+        tree = ParsingTask(src_text).reparse(tree, edit)
+
+    # Shifts of successive edits are combined upon first access and cancel out
+    # so that descendants of the previous tree are shared again
+    prev_inner = prev_tree.children[3].main_arg.children
+    inner = tree.children[3].main_arg.children
+    assert inner[0] is prev_inner[0]
+    assert inner[1].options is prev_inner[1].options
+
+    expected = ParsingTask(src_text).parse()
+    assert tree == expected and expected == tree
+    assert repr(tree) == repr(expected)
+    assert pickle.loads(pickle.dumps(tree)) == expected
+
+
+@pytest.mark.parametrize("task_cls", [ParsingTask, IterativeParsingTask])
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_lazy_texts(task_cls, src_text: str, expected: Token):
+    parsed_tree = task_cls(src_text, lazy_texts=True).parse()
+    assert parsed_tree == expected
+    assert expected == parsed_tree
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+    assert pickle.loads(pickle.dumps(parsed_tree)) == expected
+    assert FlatTree.from_tree(parsed_tree) == ParsingTask(src_text).parse_flat()
+
+
+def test_lazy_text_nodes():
+    src_text = 'Hello @b{world} @c"!"'
+    parsed_tree = ParsingTask(src_text, lazy_texts=True).parse()
+    text_node = parsed_tree.children[0]
+    assert isinstance(text_node, LazyText) and isinstance(text_node, Text)
+    assert text_node.src_text is src_text
+    assert text_node.inner == 'Hello '
+    assert parsed_tree.children[3].main_arg.inner == '!'
+    assert text_node != Text.without_pos('Hello', EnclosingPattern(left=''))
+    with pytest.raises(AttributeError):
+        text_node.inner = 'Bye '
+
+
+def test_reparse_lazy_texts():
+    src_text = 'a @b{c} d @e{f} g'
+    edit = TextEdit(0, 1, 'xyz')
+    prev_tree = ParsingTask(src_text, lazy_texts=True).parse()
+    new_src_text = edit.apply(src_text)
+    reparsed_tree = ParsingTask(new_src_text, lazy_texts=True).reparse(prev_tree, edit)
+    assert repr(reparsed_tree) == repr(ParsingTask(new_src_text).parse())
+    assert reparsed_tree.children[-1].src_text is new_src_text
+
+
+def test_reparse_lazy_texts_single_source():
+    src_text = 'a @b{c @d[x, {e}]{f}} g @h"i" j'
+    tree = ParsingTask(src_text, lazy_texts=True).parse()
+    for edit in [TextEdit(0, 0, 'xy'), TextEdit(29, 1, 'kl'), TextEdit(33, 0, 'm'), TextEdit(11, 0, 'z')]:
+        src_text = edit.apply(src_text)
+        tree = ParsingTask(src_text, lazy_texts=True).reparse(tree, edit)
+    assert repr(tree) == repr(ParsingTask(src_text).parse())
+
+    src_texts = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, LazyText):
+            src_texts.add(id(node.src_text))
+        elif isinstance(node, (FragmentSeq, TokenSeq)):
+            stack.extend(node.children)
+        elif isinstance(node, Command):
+            stack.extend(child for child in (node.options, node.main_arg) if child is not None)
+    assert src_texts == {id(src_text)}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_streaming_parser(chunk_size: int, src_text: str, expected: Token):
+    parsed_tree = StreamingParsingTask(io.StringIO(src_text), chunk_size).parse()
+    assert parsed_tree == expected
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+@pytest.mark.parametrize(
+    "src_text",
+    [
+        pytest.param('line one\nline @two{\n@three{four', id="unclosed"),
+        pytest.param('@a{b}\n@c{d}\n  @e[f, @g]{h}\n@', id="invalid-command"),
+        pytest.param('a\nb\n@x[ y', id="unclosed-options"),
+    ],
+)
+def test_streaming_parser_error(chunk_size: int, src_text: str):
+    with pytest.raises(PaxterSyntaxError) as expected:
+        ParsingTask(src_text).parse()
+    with pytest.raises(PaxterSyntaxError) as actual:
+        StreamingParsingTask(io.StringIO(src_text), chunk_size).parse()
+    assert actual.value.message == expected.value.message
+
+
+def build_tree_from_events(event_iter) -> FragmentSeq:
+    """
+    Reconstructs the parsed tree from the stream of parsing events.
+    """
+    start_events: list[Event] = []
+    children_stack: list[list[Token]] = [[]]
+    for event in event_iter:
+        if event.end_pos is None:
+            start_events.append(event)
+            children_stack.append([])
+            continue
+        if event.kind == events.TEXT:
+            node = Text(event.start_pos, event.end_pos, event.value, event.enclosing)
+        elif event.kind == events.IDENTIFIER:
+            node = Identifier(event.start_pos, event.end_pos, event.value)
+        elif event.kind == events.OPERATOR:
+            node = Operator(event.start_pos, event.end_pos, event.value)
+        elif event.kind == events.NUMBER:
+            node = Number(event.start_pos, event.end_pos, event.value)
+        elif event.kind == events.ERROR:
+            node = ErrorFragment(event.start_pos, event.end_pos, event.value)
+        else:
+            start_event = start_events.pop()
+            children = children_stack.pop()
+            if event.kind == events.END_FRAGMENT_SEQ:
+                node = FragmentSeq(event.start_pos, event.end_pos, children, event.enclosing)
+            elif event.kind == events.END_OPTIONS:
+                node = TokenSeq(event.start_pos, event.end_pos, children)
+            else:
+                assert event.kind == events.END_COMMAND
+                options = children.pop(0) if children and isinstance(children[0], TokenSeq) else None
+                main_arg = children.pop() if children else None
+                assert not children
+                node = Command(
+                    event.start_pos, event.end_pos,
+                    start_event.value, start_event.enclosing, options, main_arg,
+                )
+        children_stack[-1].append(node)
+    (tree,) = children_stack.pop()
+    return tree
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_event_parser(src_text: str, expected: Token):
+    parsed_tree = build_tree_from_events(EventParsingTask(src_text).iter_events())
+    assert parsed_tree == expected
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+
+
+def test_event_parser_dispatch():
+    class LinkCollector:
+        def __init__(self):
+            self.phrases = []
+
+        def start_command(self, event: Event):
+            self.phrases.append(event.value)
+
+    collector = LinkCollector()
+    EventParsingTask('@a[@b]{@|c d|} @e"@f"').dispatch(collector)
+    assert collector.phrases == ['a', 'b', 'c d', 'e']
+
+
+def test_event_parser_creates_no_nodes(monkeypatch):
+    def fail(self, *args, **kwargs):
+        raise AssertionError(f"{type(self).__name__} node created")
+
+    for node_type in [Text, LazyText, Identifier, Operator, Number, ErrorFragment, Command]:
+        monkeypatch.setattr(node_type, '__init__', fail)
+    src_text = '@a[b, +, 1, "c", @d]{e @|f|"g"} @h"i'
+    events = list(RecoveringEventParsingTask(src_text, lazy_texts=True).iter_events())
+    assert {event.kind for event in events if not event.kind.startswith(('start_', 'end_'))} == {
+        'identifier', 'operator', 'number', 'text', 'error',
+    }
+
+
+@pytest.mark.parametrize(
+    "src_text",
+    [
+        pytest.param('line one\nline @two{\n@three{four', id="unclosed"),
+        pytest.param('@a{b}\n@c{d}\n  @e[f, @g]{h}\n@', id="invalid-command"),
+        pytest.param('a\nb\n@x[ y', id="unclosed-options"),
+    ],
+)
+def test_event_parser_error(src_text: str):
+    with pytest.raises(PaxterSyntaxError) as expected:
+        ParsingTask(src_text).parse()
+    with pytest.raises(PaxterSyntaxError) as actual:
+        list(EventParsingTask(src_text).iter_events())
+    assert actual.value.message == expected.value.message
+
+
+def test_compact_nodes():
+    src_text = '@a[b, 1, "c"]{d @|e|##"f"##} @g{h}'
+    parsed_tree = ParsingTask(src_text).parse()
+    first_cmd, _, second_cmd = parsed_tree.children
+    for node in [parsed_tree, first_cmd, first_cmd.options, *first_cmd.options.children]:
+        assert not hasattr(node, '__dict__')
+    assert not hasattr(first_cmd.phrase_enclosing, '__dict__')
+    assert first_cmd.phrase_enclosing is parsed_tree.children[1].enclosing
+    assert first_cmd.main_arg.enclosing is second_cmd.main_arg.enclosing
+    assert pickle.loads(pickle.dumps(parsed_tree)) == parsed_tree
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_flat_tree(src_text: str, expected: Token):
+    flat_tree = ParsingTask(src_text).parse_flat()
+    parsed_tree = flat_tree.to_tree()
+    assert parsed_tree == expected
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+
+
+def test_flat_tree_layout():
+    flat_tree = FlatTree.from_tree(ParsingTask('x @a[b, 1.5]{c} @d"é"').parse())
+    assert list(flat_tree.kinds) == [
+        flat.KIND_FRAGMENT_SEQ,
+        flat.KIND_TEXT, flat.KIND_COMMAND, flat.KIND_TEXT, flat.KIND_COMMAND,
+        flat.KIND_TOKEN_SEQ, flat.KIND_FRAGMENT_SEQ, flat.KIND_TEXT,
+        flat.KIND_IDENTIFIER, flat.KIND_OPERATOR, flat.KIND_NUMBER, flat.KIND_TEXT,
+    ]
+    assert [flat_tree.children(index) for index in range(len(flat_tree))] == [
+        range(1, 5), range(5, 5), range(5, 7), range(7, 7), range(7, 8),
+        range(8, 11), range(11, 12), *[range(12, 12)] * 5,
+    ]
+    assert flat_tree.flags[2] == flat.FLAG_HAS_OPTIONS | flat.FLAG_HAS_MAIN_ARG
+    assert flat_tree.flags[4] == flat.FLAG_HAS_MAIN_ARG
+    assert [flat_tree.string(index) for index in (2, 7, 10, 11)] == ['a', 'é', '1.5', 'c']
+    assert flat_tree.enclosing(0) == GlobalEnclosingPattern()
+    assert flat_tree.enclosing(7) == EnclosingPattern(left='"')
+    assert flat_tree.enclosing(5) is None
+    assert flat_tree.to_tree(6) == FragmentSeq.without_pos(
+        [Text.without_pos('c', EnclosingPattern(left=''))], EnclosingPattern(left='{'),
+    )
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_binary_roundtrip(src_text: str, expected: Token):
+    data = binary.dumps(ParsingTask(src_text).parse())
+    parsed_tree = binary.loads(data)
+    assert parsed_tree == expected
+    assert repr(parsed_tree) == repr(ParsingTask(src_text).parse())
+
+
+@pytest.mark.parametrize(
+    ("mangle", "message"),
+    [
+        pytest.param(lambda data: b'XXXX' + data[4:], "not a binary", id="magic"),
+        pytest.param(lambda data: data[:4] + b'\xff' + data[5:], "unsupported", id="version"),
+        pytest.param(lambda data: data[:-1], "truncated", id="truncated"),
+        pytest.param(lambda data: data[:10], "truncated", id="header"),
+    ],
+)
+def test_binary_invalid(mangle, message: str):
+    data = binary.dumps(ParsingTask('@a{b}').parse())
+    with pytest.raises(ValueError, match=message):
+        binary.loads(mangle(data))
+
+
+def test_binary_column_widths():
+    flat_tree = ParsingTask('@a{b}').parse_flat()
+    data = binary.encode(flat_tree)
+    assert len(data) == 109
+    assert binary.HEADER.unpack_from(data)[-1] == b'BBBBBBBb'
+    decoded = binary.decode(data)
+    assert decoded == flat_tree
+    assert decoded.end_pos.itemsize == 1
+
+    flat_tree.start_pos[-1] += 2 ** 40
+    flat_tree.end_pos[-1] += 2 ** 16
+    data = binary.encode(flat_tree)
+    assert binary.HEADER.unpack_from(data)[-1] == b'BBQIBBBb'
+    assert binary.decode(data) == flat_tree
+    assert binary.narrowest_typecode(array('q', [-1, 2 ** 15])) == 'i'
+    with pytest.raises(OverflowError):
+        binary.narrowest_typecode([2 ** 64])
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    src_text = '@a[b]{c @d} e'
+    expected = ParsingTask(src_text).parse()
+
+    parse_cache = ParseCache(str(tmp_path))
+    assert parse_cache.parse(src_text) == expected
+    assert (parse_cache.hits, parse_cache.misses) == (0, 1)
+
+    def fail(self):
+        raise AssertionError("source text should not be parsed again")
+
+    monkeypatch.setattr(ParsingTask, 'parse', fail)
+    parse_cache = ParseCache(str(tmp_path))
+    assert repr(parse_cache.parse(src_text)) == repr(expected)
+    assert (parse_cache.hits, parse_cache.misses) == (1, 0)
+    assert parse_cache.get(src_text + ' ') is None
+    assert ParseCache.key(src_text) != ParseCache.key(src_text + ' ')
+
+    flat_tree = parse_cache.parse(src_text, flat=True)
+    assert isinstance(flat_tree, FlatTree)
+    assert repr(flat_tree.to_tree()) == repr(expected)
+    assert mapped.view_node(flat_tree, 0) == expected
+
+    parse_cache = ParseCache(str(tmp_path / 'flat'))
+    monkeypatch.undo()
+    assert parse_cache.parse(src_text, flat=True) == FlatTree.from_tree(expected)
+    assert repr(parse_cache.parse(src_text)) == repr(expected)
+    assert (parse_cache.hits, parse_cache.misses) == (1, 1)
+
+
+def _corrupt_strings(data: bytearray):
+    start, end = binary.read_layout(data).strings_range
+    data[start:end] = b'\xff' * (end - start)
+
+
+def _corrupt_child_starts(data: bytearray):
+    layout = binary.read_layout(data)
+    name, typecode, offset = layout.columns[binary.COLUMNS.index('child_starts')]
+    size = array(typecode).itemsize * layout.node_count
+    data[offset:offset + size] = b'\xff' * size
+
+
+def _corrupt_root_kind(data: bytearray):
+    layout = binary.read_layout(data)
+    offset = dict((name, offset) for name, _, offset in layout.columns)['kinds']
+    data[offset] = flat.KIND_TEXT
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        pytest.param(lambda data: data.__delitem__(slice(len(data) // 2, None)), id="truncated"),
+        pytest.param(_corrupt_strings, id="invalid-utf8"),
+        pytest.param(_corrupt_child_starts, id="invalid-index"),
+        pytest.param(_corrupt_root_kind, id="invalid-root"),
+    ],
+)
+def test_parse_cache_corrupted_entry(tmp_path, corrupt):
+    src_text = '@a[b]{c @d} e'
+    parse_cache = ParseCache(str(tmp_path))
+    parse_cache.parse(src_text)
+    path = parse_cache.path(src_text)
+    with open(path, 'rb') as fobj:
+        data = bytearray(fobj.read())
+    corrupt(data)
+    with open(path, 'wb') as fobj:
+        fobj.write(data)
+
+    assert parse_cache.get(src_text) is None
+    assert parse_cache.misses == 2
+    assert not os.path.exists(path)
+    assert repr(parse_cache.parse(src_text)) == repr(ParsingTask(src_text).parse())
+    assert repr(parse_cache.get(src_text)) == repr(ParsingTask(src_text).parse())
+
+    # Flat trees are checked without building the nodes
+    corrupt(data)
+    with open(path, 'wb') as fobj:
+        fobj.write(data)
+    assert parse_cache.get(src_text, flat=True) is None
+    assert not os.path.exists(path)
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, paxter.syntax, paxter.quickauthor; "
+        "print(sorted(set(sys.argv[1:]) & set(sys.modules))); "
+        "from paxter.syntax import ParseCache, MappedTree, FlatTree; "
+        "print(ParseCache.__module__, MappedTree.__module__, FlatTree.__module__)"
+    )
+    heavy_modules = [
+        'concurrent.futures.process', 'hashlib', 'mmap', 'multiprocessing',
+        'paxter.syntax.binary', 'paxter.syntax.cache', 'paxter.syntax.mapped',
+    ]
+    output = subprocess.run(
+        [sys.executable, '-c', code, *heavy_modules],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    assert output.splitlines() == [
+        '[]', 'paxter.syntax.cache paxter.syntax.mapped paxter.syntax.flat',
+    ]
+
+
+@pytest.mark.parametrize(("src_text", "expected"), PARSER_TESTS)
+def test_mapped_tree(tmp_path, src_text: str, expected: Token):
+    path = tmp_path / 'tree.pxtree'
+    with open(path, 'wb') as fobj:
+        binary.dump(ParsingTask(src_text).parse(), fobj)
+    with MappedTree.open(path) as mapped_tree:
+        root = mapped_tree.root
+        assert isinstance(root, FragmentSeq)
+        assert root == expected
+        assert expected == root
+        assert repr(root) == repr(ParsingTask(src_text).parse())
+        assert repr(mapped_tree.to_tree()) == repr(ParsingTask(src_text).parse())
+
+
+def test_mapped_tree_views(tmp_path):
+    path = tmp_path / 'tree.pxtree'
+    with open(path, 'wb') as fobj:
+        binary.dump(ParsingTask('x @a[b, 1.5]{c} @d"é"').parse(), fobj)
+    mapped_tree = MappedTree.open(path)
+    root = mapped_tree.root
+    command = root.children[1]
+    assert isinstance(command, mapped.CommandView) and isinstance(command, Command)
+    assert (command.start_pos, command.end_pos, command.phrase) == (3, 15, 'a')
+    assert isinstance(command.options, TokenSeq)
+    assert [type(token) for token in command.options.children] == [
+        mapped.IdentifierView, mapped.OperatorView, mapped.NumberView,
+    ]
+    assert command.options.children[2].value == 1.5
+    assert command.main_arg.children[0].inner == 'c'
+    assert root.children[3].main_arg.enclosing == EnclosingPattern(left='"')
+    assert root.children is root.children
+    assert root != FragmentSeq.without_pos([], GlobalEnclosingPattern())
+
+    mapped_tree.close()
+    mapped_tree.close()
+    with pytest.raises(ValueError):
+        mapped_tree.kinds[0]
+
+
+def test_mapped_tree_invalid(tmp_path):
+    path = tmp_path / 'tree.pxtree'
+    path.write_bytes(b'XXXX' + binary.dumps(ParsingTask('@a{b}').parse())[4:])
+    with pytest.raises(ValueError, match="not a binary"):
+        MappedTree.open(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many(tmp_path, workers: int):
+    src_texts = [param.values[0] for param in PARSER_TESTS]
+    path = tmp_path / 'doc.paxter'
+    path.write_text('@a{b}', encoding='utf-8')
+    parsed_trees = parse_many([*src_texts, path], workers=workers)
+    assert [repr(tree) for tree in parsed_trees] == [
+        *(repr(ParsingTask(src_text).parse()) for src_text in src_texts),
+        repr(ParsingTask('@a{b}').parse()),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_flat(workers: int):
+    src_texts = [param.values[0] for param in PARSER_TESTS]
+    flat_trees = parse_many(src_texts, workers=workers, flat=True)
+    for src_text, flat_tree in zip(src_texts, flat_trees):
+        assert isinstance(flat_tree, FlatTree)
+        assert flat_tree == ParsingTask(src_text).parse_flat()
+        assert repr(flat_tree.to_tree()) == repr(ParsingTask(src_text).parse())
+
+    results = parse_many(['@a{b}', 'x @y{'], workers=workers, return_exceptions=True, flat=True)
+    assert results[0] == ParsingTask('@a{b}').parse_flat()
+    assert isinstance(results[1], PaxterSyntaxError)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_errors(workers: int):
+    src_texts = ['@a{b}', 'x @y{', '@']
+    results = parse_many(src_texts, workers=workers, return_exceptions=True)
+    assert repr(results[0]) == repr(ParsingTask('@a{b}').parse())
+    for src_text, result in zip(src_texts[1:], results[1:]):
+        with pytest.raises(PaxterSyntaxError) as expected:
+            ParsingTask(src_text).parse()
+        assert isinstance(result, PaxterSyntaxError)
+        assert result.message == expected.value.message
+        assert result.positions == expected.value.positions
+
+    with pytest.raises(PaxterSyntaxError, match="right pattern '}'"):
+        parse_many(src_texts, workers=workers)